@@ -9,6 +9,57 @@ function getAuthHeader() {
   return token ? { 'Authorization': `Bearer ${token}` } : {};
 }
 
+// ============ 조건부 GET 헬퍼 ============
+// 주기적으로 다시 불러오는 화면용: 이전 응답의 ETag를 If-None-Match로 보내고,
+// 304(변경 없음)면 본문 없이 이전 응답 데이터(+ 다음 페이지 커서)를 그대로 사용
+const etagCache = new Map(); // url -> { etag, data, nextCursor }
+
+async function getPageWithETag(url) {
+  const cached = etagCache.get(url);
+  const res = await fetch(url, {
+    headers: cached ? { 'If-None-Match': cached.etag } : {},
+  });
+  if (res.status === 304 && cached) {
+    return { data: cached.data, nextCursor: cached.nextCursor };
+  }
+  const data = await res.json();
+  const etag = res.headers.get('ETag');
+  const nextCursor = res.headers.get('X-Next-Cursor');
+  if (res.ok && etag) {
+    etagCache.set(url, { etag, data, nextCursor });
+  } else {
+    etagCache.delete(url);
+  }
+  return { data, nextCursor };
+}
+
+async function getWithETag(url) {
+  return (await getPageWithETag(url)).data;
+}
+
+// 목록 전체: X-Next-Cursor 헤더가 없을 때까지 다음 페이지를 이어서 조회 (페이지마다 조건부 GET)
+async function getAllPagesWithETag(path, params = {}) {
+  const items = [];
+  let cursor = null;
+  do {
+    const { data, nextCursor } = await getPageWithETag(`${path}${listQuery({ ...params, cursor })}`);
+    if (!Array.isArray(data)) {
+      return data;
+    }
+    items.push(...data);
+    cursor = nextCursor;
+  } while (cursor);
+  return items;
+}
+
+// 목록 API 쿼리 (cursor, limit, order, fields)
+function listQuery(params = {}) {
+  const query = new URLSearchParams(
+    Object.entries(params).filter(([, value]) => value !== undefined && value !== null)
+  ).toString();
+  return query ? `?${query}` : '';
+}
+
 // ============ 인증 API ============
 
 // 회원가입
@@ -83,10 +134,9 @@ export function isLoggedIn() {
 
 // ============ 통계 API ============
 
-// 통계
+// 통계 (변경 없으면 304)
 export async function getStats() {
-  const res = await fetch(`${API_BASE}/stats`);
-  return res.json();
+  return getWithETag(`${API_BASE}/stats`);
 }
 
 // 매칭 참여
@@ -105,6 +155,28 @@ export async function getMatchStatus(matchRequestId, elapsedSeconds = 0) {
   return res.json();
 }
 
+// 매칭 상태 구독 (SSE) - 상태가 바뀔 때만 onStatus 호출, 구독 해제 함수 반환
+// EventSource를 쓸 수 없거나 연결이 끊기면 onError 호출 (폴링으로 대체)
+export function subscribeMatchStatus(matchRequestId, { onStatus, onError }) {
+  if (typeof EventSource === 'undefined') {
+    onError?.(new Error('EventSource not supported'));
+    return () => {};
+  }
+  const source = new EventSource(`${API_BASE}/match/stream?matchRequestId=${matchRequestId}`);
+  source.onmessage = (event) => {
+    const result = JSON.parse(event.data);
+    onStatus(result);
+    if (result.status !== 'waiting') {
+      source.close();
+    }
+  };
+  source.onerror = (err) => {
+    source.close();
+    onError?.(err);
+  };
+  return () => source.close();
+}
+
 // 매칭 취소
 export async function cancelMatch(matchRequestId) {
   const res = await fetch(`${API_BASE}/match/cancel`, {
@@ -117,8 +189,7 @@ export async function cancelMatch(matchRequestId) {
 
 // 현재 활성 상태 확인 (매칭 대기/방 참여/그룹 참여)
 export async function getActiveStatus(userId) {
-  const res = await fetch(`${API_BASE}/match/active/${userId}`);
-  return res.json();
+  return getWithETag(`${API_BASE}/match/active/${userId}`);
 }
 
 // 그룹 정보
@@ -127,22 +198,24 @@ export async function getGroup(groupId) {
   return res.json();
 }
 
-// 모든 그룹
-export async function getGroups() {
-  const res = await fetch(`${API_BASE}/groups`);
-  return res.json();
+// 그룹 목록 (params: cursor, limit, order, fields / 다음 페이지 커서는 X-Next-Cursor 헤더)
+export async function getGroups(params) {
+  return getWithETag(`${API_BASE}/groups${listQuery(params)}`);
 }
 
-// 점심방 목록
-export async function getRooms() {
-  const res = await fetch(`${API_BASE}/rooms`);
-  return res.json();
+// 점심방 목록 (params: cursor, limit, order, fields)
+export async function getRooms(params) {
+  return getWithETag(`${API_BASE}/rooms${listQuery(params)}`);
 }
 
-// 내 점심방 목록
+// 오늘 점심방 전체 (다음 페이지 커서를 끝까지 따라감, params: limit, order, fields)
+export async function getAllRooms(params) {
+  return getAllPagesWithETag(`${API_BASE}/rooms`, params);
+}
+
+// 내 점심방 목록 (변경 없으면 304)
 export async function getMyRooms(userId) {
-  const res = await fetch(`${API_BASE}/rooms/my/${userId}`);
-  return res.json();
+  return getWithETag(`${API_BASE}/rooms/my/${userId}`);
 }
 
 // 점심방 상세
@@ -26,8 +26,8 @@ export default function Dashboard() {
     try {
       const [statsData, groupsData, roomsData] = await Promise.all([
         getStats(),
-        getGroups(),
-        getRooms(),
+        getGroups({ limit: 5, order: 'desc', fields: 'id,menu,timeSlot,members.name' }),
+        getRooms({ limit: 5, order: 'desc', fields: 'id,menu,title,timeSlot,members.id,maxCount' }),
       ])
       setStats(statsData)
       setGroups(groupsData)
@@ -175,7 +175,7 @@ export default function Dashboard() {
           <p className="text-center text-gray-400 py-4">아직 완료된 매칭이 없어요</p>
         ) : (
           <div className="space-y-3">
-            {groups.slice(-5).reverse().map(group => {
+            {groups.map(group => {
               const menu = menuLabels[group.menu] || { name: group.menu, emoji: '🍽️' }
               return (
                 <div key={group.id} className="flex items-center gap-3 p-3 bg-gray-50 rounded-xl">
@@ -204,7 +204,7 @@ export default function Dashboard() {
           <p className="text-center text-gray-400 py-4">열려있는 방이 없어요</p>
         ) : (
           <div className="space-y-3">
-            {rooms.slice(0, 5).map(room => {
+            {rooms.map(room => {
               const menu = menuLabels[room.menu] || { name: room.menu, emoji: '🍽️' }
               return (
                 <div key={room.id} className="flex items-center gap-3 p-3 bg-gray-50 rounded-xl">
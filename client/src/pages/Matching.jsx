@@ -1,6 +1,6 @@
 import { useState, useEffect, useRef, useCallback } from 'react'
 import { useNavigate, useSearchParams, useLocation } from 'react-router-dom'
-import { getMatchStatus, cancelMatch } from '../api'
+import { getMatchStatus, subscribeMatchStatus, cancelMatch } from '../api'
 
 const menuLabels = {
   korean: '한식',
@@ -37,31 +37,37 @@ export default function Matching({ currentUser, refreshUser }) {
   const elapsedRef = useRef(0)
   const isMatchedRef = useRef(false)
 
-  // 매칭 상태 확인 함수
+  // 매칭 상태 반영 함수 (스트림/폴링 공통)
+  const handleStatus = useCallback((result) => {
+    if (isMatchedRef.current) return
+
+    if (result.status === 'matched') {
+      isMatchedRef.current = true
+      navigate(`/result?groupId=${result.groupId}`)
+    } else if (result.status === 'timeout') {
+      isMatchedRef.current = true
+      navigate('/fail', { state: { reason: 'timeout', formData } })
+    } else if (result.status === 'waiting') {
+      setWaitingCount(result.waitingCount ?? 1)  // 나 포함 전체 대기 인원
+      setRelaxationLevel(result.relaxationLevel || 0)
+      setRelaxationMessage(result.relaxationMessage)
+    } else if (result.status === 'not_found') {
+      isMatchedRef.current = true
+      navigate('/fail', { state: { reason: 'not_found', formData } })
+    }
+  }, [navigate, formData])
+
+  // 매칭 상태 확인 함수 (스트림 연결 실패 시 폴링용)
   const checkMatchStatus = useCallback(async () => {
     if (isMatchedRef.current) return
     
     try {
       const result = await getMatchStatus(matchRequestId, elapsedRef.current)
-      
-      if (result.status === 'matched') {
-        isMatchedRef.current = true
-        navigate(`/result?groupId=${result.groupId}`)
-      } else if (result.status === 'timeout') {
-        isMatchedRef.current = true
-        navigate('/fail', { state: { reason: 'timeout', formData } })
-      } else if (result.status === 'waiting') {
-        setWaitingCount(result.waitingCount ?? 1)  // 나 포함 전체 대기 인원
-        setRelaxationLevel(result.relaxationLevel || 0)
-        setRelaxationMessage(result.relaxationMessage)
-      } else if (result.status === 'not_found') {
-        isMatchedRef.current = true
-        navigate('/fail', { state: { reason: 'not_found', formData } })
-      }
+      handleStatus(result)
     } catch (err) {
       console.error('Poll error:', err)
     }
-  }, [matchRequestId, navigate, formData])
+  }, [matchRequestId, handleStatus])
 
   useEffect(() => {
     if (!matchRequestId) {
@@ -69,11 +75,16 @@ export default function Matching({ currentUser, refreshUser }) {
       return
     }
 
-    // 초기 상태 확인
-    checkMatchStatus()
-
-    // 상태 폴링 (2초마다)
-    const pollInterval = setInterval(checkMatchStatus, 2000)
+    // 상태 스트림 구독, 연결이 안 되면 폴링 (2초마다)으로 대체
+    let pollInterval = null
+    const unsubscribe = subscribeMatchStatus(matchRequestId, {
+      onStatus: handleStatus,
+      onError: () => {
+        if (isMatchedRef.current || pollInterval) return
+        checkMatchStatus()
+        pollInterval = setInterval(checkMatchStatus, 2000)
+      },
+    })
 
     // 경과 시간 카운터 (1초마다)
     const timerInterval = setInterval(() => {
@@ -89,10 +100,11 @@ export default function Matching({ currentUser, refreshUser }) {
     }, 1000)
 
     return () => {
+      unsubscribe()
       clearInterval(pollInterval)
       clearInterval(timerInterval)
     }
-  }, [matchRequestId, navigate, formData, checkMatchStatus])
+  }, [matchRequestId, navigate, formData, checkMatchStatus, handleStatus])
 
   const handleCancel = async () => {
     try {
@@ -1,6 +1,6 @@
 import { useState, useEffect } from 'react'
 import { Link, useNavigate } from 'react-router-dom'
-import { getRooms, joinRoom, getActiveStatus } from '../api'
+import { getAllRooms, joinRoom, getActiveStatus } from '../api'
 
 const menuLabels = {
   korean: { name: '한식', emoji: '🍚' },
@@ -176,7 +176,8 @@ export default function Rooms({ currentUser, refreshUser }) {
 
   async function fetchRooms() {
     try {
-      const data = await getRooms()
+      // /rooms는 한 페이지에 최대 500개라서 방이 많은 날에도 최근 방이 빠지지 않게 모든 페이지를 받음
+      const data = await getAllRooms({ limit: 500 })
       setRooms(data)
     } catch (err) {
       console.error('Rooms fetch error:', err)
@@ -0,0 +1,101 @@
+"""
+비동기 응답 캐시
+TTL + LRU + single-flight + stale-while-revalidate
+
+- TTL 안: 캐시 값 바로 반환 (hit)
+- TTL이 지났지만 stale 기간 안: 이전 값을 바로 반환하고 백그라운드에서 한 번만 갱신 (stale hit)
+- 그 외: 원본 조회 (miss). 같은 키를 동시에 조회하면 원본 호출은 하나만 하고 나머지는 결과를 기다림 (coalesced)
+원본 조회가 실패하면 캐시하지 않고, 기다리던 요청 모두에 같은 예외를 전달합니다.
+이벤트 루프 안에서만 사용합니다 (async 엔드포인트).
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class AsyncTTLCache:
+    """키 -> (값, 저장 시각) LRU 캐시"""
+
+    def __init__(self, max_entries: int, ttl_seconds: float, stale_seconds: float = 0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Task] = {}  # 진행 중인 원본 조회
+        self.counters = {
+            "hits": 0, "staleHits": 0, "misses": 0, "coalesced": 0,
+            "evictions": 0, "refreshes": 0, "errors": 0,
+        }
+
+    async def get_or_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """캐시 조회, 없거나 만료됐으면 fetch()로 원본 조회"""
+        entry = self._entries.get(key)
+        if entry is not None:
+            value, stored_at = entry
+            age = self._clock() - stored_at
+            if age < self.ttl_seconds:
+                self._entries.move_to_end(key)
+                self.counters["hits"] += 1
+                return value
+            if age < self.ttl_seconds + self.stale_seconds:
+                self._entries.move_to_end(key)
+                self.counters["staleHits"] += 1
+                if key not in self._inflight:
+                    # 갱신이 실패하면 기존 값을 stale 기간 동안 계속 사용
+                    self.counters["refreshes"] += 1
+                    self._start_fetch(key, fetch)
+                return value
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.counters["coalesced"] += 1
+        else:
+            self.counters["misses"] += 1
+            task = self._start_fetch(key, fetch)
+        # 먼저 온 요청이 취소(연결 끊김)되어도 원본 조회는 다른 요청을 위해 계속 진행
+        return await asyncio.shield(task)
+
+    def _start_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        """원본 조회 1회를 별도 task로 시작 (같은 키의 동시 요청은 이 결과를 공유)"""
+        task = asyncio.ensure_future(self._fetch(key, fetch))
+        self._inflight[key] = task
+        # 기다리는 요청이 없어도 "exception was never retrieved" 경고가 나지 않도록
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        return task
+
+    async def _fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            value = await fetch()
+        except Exception:
+            self.counters["errors"] += 1
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        self._store(key, value)
+        return value
+
+    def _store(self, key: Hashable, value: Any):
+        self._entries[key] = (value, self._clock())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.counters["evictions"] += 1
+
+    def clear(self):
+        """모든 캐시 항목 삭제 (카운터는 유지)"""
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        """카운터 + 현재 항목 수"""
+        lookups = self.counters["hits"] + self.counters["staleHits"] + self.counters["misses"] + self.counters["coalesced"]
+        served = lookups - self.counters["misses"]
+        return {
+            **self.counters,
+            "entries": len(self._entries),
+            "maxEntries": self.max_entries,
+            "inflight": len(self._inflight),
+            "hitRate": round(served / lookups, 4) if lookups else None,
+        }
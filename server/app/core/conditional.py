@@ -0,0 +1,36 @@
+"""
+조건부 GET (ETag / If-None-Match)
+주기적으로 다시 불러오는 화면(/rooms, /rooms/my, /stats, /match/active)은 대부분 이전 응답과 같으므로,
+저장소 버전으로 만든 ETag가 요청의 If-None-Match와 같으면 본문을 만들지 않고 304를 돌려줍니다.
+버전은 본문을 만들기 전에 읽어야 합니다 (그 사이 쓰기가 있어도 ETag가 본문보다 오래된 쪽이 되도록).
+"""
+from typing import Optional
+
+from fastapi import Request, Response
+
+# 캐시는 저장하되 매번 서버에 확인 (브라우저/프록시가 오래된 목록을 그대로 쓰지 않도록)
+CACHE_CONTROL = "no-cache"
+
+
+def make_etag(*parts) -> str:
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """요청의 If-None-Match에 현재 ETag가 있는지 (여러 개 / 약한 ETag / * 포함)"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tags = (tag.strip() for tag in if_none_match.split(","))
+    return any((tag[2:] if tag.startswith("W/") else tag) == etag for tag in tags)
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """If-None-Match가 현재 ETag와 같으면 304 응답, 아니면 응답에 ETag를 달고 None (본문을 만들어야 함)"""
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
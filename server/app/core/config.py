@@ -9,6 +9,34 @@ load_dotenv()
 
 # ============ 카카오 API 설정 ============
 KAKAO_REST_API_KEY = os.getenv("KAKAO_REST_API_KEY", "3b7c96af16eb7ae60cba8b77520d9044")
+KAKAO_LOCAL_SEARCH_URL = os.getenv("KAKAO_LOCAL_SEARCH_URL", "https://dapi.kakao.com/v2/local/search/keyword.json")
+KAKAO_CATEGORY_SEARCH_URL = os.getenv("KAKAO_CATEGORY_SEARCH_URL", "https://dapi.kakao.com/v2/local/search/category.json")
+
+# ============ 외부 API HTTP 클라이언트 설정 ============
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))  # 동시 연결 최대 수
+HTTP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", "10"))  # 유지할 idle 연결 수
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 30.0  # idle 연결 유지 시간
+HTTP_CONNECT_TIMEOUT_SECONDS = 3.0  # 연결(+ 풀 대기) 타임아웃
+HTTP_READ_TIMEOUT_SECONDS = 5.0  # 응답 읽기 타임아웃
+HTTP2_ENABLED = os.getenv("HTTP2_ENABLED", "true").lower() == "true"  # h2 설치 시 HTTP/2 사용
+
+# 주변 맛집 검색 캐시 (같은 geohash 격자 + 검색 조건이면 카카오 응답 재사용)
+NEARBY_CACHE_GEOHASH_PRECISION = 7  # 격자 크기 약 150m
+NEARBY_CACHE_TTL_SECONDS = 600  # 이 시간 동안은 캐시 값 그대로 사용
+NEARBY_CACHE_STALE_SECONDS = 3600  # TTL 이후 이 시간 동안은 이전 값 반환 + 백그라운드 갱신
+NEARBY_CACHE_MAX_ENTRIES = 1024  # LRU 최대 항목 수
+
+# 로컬 음식점 카탈로그 (회사 좌표 주변 FD6 크롤링 결과, 영역 안 검색은 카카오 호출 없이 처리)
+PLACE_CATALOG_PATH = os.getenv("PLACE_CATALOG_PATH", "data/fd6_catalog.json.gz")
+# 크롤링은 카카오 쿼터를 쓰므로 기본 꺼짐 (꺼져 있으면 디스크 파일만 로드)
+PLACE_CATALOG_CRAWL_ENABLED = os.getenv("PLACE_CATALOG_CRAWL_ENABLED", "false").lower() == "true"
+PLACE_CATALOG_RADIUS_METERS = 3000  # 크롤링 반경 (여의도 기본 좌표 기준)
+PLACE_CATALOG_REFRESH_HOURS = 24  # 재크롤링 주기
+PLACE_CATALOG_MAX_REQUESTS = 3000  # 크롤링 1회당 카카오 API 최대 호출 수 (쿼터 보호, 넘으면 다 끝난 영역까지만 저장)
+PLACE_CATALOG_RETRY_SECONDS = 300  # 크롤링 실패 시 첫 재시도 간격 (실패할 때마다 두 배)
+PLACE_CATALOG_RETRY_MAX_SECONDS = 6 * 3600  # 재시도 간격 상한
+PLACE_CATALOG_GRID_METERS = 200  # 공간 인덱스 격자 크기
+PLACE_CATALOG_GENERIC_KEYWORDS = ["맛집", "음식점", "식당"]  # 카탈로그 전체를 대상으로 하는 검색어
 
 # 여의도 기본 좌표
 YEOUIDO_LATITUDE = 37.530230
@@ -23,10 +51,54 @@ LEVEL_GROUPS = [
     ['deputy', 'general', 'director'],     # 차장, 부장, 이사
 ]
 
+# 데이터 저장소 설정
+DATA_STORE_BACKEND = os.getenv("DATA_STORE_BACKEND", "memory")  # "memory" | "sqlite"
+SQLITE_PATH = os.getenv("SQLITE_PATH", "lunchmate.db")  # sqlite 백엔드 DB 파일 경로
+PARTITION_RETENTION_DAYS = int(os.getenv("PARTITION_RETENTION_DAYS", "7"))  # 그룹/점심방 보관 일수 (오늘 포함)
+# 워커 프로세스 수 (uvicorn/gunicorn 기본값과 같은 변수)
+# 매칭 대기열/타이머/스케줄러가 프로세스 메모리에 있으므로 1보다 크면 시작하지 않습니다.
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+# 세션 설정
+SESSION_TTL_SECONDS = int(os.getenv("SESSION_TTL_SECONDS", str(7 * 24 * 3600)))  # 로그인 유지 기간
+SESSION_SWEEP_INTERVAL_SECONDS = 300  # 만료된 세션/폐기 목록 정리 주기
+# "opaque": 저장소 세션 (기본) | "signed": HMAC 서명 토큰 (저장소 조회 없이 검증, 로그아웃은 폐기 목록)
+SESSION_TOKEN_MODE = os.getenv("SESSION_TOKEN_MODE", "opaque")
+SESSION_SIGNING_SECRET = os.getenv("SESSION_SIGNING_SECRET", "")  # 워커끼리 같은 값 사용 (비어 있으면 프로세스별 임의 키)
+
+# 목록 API 페이지 크기 (/users, /groups, /rooms)
+LIST_DEFAULT_LIMIT = 100
+LIST_MAX_LIMIT = 500
+READ_VIEW_MAX_ENTRIES = 256  # 직렬화해 둔 GET 응답 보관 수 (URL 단위 LRU)
+
+# 운영 지표 (GET /metrics, Prometheus 텍스트 형식)
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+HTTP_LATENCY_BUCKETS_SECONDS = [0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10]
+MATCH_WAIT_BUCKETS_SECONDS = [1, 5, 15, 30, 60, 90, 120, 180, 240, 300]  # 참여 → 매칭 (최대 MATCHING_TIMEOUT_SECONDS)
+
+# 느린 요청 프로파일러 (샘플링 프로파일러, 요청별 collapsed stack 파일)
+PROFILER_ENABLED = os.getenv("PROFILER_ENABLED", "false").lower() == "true"
+PROFILER_SAMPLE_RATE = float(os.getenv("PROFILER_SAMPLE_RATE", "0.01"))  # 지연과 상관없이 프로파일을 남길 요청 비율
+PROFILER_SLOW_MS = float(os.getenv("PROFILER_SLOW_MS", "500"))  # 이보다 오래 걸린 요청은 모두 남김 (0이면 끔)
+PROFILER_INTERVAL_MS = float(os.getenv("PROFILER_INTERVAL_MS", "5"))  # 스택 샘플링 주기
+PROFILER_DIR = os.getenv("PROFILER_DIR", "profiles")
+PROFILER_MAX_FILES = int(os.getenv("PROFILER_MAX_FILES", "200"))  # 보관할 최근 프로파일 파일 수
+PROFILER_EXCLUDE_PATHS = {"/match/stream", "/metrics"}  # 오래 열려 있는 스트림 / 수집용 요청
+
 # 매칭 설정
 MATCHING_TIMEOUT_SECONDS = 300  # 5분
 RELAXATION_INTERVAL_SECONDS = 60  # 1분마다 조건 완화
+MAX_RELAXATION_LEVEL = 3  # 성별 → 나이 → 직급 순으로 최대 3단계
+EXPIRED_REQUESTS_MAX = 10000  # 타임아웃 결과를 기억해둘 최대 요청 수
 MAX_GROUP_SIZE = 4
+SIMILAR_AGE_RANGE = 5  # 나이 조건: ±5세
+
+# 매칭 스케줄러 설정
+MATCHING_TICK_SECONDS = 1.0  # 완화 타이머가 없을 때 최대 대기 주기
+MATCHING_PASS_BUDGET_MS = 50  # 1회전 최대 수행 시간 (초과 시 다음 tick에 이어서)
+BATCH_MATCHING_ENABLED = True  # 스케줄러에서 버킷 단위 배치 매칭 사용 (False면 요청별 greedy)
+BATCH_MATCHING_MAX_REQUESTS = 500  # 버킷 1회 배치 매칭에 넣을 최대 요청 수 (1회전 예산 안에 끝나는 크기)
+MATCH_STREAM_KEEPALIVE_SECONDS = 15  # 매칭 상태 스트림 keepalive 주기
 
 # 샘플 식당 데이터
 RESTAURANTS = [
@@ -44,3 +116,7 @@ RESTAURANTS = [
     {"id": "r12", "name": "파스타앤코", "type": "western", "price": "high", "distance": 9, "rating": 4.5},
 ]
 
+# 식당 추천 가중치: rating ** EXPONENT * 0.5 ** (distance / HALF_MINUTES)
+RESTAURANT_RATING_EXPONENT = 2.0
+RESTAURANT_DISTANCE_HALF_MINUTES = 10  # 도보 거리(분)가 이만큼 늘면 가중치 절반
+
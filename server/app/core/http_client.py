@@ -0,0 +1,68 @@
+"""
+공용 HTTP 클라이언트
+외부 API(카카오 로컬 검색) 호출용 httpx.AsyncClient 하나를 앱 전체에서 재사용합니다.
+요청마다 클라이언트를 만들면 매번 TCP/TLS 연결을 새로 맺으므로,
+FastAPI lifespan에서 한 번 만들고 keep-alive 연결 풀을 공유합니다.
+"""
+from typing import Optional
+
+import httpx
+
+from .config import (
+    HTTP_MAX_CONNECTIONS, HTTP_MAX_KEEPALIVE_CONNECTIONS, HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    HTTP_CONNECT_TIMEOUT_SECONDS, HTTP_READ_TIMEOUT_SECONDS, HTTP2_ENABLED,
+)
+
+try:
+    import h2  # noqa: F401  (httpx[http2] 설치 시 HTTP/2 사용)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class SharedHttpClient:
+    """lifespan에서 start/close 하는 httpx.AsyncClient 보관자"""
+
+    def __init__(self):
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @staticmethod
+    def create_client(**overrides) -> httpx.AsyncClient:
+        """설정값(연결 풀 크기, 타임아웃, HTTP/2)으로 클라이언트 생성 (overrides: httpx.AsyncClient 인자)"""
+        options = dict(
+            http2=HTTP2_ENABLED and HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_connections=HTTP_MAX_CONNECTIONS,
+                max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+            ),
+            timeout=httpx.Timeout(
+                connect=HTTP_CONNECT_TIMEOUT_SECONDS,
+                read=HTTP_READ_TIMEOUT_SECONDS,
+                write=HTTP_READ_TIMEOUT_SECONDS,
+                pool=HTTP_CONNECT_TIMEOUT_SECONDS,
+            ),
+        )
+        return httpx.AsyncClient(**{**options, **overrides})
+
+    def start(self):
+        """클라이언트 생성 (앱 시작 시)"""
+        if self._client is None:
+            self._client = self.create_client()
+
+    async def close(self):
+        """연결 풀 정리 (앱 종료 시)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """공용 클라이언트 (lifespan 밖에서 호출되면 그때 생성)"""
+        if self._client is None:
+            self.start()
+        return self._client
+
+
+# 싱글톤 인스턴스
+http_client = SharedHttpClient()
@@ -0,0 +1,40 @@
+"""
+키별 잠금
+버킷/점심방/유저 단위로만 직렬화하기 위한 잠금 모음
+"""
+import threading
+from contextlib import contextmanager
+from typing import Dict, Hashable, List
+
+
+class KeyedLocks:
+    """
+    키 -> threading.Lock
+    hold(key) 동안만 잠금을 유지하고, 아무도 쓰지 않는 키의 잠금은 정리합니다.
+    """
+
+    def __init__(self):
+        self._guard = threading.Lock()
+        self._locks: Dict[Hashable, List] = {}  # key -> [lock, 사용 중인 스레드 수]
+
+    @contextmanager
+    def hold(self, key: Hashable):
+        with self._guard:
+            entry = self._locks.get(key)
+            if entry is None:
+                entry = self._locks[key] = [threading.Lock(), 0]
+            entry[1] += 1
+        try:
+            with entry[0]:
+                yield
+        finally:
+            with self._guard:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._locks[key]
+
+
+# 잠금 순서: user → bucket 또는 user → room (bucket과 room은 동시에 잡지 않음)
+user_locks = KeyedLocks()
+bucket_locks = KeyedLocks()
+room_locks = KeyedLocks()
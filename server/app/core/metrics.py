@@ -0,0 +1,261 @@
+"""
+운영 지표 (Prometheus 텍스트 형식)
+외부 라이브러리/수집 서버 없이 프로세스 안에 카운터/게이지/히스토그램을 모아 두고
+GET /metrics에서 Prometheus text exposition format(0.0.4)으로 내보냅니다.
+- 요청 지연: 순수 ASGI 미들웨어가 (method, 라우트 템플릿, 상태 코드)별 히스토그램에 기록
+  (경로 파라미터가 들어간 실제 URL 대신 "/rooms/{room_id}" 같은 템플릿을 써서 시계열 수가 늘지 않음)
+- 매칭: 참여 → 매칭까지 걸린 시간(매칭 시점 완화 단계별), 그룹 크기 분포, 참여/타임아웃 수
+- 대기열 깊이/스레드풀 사용량은 조회 시점에 채움 (routers/metrics.py)
+지표는 워커 프로세스별 값입니다.
+"""
+import threading
+import time
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from .config import HTTP_LATENCY_BUCKETS_SECONDS, MATCH_WAIT_BUCKETS_SECONDS, MAX_GROUP_SIZE
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class _Metric:
+    """라벨 값 튜플 -> 값, 이름/설명/라벨 이름 공통"""
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+
+    def render(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """증가만 하는 값"""
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def total(self) -> float:
+        with self._lock:
+            return sum(self._values.values())
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self._header() + [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}" for labels, value in items
+        ]
+
+
+class Gauge(_Metric):
+    """현재 값 (조회 시점에 통째로 바꾸는 값은 replace)"""
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, *labels: str):
+        with self._lock:
+            self._values[labels] = value
+
+    def inc(self, *labels: str, amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, *labels: str, amount: float = 1):
+        self.inc(*labels, amount=-amount)
+
+    def replace(self, values: Dict[LabelValues, float]):
+        """전체 시계열 교체 (사라진 라벨 조합은 내보내지 않음)"""
+        with self._lock:
+            self._values = dict(values)
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return self._header() + [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}" for labels, value in items
+        ]
+
+
+class Histogram(_Metric):
+    """
+    구간별 관측 수 + 합계
+    관측 시에는 구간별(비누적) 개수만 올리고, 누적(le) 값은 내보낼 때 계산합니다.
+    """
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Iterable[float] = HTTP_LATENCY_BUCKETS_SECONDS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(float(b) for b in buckets))
+        # 라벨 값 -> [구간별 개수 (마지막은 +Inf), 합계]
+        self._series: Dict[LabelValues, list] = {}
+
+    def observe(self, value: float, *labels: str):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def count(self, *labels: str) -> int:
+        series = self._series.get(labels)
+        return sum(series[0]) if series else 0
+
+    def total_count(self) -> int:
+        with self._lock:
+            return sum(sum(counts) for counts, _ in self._series.values())
+
+    def render(self) -> List[str]:
+        with self._lock:
+            items = sorted((labels, (list(counts), total)) for labels, (counts, total) in self._series.items())
+        lines = self._header()
+        bounds = [_format_value(b) for b in self.buckets] + ["+Inf"]
+        for labels, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                le = 'le="' + bound + '"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(total)}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """등록 순서대로 지표를 텍스트 형식으로 출력"""
+
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+# HTTP
+http_requests_in_flight = registry.register(Gauge(
+    "lunchmate_http_requests_in_flight", "HTTP requests currently being handled",
+))
+http_request_duration = registry.register(Histogram(
+    "lunchmate_http_request_duration_seconds", "HTTP request latency by route template and status",
+    ("method", "route", "status"), HTTP_LATENCY_BUCKETS_SECONDS,
+))
+
+# 스레드풀 (동기 핸들러를 실행하는 anyio 기본 스레드 제한)
+threadpool_busy = registry.register(Gauge(
+    "lunchmate_threadpool_busy_threads", "Worker threads currently running sync handlers",
+))
+threadpool_size = registry.register(Gauge(
+    "lunchmate_threadpool_max_threads", "Worker thread limit for sync handlers",
+))
+threadpool_waiting = registry.register(Gauge(
+    "lunchmate_threadpool_waiting_tasks", "Sync handlers waiting for a free worker thread",
+))
+
+# 매칭
+waiting_queue_depth = registry.register(Gauge(
+    "lunchmate_waiting_queue_depth", "Waiting match requests per bucket",
+    ("time_slot", "price_range", "menu"),
+))
+match_joins = registry.register(Counter(
+    "lunchmate_match_joins_total", "Match requests joined, by immediate outcome", ("outcome",),
+))
+match_wait = registry.register(Histogram(
+    "lunchmate_match_wait_seconds", "Time from join to matched, by the member's relaxation level at match time",
+    ("relaxation_level",), MATCH_WAIT_BUCKETS_SECONDS,
+))
+match_group_size = registry.register(Histogram(
+    "lunchmate_match_group_size", "Members per matched group", (), range(2, MAX_GROUP_SIZE + 1),
+))
+match_timeouts = registry.register(Counter(
+    "lunchmate_match_timeouts_total", "Match requests removed from the queue by timeout",
+))
+match_timeout_ratio = registry.register(Gauge(
+    "lunchmate_match_timeout_ratio", "Timed out / (timed out + matched) match requests since start",
+))
+
+
+class MetricsMiddleware:
+    """
+    요청 수/지연 기록용 순수 ASGI 미들웨어
+    BaseHTTPMiddleware와 달리 요청/응답을 감싸지 않고 send만 가로채서 상태 코드를 읽습니다.
+    라우터가 scope["route"]에 매칭된 라우트를 남기므로 끝난 뒤 템플릿 경로로 기록하고,
+    매칭되지 않은 요청(404 등)은 "unmatched" 하나로 모읍니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500  # 응답 시작 전에 예외가 나면 500으로 기록
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - start
+            http_requests_in_flight.dec()
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            http_request_duration.observe(elapsed, scope["method"], route, str(status))
@@ -0,0 +1,76 @@
+"""
+목록 API 커서 페이지네이션 + 필드 선택
+- 응답 본문은 기존처럼 배열이고, 다음 페이지가 있으면 X-Next-Cursor 헤더에 커서를 담습니다.
+- 커서는 마지막 항목의 정렬 키 (createdAt, id)를 base64url로 감싼 불투명 문자열입니다.
+- fields=id,title,members.name 처럼 필요한 필드만 받을 수 있습니다 (점(.)으로 하위 필드).
+"""
+import base64
+import json
+from typing import List, Optional
+
+from fastapi import HTTPException, Response
+
+from .config import LIST_DEFAULT_LIMIT, LIST_MAX_LIMIT
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(key: tuple) -> str:
+    return base64.urlsafe_b64encode(json.dumps(list(key), separators=(",", ":")).encode()).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[tuple]:
+    """커서 -> 정렬 키 (잘못된 커서는 400)"""
+    if not cursor:
+        return None
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError:
+        key = None
+    if not isinstance(key, list) or len(key) != 2 or not all(isinstance(part, str) for part in key):
+        raise HTTPException(status_code=400, detail="잘못된 cursor입니다")
+    return tuple(key)
+
+
+def clamp_limit(limit: Optional[int]) -> int:
+    """페이지 크기 (기본 LIST_DEFAULT_LIMIT, 최대 LIST_MAX_LIMIT)"""
+    return max(1, min(limit or LIST_DEFAULT_LIMIT, LIST_MAX_LIMIT))
+
+
+def parse_order(order: str) -> bool:
+    """정렬 방향 -> descending 여부"""
+    if order not in ("asc", "desc"):
+        raise HTTPException(status_code=400, detail="order는 asc 또는 desc입니다")
+    return order == "desc"
+
+
+def parse_fields(fields: Optional[str]) -> Optional[dict]:
+    """"id,members.name" -> {"id": {}, "members": {"name": {}}} (없으면 None = 전체 필드)"""
+    if not fields:
+        return None
+    tree: dict = {}
+    for path in fields.split(","):
+        node = tree
+        for part in path.strip().split("."):
+            if part:
+                node = node.setdefault(part, {})
+    return tree or None
+
+
+def project(value, tree: Optional[dict]):
+    """필드 트리에 있는 필드만 남긴 복사본 (리스트는 원소마다 적용)"""
+    if not tree:
+        return value
+    if isinstance(value, list):
+        return [project(item, tree) for item in value]
+    if isinstance(value, dict):
+        return {name: project(value[name], subtree) for name, subtree in tree.items() if name in value}
+    return value
+
+
+def page_response(response: Response, records: List[dict], has_more: bool, key_of, fields: Optional[str]) -> List[dict]:
+    """한 페이지 응답: 다음 페이지 커서 헤더 + 필드 선택"""
+    if has_more and records:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(key_of(records[-1]))
+    tree = parse_fields(fields)
+    return [project(record, tree) for record in records] if tree else records
@@ -0,0 +1,316 @@
+"""
+느린 요청 프로파일러 (opt-in, PROFILER_ENABLED)
+샘플링 프로파일러: 백그라운드 스레드 하나가 PROFILER_INTERVAL_MS마다 sys._current_frames()로
+처리 중인 요청의 스택만 읽어서 세어 둡니다 (요청 코드에 훅을 걸지 않음).
+- 프로파일 대상: PROFILER_SAMPLE_RATE 비율로 뽑힌 요청 + PROFILER_SLOW_MS를 넘긴 모든 요청
+  (느린지는 끝나야 알 수 있으므로 임계값을 쓰면 처리 중인 요청은 모두 샘플링하고, 끝난 뒤 남길지 결정)
+- 스택 귀속: async 핸들러는 이벤트 루프 스레드의 현재 task가 그 요청의 task일 때,
+  동기 핸들러는 anyio 워커 스레드가 실행 중인 context에 이 요청의 세션이 있을 때만 그 요청 것으로 셉니다.
+  어느 스레드에서도 실행 중이 아니면 "(waiting)"으로 셉니다 (I/O 대기, 스레드풀 빈자리 대기 등).
+- 출력: PROFILER_DIR에 collapsed stack 파일 (flamegraph.pl / speedscope 입력 형식) 한 요청당 하나,
+  파일 이름에 시각/프로세스/사유/지연/라우트/matchRequestId를 넣고 최근 PROFILER_MAX_FILES개만 보관
+파일 쓰기도 샘플러 스레드에서 하므로 이벤트 루프는 세션 등록/해제만 합니다.
+"""
+import asyncio
+import contextvars
+import os
+import queue
+import random
+import re
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Optional
+
+from .config import (
+    PROFILER_SAMPLE_RATE, PROFILER_SLOW_MS, PROFILER_INTERVAL_MS,
+    PROFILER_DIR, PROFILER_MAX_FILES, PROFILER_EXCLUDE_PATHS,
+)
+
+try:
+    from anyio._backends._asyncio import WorkerThread as _AnyioWorkerThread
+    _WORKER_RUN_CODE = _AnyioWorkerThread.run.__code__
+except (ImportError, AttributeError):  # anyio 내부 구조가 다르면 동기 핸들러 스택은 "(waiting)"으로만 기록
+    _WORKER_RUN_CODE = None
+
+PROFILE_SUFFIX = ".collapsed"
+WAITING_FRAME = "(waiting)"
+
+# 동기 핸들러는 이 context를 복사해서 워커 스레드에서 실행되므로 워커 쪽에서도 세션을 찾을 수 있음
+_current_session: contextvars.ContextVar[Optional["ProfileSession"]] = contextvars.ContextVar(
+    "profile_session", default=None
+)
+
+
+def _short_path(filename: str) -> str:
+    """설치된 패키지는 site-packages 아래 경로, 앱 코드는 작업 디렉터리 기준 경로"""
+    _, marker, rest = filename.rpartition("site-packages" + os.sep)
+    if marker:
+        return rest
+    try:
+        relative = os.path.relpath(filename)
+    except ValueError:
+        return filename
+    return os.path.basename(filename) if relative.startswith("..") else relative
+
+
+def _slug(value: str) -> str:
+    return re.sub(r"[^A-Za-z0-9._-]+", "-", value).strip("-")[:80] or "-"
+
+
+class ProfileSession:
+    """요청 하나의 샘플 (스택 -> 횟수)과 파일 이름에 쓸 정보"""
+
+    __slots__ = ("method", "path", "route", "match_request_id", "sampled", "started",
+                 "duration_ms", "thread_id", "loop", "task", "samples")
+
+    def __init__(self, method: str, path: str, sampled: bool):
+        self.method = method
+        self.path = path
+        self.route: Optional[str] = None
+        self.match_request_id: Optional[str] = None
+        self.sampled = sampled
+        self.started = time.time()
+        self.duration_ms = 0.0
+        self.thread_id = threading.get_ident()
+        self.loop = asyncio.get_running_loop()
+        self.task = asyncio.current_task()
+        self.samples: Optional[Dict[tuple, int]] = None  # (스레드 구분, code 객체 튜플) -> 샘플 수, 샘플러가 채움
+
+    def file_name(self, reason: str) -> str:
+        stamp = datetime.fromtimestamp(self.started).strftime("%Y%m%d-%H%M%S.%f")[:-3]
+        return "_".join([
+            stamp, str(os.getpid()), reason, f"{self.duration_ms:.0f}ms", self.method,
+            _slug(self.route or self.path), _slug(self.match_request_id or "-"),
+        ]) + PROFILE_SUFFIX
+
+
+class RequestProfiler:
+    """
+    세션 등록/해제 (미들웨어) + 샘플러 스레드 (샘플링, 파일 쓰기, 오래된 파일 정리)
+    샘플러는 처리 중인 세션이 있을 때만 깨어 있습니다.
+    """
+
+    def __init__(self, directory: str = PROFILER_DIR, sample_rate: float = PROFILER_SAMPLE_RATE,
+                 slow_ms: float = PROFILER_SLOW_MS, interval_ms: float = PROFILER_INTERVAL_MS,
+                 max_files: int = PROFILER_MAX_FILES):
+        self.directory = directory
+        self.sample_rate = sample_rate
+        self.slow_ms = slow_ms
+        self.interval = interval_ms / 1000
+        self.max_files = max_files
+        self._active: Dict[int, ProfileSession] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._writes: "queue.SimpleQueue[tuple]" = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+        self._stopping = False
+        self._frame_names: Dict[object, str] = {}
+        self.written = 0
+
+    # ----- 요청 쪽 (이벤트 루프) -----
+
+    def begin(self, method: str, path: str) -> Optional[ProfileSession]:
+        """프로파일 대상이면 세션 등록, 아니면 None"""
+        sampled = random.random() < self.sample_rate
+        if not sampled and self.slow_ms <= 0:
+            return None
+        session = ProfileSession(method, path, sampled)
+        with self._lock:
+            self._active[id(session)] = session
+        _current_session.set(session)
+        if not self._wake.is_set():
+            self._wake.set()
+        return session
+
+    def end(self, session: ProfileSession, route: Optional[str]):
+        """세션 해제, 느렸거나 뽑힌 요청이면 파일 쓰기 예약"""
+        session.duration_ms = (time.time() - session.started) * 1000
+        session.route = route
+        with self._lock:
+            self._active.pop(id(session), None)
+        if self.slow_ms > 0 and session.duration_ms >= self.slow_ms:
+            reason = "slow"
+        elif session.sampled:
+            reason = "sampled"
+        else:
+            return
+        self._writes.put((session, reason))
+        self._wake.set()
+
+    # ----- 샘플러 스레드 -----
+
+    def _frame_name(self, code) -> str:
+        name = self._frame_names.get(code)
+        if name is None:
+            name = self._frame_names[code] = f"{code.co_qualname} ({_short_path(code.co_filename)})".replace(";", ":")
+        return name
+
+    def sample(self):
+        """처리 중인 세션마다 현재 스택 1개씩 기록"""
+        with self._lock:
+            sessions = list(self._active.values())
+        if not sessions:
+            return
+        frames = sys._current_frames()
+        counted = set()
+
+        # async 핸들러: 이벤트 루프 스레드에서 지금 실행 중인 task의 세션
+        loops = {(s.loop, s.thread_id) for s in sessions}
+        by_task = {s.task: s for s in sessions}
+        for loop, thread_id in loops:
+            try:
+                task = asyncio.current_task(loop)
+            except RuntimeError:
+                continue
+            session = by_task.get(task)
+            frame = frames.get(thread_id)
+            if session is not None and frame is not None:
+                self._record(session, ("loop", self._stack(frame, stop=_MIDDLEWARE_CALL_CODE)))
+                counted.add(id(session))
+
+        # 동기 핸들러: 워커 스레드가 실행 중인 context의 세션
+        if _WORKER_RUN_CODE is not None:
+            loop_threads = {thread_id for _, thread_id in loops}
+            me = threading.get_ident()
+            for thread_id, frame in frames.items():
+                if thread_id == me or thread_id in loop_threads:
+                    continue
+                session, stack = self._worker_session(frame)
+                if session is not None and id(session) not in counted and id(session) in self._active:
+                    self._record(session, ("worker", stack))
+                    counted.add(id(session))
+
+        for session in sessions:
+            if id(session) not in counted:
+                self._record(session, (WAITING_FRAME, ()))
+
+    @staticmethod
+    def _record(session: ProfileSession, key: tuple):
+        if session.samples is None:
+            session.samples = {}
+        session.samples[key] = session.samples.get(key, 0) + 1
+
+    @staticmethod
+    def _stack(frame, stop=None) -> tuple:
+        """바깥 → 안쪽 순서 code 튜플 (stop 코드 프레임이 있으면 그 안쪽만)"""
+        codes = []
+        while frame is not None and frame.f_code is not stop:
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        codes.reverse()
+        return tuple(codes)
+
+    @staticmethod
+    def _worker_session(frame):
+        """워커 스레드 스택에서 anyio WorkerThread.run 프레임을 찾아 실행 중인 context의 세션"""
+        codes = []
+        while frame is not None:
+            if frame.f_code is _WORKER_RUN_CODE:
+                context = frame.f_locals.get("context")
+                if context is None:  # 다음 작업 대기 중
+                    return None, ()
+                codes.reverse()
+                return context.get(_current_session), tuple(codes)
+            codes.append(frame.f_code)
+            frame = frame.f_back
+        return None, ()
+
+    def write(self, session: ProfileSession, reason: str) -> Optional[str]:
+        """collapsed stack 파일 쓰기 + 오래된 파일 정리"""
+        if not session.samples:
+            return None
+        lines = []
+        for (thread, codes), count in session.samples.items():
+            names = [thread] + [self._frame_name(code) for code in codes]
+            lines.append(f"{';'.join(names)} {count}")
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, session.file_name(reason))
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+        self.written += 1
+        self._prune()
+        return path
+
+    def _prune(self):
+        """최근 max_files개만 남김 (파일 이름이 시각으로 시작하므로 이름 순 = 시간 순, 워커 프로세스 공용)"""
+        files = sorted(name for name in os.listdir(self.directory) if name.endswith(PROFILE_SUFFIX))
+        for name in files[:max(len(files) - self.max_files, 0)]:
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+
+    def _drain_writes(self):
+        while True:
+            try:
+                session, reason = self._writes.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                self.write(session, reason)
+            except OSError as e:
+                print(f"⚠️ 프로파일 저장 실패: {e}")
+
+    def _run(self):
+        while not self._stopping:
+            self._drain_writes()
+            if not self._active:
+                self._wake.clear()
+                if not self._active and self._writes.empty():
+                    self._wake.wait()
+                continue
+            self.sample()
+            time.sleep(self.interval)
+        self._drain_writes()
+
+    def start(self):
+        """샘플러 스레드 시작"""
+        if self._thread is None:
+            self._stopping = False
+            self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """샘플러 스레드 종료 (남은 파일 쓰기 후)"""
+        if self._thread is not None:
+            self._stopping = True
+            self._wake.set()
+            self._thread.join()
+            self._thread = None
+
+
+def tag_match_request(match_request_id: Optional[str]):
+    """처리 중인 요청의 프로파일 파일 이름에 matchRequestId 기록 (프로파일 대상이 아니면 무시)"""
+    session = _current_session.get()
+    if session is not None and match_request_id:
+        session.match_request_id = match_request_id
+
+
+class ProfilerMiddleware:
+    """요청마다 프로파일 세션 등록/해제하는 순수 ASGI 미들웨어 (PROFILER_EXCLUDE_PATHS 제외)"""
+
+    def __init__(self, app, profiler: Optional[RequestProfiler] = None):
+        self.app = app
+        self.profiler = profiler or request_profiler
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in PROFILER_EXCLUDE_PATHS:
+            await self.app(scope, receive, send)
+            return
+        session = self.profiler.begin(scope["method"], scope["path"])
+        if session is None:
+            await self.app(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.profiler.end(session, getattr(scope.get("route"), "path", None))
+
+
+# 루프 스레드 스택은 이 미들웨어 안쪽 프레임만 기록
+_MIDDLEWARE_CALL_CODE = ProfilerMiddleware.__call__.__code__
+
+# 싱글톤 인스턴스 (PROFILER_ENABLED일 때만 미들웨어로 등록되고 lifespan에서 시작)
+request_profiler = RequestProfiler()
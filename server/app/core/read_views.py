@@ -0,0 +1,86 @@
+"""
+직렬화해 둔 읽기 응답 (materialized view)
+자주 불리는 목록/통계 GET(/rooms, /groups, /stats, /restaurants)은 데이터가 바뀌지 않았으면 매번 같은 JSON을 만듭니다.
+URL별로 (ETag, 인코딩된 본문, 헤더)를 보관하고, 저장소 버전으로 만든 ETag가 같으면
+레코드 조회/필드 선택/JSON 인코딩 없이 bytes를 그대로 응답합니다.
+라우터는 data_store.read_snapshot() 안에서 버전을 읽고 respond를 호출하므로
+보관한 본문은 키(ETag)의 버전과 같은 시점의 데이터입니다 (SQLite는 DB의 versions 테이블 기준).
+쓰기로 버전이 바뀌면 다음 조회에서 한 번만 다시 만듭니다 (URL 수는 LRU로 제한).
+JSON 인코딩은 orjson이 있으면 orjson, 없으면 표준 json (FastAPI 기본 응답과 같은 형식).
+"""
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Tuple
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+from .config import READ_VIEW_MAX_ENTRIES
+from .conditional import CACHE_CONTROL, etag_matches
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+JSON_MEDIA_TYPE = "application/json"
+
+
+def dumps(value: Any) -> bytes:
+    """JSON bytes (공백 없음, UTF-8 그대로)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, default=jsonable_encoder)
+    return json.dumps(value, ensure_ascii=False, allow_nan=False, separators=(",", ":"),
+                      default=jsonable_encoder).encode("utf-8")
+
+
+class ReadViews:
+    """URL -> (ETag, 본문 bytes, 헤더) LRU"""
+
+    def __init__(self, max_entries: int = READ_VIEW_MAX_ENTRIES):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, bytes, Dict[str, str]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.builds = 0
+
+    def respond(self, request: Request, etag: str, build: Callable[[Response], Any]) -> Response:
+        """
+        조건부 GET + 직렬화 응답
+        etag: 본문을 만들기 전에 읽은 저장소 버전으로 만든 값
+        build(response): 응답 데이터 생성 (response에 헤더를 달 수 있음, 예: X-Next-Cursor)
+        """
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+        key = f"{request.url.path}?{request.url.query}"
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == etag:
+                self._entries.move_to_end(key)
+                self.hits += 1
+        if entry is None or entry[0] != etag:
+            scratch = Response()
+            body = dumps(build(scratch))
+            headers = {
+                name: value for name, value in scratch.headers.items()
+                if name not in ("content-length", "content-type")
+            }
+            headers.update({"ETag": etag, "Cache-Control": CACHE_CONTROL})
+            entry = (etag, body, headers)
+            with self._lock:
+                self.builds += 1
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+        return Response(content=entry[1], media_type=JSON_MEDIA_TYPE, headers=entry[2])
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# 싱글톤 인스턴스
+read_views = ReadViews()
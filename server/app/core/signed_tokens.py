@@ -0,0 +1,61 @@
+"""
+서명된 세션 토큰 (SESSION_TOKEN_MODE = "signed")
+토큰 자체에 유저 ID/발급 시각/만료 시각을 담고 HMAC-SHA256으로 서명해서,
+저장소의 세션 조회 없이 검증합니다 (여러 워커가 같은 SESSION_SIGNING_SECRET을 쓰면 어느 워커에서나 검증 가능).
+형식: base64url(JSON payload) + "." + base64url(서명)
+"""
+import base64
+import hashlib
+import hmac
+import json
+import secrets
+import time
+from typing import Optional
+
+from .config import SESSION_SIGNING_SECRET, SESSION_TTL_SECONDS
+
+if SESSION_SIGNING_SECRET:
+    _secret = SESSION_SIGNING_SECRET.encode()
+else:
+    # 설정이 없으면 프로세스마다 임의 키 (재시작하면 기존 토큰 무효, 워커 간 공유 안 됨)
+    _secret = secrets.token_bytes(32)
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _b64decode(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def _sign(payload: str) -> str:
+    return _b64encode(hmac.new(_secret, payload.encode(), hashlib.sha256).digest())
+
+
+def issue_signed_token(user_id: str, issued_at: Optional[float] = None,
+                       ttl_seconds: float = SESSION_TTL_SECONDS) -> str:
+    """유저 ID로 서명된 토큰 발급"""
+    issued_at = time.time() if issued_at is None else issued_at
+    payload = _b64encode(json.dumps({
+        "sub": user_id,
+        "iat": issued_at,
+        "exp": issued_at + ttl_seconds,
+        "jti": secrets.token_urlsafe(12),
+    }, separators=(",", ":")).encode())
+    return f"{payload}.{_sign(payload)}"
+
+
+def verify_signed_token(token: str, now: Optional[float] = None) -> Optional[dict]:
+    """서명과 만료 시각 확인 후 payload(sub, iat, exp, jti) 반환 (잘못됐거나 만료됐으면 None)"""
+    payload, _, signature = token.partition(".")
+    # compare_digest는 ASCII가 아닌 str에서 TypeError를 내므로 bytes로 비교
+    if not signature or not hmac.compare_digest(signature.encode(), _sign(payload).encode()):
+        return None
+    try:
+        claims = json.loads(_b64decode(payload))
+    except ValueError:
+        return None
+    if claims.get("exp", 0) <= (time.time() if now is None else now):
+        return None
+    return claims
@@ -3,8 +3,6 @@
 """
 import hashlib
 import uuid
-import random
-from .config import LEVEL_GROUPS, RESTAURANTS
 
 
 def hash_password(password: str) -> str:
@@ -22,46 +20,42 @@ def generate_id() -> str:
     return str(uuid.uuid4())
 
 
-def get_similar_levels(level: str) -> list:
-    """해당 직급과 비슷한 직급들 반환"""
-    for group in LEVEL_GROUPS:
-        if level in group:
-            return group
-    return [level]
-
-
-def is_similar_age(age1: int, age2: int, threshold: int = 5) -> bool:
-    """나이가 ±threshold 이내인지 확인"""
-    return abs(age1 - age2) <= threshold
-
-
-def is_similar_level(level1: str, level2: str) -> bool:
-    """직급이 비슷한지 확인"""
-    similar_levels = get_similar_levels(level1)
-    return level2 in similar_levels
-
-
-def get_recommended_restaurant(menu: str, price_range: str = None) -> dict:
-    """조건에 맞는 추천 식당 1개 반환"""
-    filtered = [r for r in RESTAURANTS if r["type"] == menu]
-    if price_range:
-        price_filtered = [r for r in filtered if r["price"] == price_range]
-        if price_filtered:
-            filtered = price_filtered
-    if not filtered:
-        filtered = RESTAURANTS
-    return random.choice(filtered)
-
-
-def get_recommended_restaurants(menu: str, price_range: str = None, count: int = 3) -> list:
-    """조건에 맞는 추천 식당 여러 개 반환"""
-    filtered = [r for r in RESTAURANTS if r["type"] == menu]
-    if price_range:
-        price_filtered = [r for r in filtered if r["price"] == price_range]
-        if price_filtered:
-            filtered = price_filtered
-    if not filtered:
-        filtered = RESTAURANTS
-    random.shuffle(filtered)
-    return filtered[:count]
-
+GEOHASH_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def geohash_encode(latitude: float, longitude: float, precision: int = 7) -> str:
+    """좌표 -> geohash 문자열 (precision 7 ≈ 150m 격자)"""
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    chars, bits, bit_count, use_lon = [], 0, 0, True
+    while len(chars) < precision:
+        value, span = (longitude, lon_range) if use_lon else (latitude, lat_range)
+        mid = (span[0] + span[1]) / 2
+        bits <<= 1
+        if value >= mid:
+            bits |= 1
+            span[0] = mid
+        else:
+            span[1] = mid
+        use_lon = not use_lon
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(GEOHASH_BASE32[bits])
+            bits, bit_count = 0, 0
+    return "".join(chars)
+
+
+def geohash_decode(geohash: str) -> tuple:
+    """geohash 문자열 -> 격자 중심 좌표 (latitude, longitude)"""
+    lat_range, lon_range = [-90.0, 90.0], [-180.0, 180.0]
+    use_lon = True
+    for char in geohash:
+        value = GEOHASH_BASE32.index(char)
+        for shift in range(4, -1, -1):
+            span = lon_range if use_lon else lat_range
+            mid = (span[0] + span[1]) / 2
+            if (value >> shift) & 1:
+                span[0] = mid
+            else:
+                span[1] = mid
+            use_lon = not use_lon
+    return (lat_range[0] + lat_range[1]) / 2, (lon_range[0] + lon_range[1]) / 2
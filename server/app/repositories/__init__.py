@@ -1,8 +1,13 @@
 # Repositories - Data access layer
+from ..core.config import DATA_STORE_BACKEND, SQLITE_PATH
 from .data_store import DataStore
+from .sqlite_store import SqliteDataStore
+from .waiting_request import WaitingRequest
 
-# 싱글톤 인스턴스
-data_store = DataStore()
-
-__all__ = ["data_store", "DataStore"]
+# 싱글톤 인스턴스 (DATA_STORE_BACKEND로 선택)
+if DATA_STORE_BACKEND == "sqlite":
+    data_store = SqliteDataStore(SQLITE_PATH)
+else:
+    data_store = DataStore()
 
+__all__ = ["data_store", "DataStore", "SqliteDataStore", "WaitingRequest"]
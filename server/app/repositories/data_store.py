@@ -1,10 +1,25 @@
 """
 인메모리 데이터 저장소
 실제 프로덕션에서는 이 부분을 DB로 교체
+
+동시성: 라우터는 스레드풀에서 실행되므로 모든 쓰기는 self._lock 안에서 수행하고,
+목록/스캔 조회는 lock 안에서 복사한 스냅샷을 순회합니다.
+lock은 dict 연산 동안만 짧게 잡고, 매칭 판단 같은 긴 작업은 버킷/방 단위 잠금(core.locks)을 사용합니다.
 """
-from typing import Optional, List
-from datetime import datetime
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Optional, List, Dict, Callable, Set, Tuple
+from datetime import date, datetime, timedelta
+from ..core.config import EXPIRED_REQUESTS_MAX, PARTITION_RETENTION_DAYS, SESSION_TTL_SECONDS
 from ..core.utils import generate_id, hash_password
+from .waiting_bucket import WaitingBucket
+from .waiting_request import WaitingRequest
+from .day_partitions import DayPartitions, record_day
+from .live_stats import LiveStats
+from .sorted_keys import SortedKeys, record_key
+from .versions import Versions, WAITING, GROUPS, ROOMS, room_user_ids, group_user_ids
 
 
 class DataStore:
@@ -14,11 +29,34 @@ class DataStore:
     """
     
     def __init__(self):
-        self._users: List[dict] = []
-        self._sessions: dict = {}  # token -> user_id
-        self._waiting_users: List[dict] = []
-        self._groups: List[dict] = []
-        self._rooms: List[dict] = []
+        self._lock = threading.RLock()
+        # 기본 키(id) -> 레코드 (dict는 삽입 순서를 유지하므로 목록 조회 순서도 그대로)
+        self._users: Dict[str, dict] = {}
+        self._sessions: Dict[str, Tuple[str, float]] = {}  # token -> (user_id, 만료 시각)
+        self._tokens_by_user_id: Dict[str, Set[str]] = {}  # user_id -> token들
+        # 서명 토큰 폐기 목록 (토큰이 원래 만료될 때까지만 보관)
+        self._revoked_tokens: Dict[str, float] = {}  # 토큰 ID(jti) -> 만료 시각
+        self._revoked_users: Dict[str, Tuple[float, float]] = {}  # user_id -> (이 시각 전에 발급된 토큰 무효, 만료 시각)
+        self._waiting_users: Dict[str, WaitingRequest] = {}
+        # (timeSlot, priceRange, menu) -> 버킷 (대기 순서 + 성별/직급/나이대 인덱스)
+        self._waiting_buckets: Dict[tuple, WaitingBucket] = {}
+        self._waiting_listeners: List[Callable[[tuple], None]] = []  # 버킷 변경 알림
+        self._expired_requests: "OrderedDict[str, WaitingRequest]" = OrderedDict()  # 타임아웃된 매칭 요청
+        # 그룹/점심방은 생성 날짜별 파티션 (보관 기간이 지난 날짜는 통째로 삭제)
+        self._groups = DayPartitions()
+        self._rooms = DayPartitions()
+        self._current_day: Optional[str] = None  # 마지막으로 보관 기간을 적용한 날짜
+        self._stats = LiveStats()  # /stats 카운터 (쓰기와 함께 증감)
+        self._versions = Versions()  # ETag용 컬렉션/유저별 버전
+        
+        # 유니크/보조 인덱스
+        self._user_id_by_username: Dict[str, str] = {}
+        self._waiting_id_by_user_id: Dict[str, str] = {}  # userId -> 매칭 요청 ID
+        self._group_id_by_member_id: Dict[str, str] = {}  # 매칭 요청 ID -> 그룹 ID
+        # 목록 페이지네이션용 (createdAt, id) 정렬 키
+        self._user_keys = SortedKeys()
+        self._group_keys = SortedKeys()
+        self._room_keys = SortedKeys()
         
         # 기본 테스트 계정 생성
         self._create_default_users()
@@ -39,7 +77,7 @@ class DataStore:
         ]
         
         for user_data in default_users:
-            self._users.append({
+            self._index_user({
                 "id": generate_id(),
                 "username": user_data["username"],
                 "password": hash_password(user_data["password"]),
@@ -71,10 +109,11 @@ class DataStore:
     
     def increment_match_count(self, user_id: str) -> Optional[dict]:
         """유저 매칭 횟수 증가"""
-        user = self.get_user_by_id(user_id)
-        if user:
-            user["matchCount"] = user.get("matchCount", 0) + 1
-        return user
+        with self._lock:
+            user = self.get_user_by_id(user_id)
+            if user:
+                user["matchCount"] = user.get("matchCount", 0) + 1
+            return user
     
     def get_user_with_level(self, user_id: str) -> Optional[dict]:
         """레벨 정보 포함한 유저 조회"""
@@ -94,16 +133,32 @@ class DataStore:
         """모든 유저 조회 (비밀번호 제외)"""
         return [
             {k: v for k, v in u.items() if k != "password"}
-            for u in self._users
+            for u in self._snapshot(self._users)
         ]
     
+    def get_users_page(self, after: Optional[tuple], limit: int,
+                       descending: bool = False) -> Tuple[List[dict], bool]:
+        """(createdAt, id) 순 유저 한 페이지 (비밀번호 제외) + 다음 페이지 여부"""
+        with self._lock:
+            keys, has_more = self._user_keys.page(after, limit, descending)
+            users = [self._users[key[1]] for key in keys]
+        return [{k: v for k, v in u.items() if k != "password"} for u in users], has_more
+    
     def get_user_by_id(self, user_id: str) -> Optional[dict]:
         """ID로 유저 조회"""
-        return next((u for u in self._users if u["id"] == user_id), None)
+        return self._users.get(user_id)
     
     def get_user_by_username(self, username: str) -> Optional[dict]:
         """username으로 유저 조회"""
-        return next((u for u in self._users if u["username"] == username), None)
+        user_id = self._user_id_by_username.get(username)
+        return self._users.get(user_id) if user_id else None
+    
+    def _index_user(self, user: dict):
+        """유저 저장 + 인덱스 등록"""
+        with self._lock:
+            self._users[user["id"]] = user
+            self._user_id_by_username[user["username"]] = user["id"]
+            self._user_keys.add(record_key(user))
     
     def create_user(self, user_data: dict) -> dict:
         """새 유저 생성"""
@@ -112,172 +167,368 @@ class DataStore:
             **user_data,
             "createdAt": datetime.now().isoformat(),
         }
-        self._users.append(user)
+        self._index_user(user)
         return user
     
     def user_exists(self, username: str) -> bool:
         """유저 존재 여부 확인"""
-        return any(u["username"] == username for u in self._users)
+        return username in self._user_id_by_username
     
     # ============ 세션 관련 ============
-    def create_session(self, token: str, user_id: str):
+    def create_session(self, token: str, user_id: str, ttl_seconds: float = SESSION_TTL_SECONDS):
         """세션 생성"""
-        self._sessions[token] = user_id
+        with self._lock:
+            self._sessions[token] = (user_id, time.time() + ttl_seconds)
+            self._tokens_by_user_id.setdefault(user_id, set()).add(token)
     
     def get_session(self, token: str) -> Optional[str]:
-        """세션에서 user_id 조회"""
-        return self._sessions.get(token)
+        """세션에서 user_id 조회 (만료된 세션은 이때 삭제)"""
+        session = self._sessions.get(token)
+        if session is None:
+            return None
+        if session[1] <= time.time():
+            self.delete_session(token)
+            return None
+        return session[0]
+    
+    def _pop_session(self, token: str):
+        """세션 + 역인덱스 제거 (self._lock 안에서 호출)"""
+        session = self._sessions.pop(token, None)
+        if session is None:
+            return
+        tokens = self._tokens_by_user_id.get(session[0])
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self._tokens_by_user_id[session[0]]
     
     def delete_session(self, token: str):
         """세션 삭제"""
-        if token in self._sessions:
-            del self._sessions[token]
+        with self._lock:
+            self._pop_session(token)
     
     def delete_user_sessions(self, user_id: str):
         """특정 유저의 모든 세션 삭제"""
-        tokens_to_delete = [t for t, uid in self._sessions.items() if uid == user_id]
-        for token in tokens_to_delete:
-            del self._sessions[token]
+        with self._lock:
+            for token in list(self._tokens_by_user_id.get(user_id, ())):
+                self._pop_session(token)
+    
+    def sweep_expired_sessions(self, now: Optional[float] = None) -> int:
+        """만료된 세션과 폐기 목록 항목 정리, 삭제한 세션 수 반환"""
+        now = time.time() if now is None else now
+        with self._lock:
+            expired = [token for token, (_, expires_at) in self._sessions.items() if expires_at <= now]
+            for token in expired:
+                self._pop_session(token)
+            for token_id in [t for t, expires_at in self._revoked_tokens.items() if expires_at <= now]:
+                del self._revoked_tokens[token_id]
+            for user_id in [u for u, (_, expires_at) in self._revoked_users.items() if expires_at <= now]:
+                del self._revoked_users[user_id]
+        return len(expired)
+    
+    def count_sessions(self) -> int:
+        """저장된 세션 수 (만료됐지만 아직 정리되지 않은 세션 포함)"""
+        return len(self._sessions)
+    
+    # ============ 서명 토큰 폐기 목록 ============
+    def revoke_token(self, token_id: str, expires_at: float):
+        """서명 토큰 1개 폐기 (로그아웃)"""
+        with self._lock:
+            self._revoked_tokens[token_id] = expires_at
+    
+    def revoke_user_tokens(self, user_id: str, issued_before: float, expires_at: float):
+        """issued_before 전에 발급된 유저의 서명 토큰 모두 폐기 (새 로그인)"""
+        with self._lock:
+            self._revoked_users[user_id] = (issued_before, expires_at)
+    
+    def is_token_revoked(self, token_id: str, user_id: str, issued_at: float) -> bool:
+        """서명 토큰이 폐기됐는지"""
+        if token_id in self._revoked_tokens:
+            return True
+        revoked = self._revoked_users.get(user_id)
+        return revoked is not None and issued_at < revoked[0]
     
     # ============ 매칭 대기열 관련 ============
-    def get_all_waiting_users(self) -> List[dict]:
+    @staticmethod
+    def waiting_bucket_key(time_slot: str, price_range: str, menu: str) -> tuple:
+        """대기열 버킷 키 (필수 조건: 시간, 가격대, 메뉴)"""
+        return (time_slot, price_range, menu)
+    
+    def subscribe_waiting_changes(self, listener: Callable[[tuple], None]):
+        """대기열 버킷 변경(추가/제거) 시 호출될 listener(bucket_key) 등록"""
+        self._waiting_listeners.append(listener)
+    
+    def _notify_waiting_change(self, key: tuple):
+        for listener in self._waiting_listeners:
+            listener(key)
+    
+    def _snapshot(self, records: Dict[str, object]) -> list:
+        """순회용 스냅샷 (다른 스레드의 추가/삭제와 무관하게 안전)"""
+        with self._lock:
+            return list(records.values())
+    
+    def get_all_waiting_users(self) -> List[WaitingRequest]:
         """모든 대기 유저 조회"""
-        return self._waiting_users
+        return self._snapshot(self._waiting_users)
     
-    def get_waiting_user_by_id(self, request_id: str) -> Optional[dict]:
+    def get_waiting_user_by_id(self, request_id: str) -> Optional[WaitingRequest]:
         """ID로 대기 유저 조회"""
-        return next((u for u in self._waiting_users if u["id"] == request_id), None)
+        return self._waiting_users.get(request_id)
     
-    def add_waiting_user(self, user_data: dict) -> dict:
+    def add_waiting_user(self, request: WaitingRequest) -> WaitingRequest:
         """대기열에 유저 추가"""
-        self._waiting_users.append(user_data)
-        return user_data
+        key = request.bucket_key
+        with self._lock:
+            replaced = self._waiting_users.get(request.id)
+            if replaced is not None:
+                self._stats.waiting_removed(replaced)
+            self._waiting_users[request.id] = request
+            self._stats.waiting_added(request)
+            self._versions.bump(WAITING, [request.user_id, replaced and replaced.user_id])
+            bucket = self._waiting_buckets.get(key)
+            if bucket is None:
+                bucket = self._waiting_buckets[key] = WaitingBucket()
+            bucket.add(request)
+            if request.user_id:
+                self._waiting_id_by_user_id[request.user_id] = request.id
+        self._notify_waiting_change(key)
+        return request
     
     def remove_waiting_user(self, request_id: str):
         """대기열에서 유저 제거"""
-        self._waiting_users = [u for u in self._waiting_users if u["id"] != request_id]
+        with self._lock:
+            key = self._pop_waiting_user(request_id)
+        if key is not None:
+            self._notify_waiting_change(key)
+    
+    def _pop_waiting_user(self, request_id: str) -> Optional[tuple]:
+        """대기열에서 제거하고 버킷 키 반환 (self._lock 안에서 호출)"""
+        request = self._unindex_waiting_user(request_id)
+        if not request:
+            return None
+        self._stats.waiting_removed(request)
+        self._versions.bump(WAITING, [request.user_id])
+        return request.bucket_key
+    
+    def _unindex_waiting_user(self, request_id: str) -> Optional[WaitingRequest]:
+        """대기 요청을 dict/버킷/userId 인덱스에서만 제거 (통계/버전은 호출한 쪽에서, self._lock 안에서 호출)"""
+        request = self._waiting_users.pop(request_id, None)
+        if not request:
+            return None
+        key = request.bucket_key
+        bucket = self._waiting_buckets.get(key)
+        if bucket is not None:
+            bucket.remove(request_id)
+            if not bucket:
+                del self._waiting_buckets[key]
+        if self._waiting_id_by_user_id.get(request.user_id) == request_id:
+            del self._waiting_id_by_user_id[request.user_id]
+        return request
+    
+    def set_waiting_relaxation_level(self, request_id: str, level: int) -> Optional[WaitingRequest]:
+        """대기 요청의 완화 단계 갱신"""
+        with self._lock:
+            request = self._waiting_users.get(request_id)
+            changed = request is not None and request.relaxation_level != level
+            if changed:
+                request.relaxation_level = level
+        if changed:
+            self._notify_waiting_change(request.bucket_key)
+        return request
+    
+    def expire_waiting_user(self, request_id: str) -> Optional[WaitingRequest]:
+        """타임아웃된 요청을 대기열에서 빼고 결과 조회용으로 보관"""
+        with self._lock:
+            request = self._waiting_users.get(request_id)
+            if not request:
+                return None
+            self._expired_requests[request_id] = request
+            while len(self._expired_requests) > EXPIRED_REQUESTS_MAX:
+                self._expired_requests.popitem(last=False)
+            self.remove_waiting_user(request_id)
+        return request
+    
+    def get_expired_request(self, request_id: str) -> Optional[WaitingRequest]:
+        """타임아웃된 요청 조회"""
+        return self._expired_requests.get(request_id)
     
     def remove_waiting_users(self, request_ids: List[str]):
         """대기열에서 여러 유저 제거"""
-        self._waiting_users = [u for u in self._waiting_users if u["id"] not in request_ids]
+        with self._lock:
+            keys = {self._pop_waiting_user(request_id) for request_id in request_ids}
+        for key in keys - {None}:
+            self._notify_waiting_change(key)
     
     def remove_waiting_user_by_user_id(self, user_id: str):
         """userId로 대기열에서 유저 제거 (중복 참여 방지)"""
-        self._waiting_users = [u for u in self._waiting_users if u.get("userId") != user_id]
+        with self._lock:
+            request_id = self._waiting_id_by_user_id.get(user_id)
+            if request_id:
+                self.remove_waiting_user(request_id)
     
-    def get_waiting_user_by_user_id(self, user_id: str) -> Optional[dict]:
+    def get_waiting_user_by_user_id(self, user_id: str) -> Optional[WaitingRequest]:
         """userId로 대기 유저 조회"""
-        return next((u for u in self._waiting_users if u.get("userId") == user_id), None)
-    
-    def get_waiting_users_by_conditions(self, time_slot: str, price_range: str, menu: str) -> List[dict]:
-        """조건에 맞는 대기 유저 조회"""
-        return [
-            u for u in self._waiting_users
-            if u["timeSlot"] == time_slot
-            and u["priceRange"] == price_range
-            and u["menu"] == menu
-        ]
+        request_id = self._waiting_id_by_user_id.get(user_id)
+        return self._waiting_users.get(request_id) if request_id else None
+    
+    def get_waiting_users_by_conditions(self, time_slot: str, price_range: str, menu: str) -> List[WaitingRequest]:
+        """조건에 맞는 대기 유저 조회 (대기 순서)"""
+        with self._lock:
+            bucket = self._waiting_buckets.get(self.waiting_bucket_key(time_slot, price_range, menu))
+            return bucket.values() if bucket else []
+    
+    def get_waiting_candidates(self, time_slot: str, price_range: str, menu: str,
+                               gender: int = 0, levels: Optional[List[int]] = None,
+                               age_range: Optional[tuple] = None) -> List[WaitingRequest]:
+        """버킷 보조 인덱스로 좁힌 매칭 후보 조회 (대기 순서, gender/levels는 코드)"""
+        with self._lock:
+            bucket = self._waiting_buckets.get(self.waiting_bucket_key(time_slot, price_range, menu))
+            if not bucket:
+                return []
+            return bucket.candidates(gender=gender, levels=levels, age_range=age_range)
+    
+    def count_waiting_users_by_conditions(self, time_slot: str, price_range: str, menu: str) -> int:
+        """조건에 맞는 대기 인원 수"""
+        bucket = self._waiting_buckets.get(self.waiting_bucket_key(time_slot, price_range, menu))
+        return len(bucket) if bucket else 0
+    
+    def get_waiting_bucket_keys(self) -> List[tuple]:
+        """대기 인원이 있는 버킷 키 목록"""
+        with self._lock:
+            return list(self._waiting_buckets)
     
     # ============ 그룹 관련 ============
     def get_all_groups(self) -> List[dict]:
-        """모든 그룹 조회"""
-        return self._groups
+        """모든 그룹 조회 (보관 중인 날짜 전체)"""
+        with self._lock:
+            return self._groups.values()
+    
+    def get_groups_page(self, after: Optional[tuple], limit: int,
+                        descending: bool = False) -> Tuple[List[dict], bool]:
+        """(createdAt, id) 순 그룹 한 페이지 + 다음 페이지 여부"""
+        with self._lock:
+            keys, has_more = self._group_keys.page(after, limit, descending)
+            return [self._groups.get(key[1]) for key in keys], has_more
     
     def get_group_by_id(self, group_id: str) -> Optional[dict]:
         """ID로 그룹 조회"""
-        return next((g for g in self._groups if g["id"] == group_id), None)
+        with self._lock:
+            return self._groups.get(group_id)
     
     def get_group_by_member_id(self, member_id: str) -> Optional[dict]:
-        """멤버 ID로 그룹 조회"""
-        for group in self._groups:
-            if any(m["id"] == member_id for m in group["members"]):
-                return group
-        return None
-    
-    def create_group(self, group_data: dict) -> dict:
-        """그룹 생성"""
-        group = {
-            "id": generate_id(),
-            **group_data,
-            "createdAt": datetime.now().isoformat(),
-        }
-        self._groups.append(group)
+        """멤버 ID(매칭 요청 ID)로 그룹 조회"""
+        with self._lock:
+            group_id = self._group_id_by_member_id.get(member_id)
+            return self._groups.get(group_id) if group_id else None
+    
+    def create_group(self, group_data: dict, claim_request_ids: Optional[List[str]] = None) -> Optional[dict]:
+        """
+        그룹 생성
+        claim_request_ids: 그룹 생성과 함께 대기열에서 빼낼 매칭 요청 ID 목록
+        하나라도 이미 대기열에 없으면(취소/타임아웃/다른 그룹에 매칭) 그룹을 만들지 않고 None을 반환합니다.
+        그룹을 먼저 저장한 뒤 대기열에서 제거하므로 상태 조회에서 not_found가 보이지 않습니다.
+        """
+        claim_request_ids = claim_request_ids or []
+        with self._lock:
+            if any(request_id not in self._waiting_users for request_id in claim_request_ids):
+                return None
+            group = {
+                "id": generate_id(),
+                **group_data,
+                "createdAt": datetime.now().isoformat(),
+            }
+            self._apply_retention(record_day(group))
+            self._groups.add(group)
+            self._group_keys.add(record_key(group))
+            self._stats.group_added(group)
+            self._versions.bump(GROUPS, group_user_ids(group))
+            for member in group.get("members", []):
+                self._group_id_by_member_id[member["id"]] = group["id"]
+            self.remove_waiting_users(claim_request_ids)
         return group
     
     # ============ 점심방 관련 ============
     def get_all_rooms(self) -> List[dict]:
-        """모든 점심방 조회"""
-        return self._rooms
+        """모든 점심방 조회 (보관 중인 날짜 전체)"""
+        with self._lock:
+            return self._rooms.values()
     
     def get_open_rooms(self) -> List[dict]:
         """열린 점심방만 조회"""
         return [
-            r for r in self._rooms
+            r for r in self.get_all_rooms()
             if len(r["members"]) < r["maxCount"] and r["status"] == "open"
         ]
     
     def get_all_active_rooms(self) -> List[dict]:
-        """열린 방 + 매칭 완료된 방 모두 조회 (오늘 날짜 기준)"""
-        from datetime import date
-        today = date.today().isoformat()
-        return [
-            r for r in self._rooms
-            if r.get("createdAt", "").startswith(today)
-        ]
+        """열린 방 + 매칭 완료된 방 모두 조회 (오늘 날짜 파티션)"""
+        with self._lock:
+            return self._rooms.on_day(date.today().isoformat())
+    
+    def get_active_rooms_page(self, after: Optional[tuple], limit: int,
+                              descending: bool = False) -> Tuple[List[dict], bool]:
+        """오늘 생성된 방 (createdAt, id) 순 한 페이지 + 다음 페이지 여부"""
+        today = date.today()
+        with self._lock:
+            keys, has_more = self._room_keys.page(
+                after, limit, descending,
+                lower=(today.isoformat(),), upper=((today + timedelta(days=1)).isoformat(),),
+            )
+            return [self._rooms.get(key[1]) for key in keys], has_more
     
     def get_user_rooms(self, user_id: str) -> List[dict]:
         """특정 유저가 참여 중인 방 조회"""
         return [
-            r for r in self._rooms
+            r for r in self.get_all_rooms()
             if any(m.get("id") == user_id for m in r.get("members", []))
         ]
     
     def get_user_active_room(self, user_id: str) -> Optional[dict]:
-        """유저가 참여 중인 활성 방 조회 (오늘 날짜 기준)"""
-        from datetime import date
-        today = date.today().isoformat()
-        for room in self._rooms:
-            if not room.get("createdAt", "").startswith(today):
-                continue
+        """유저가 참여 중인 활성 방 조회 (오늘 날짜 파티션)"""
+        for room in self.get_all_active_rooms():
             for member in room.get("members", []):
                 if member.get("id") == user_id:
                     return room
         return None
     
     def get_user_active_group(self, user_id: str) -> Optional[dict]:
-        """유저가 참여 중인 활성 그룹 조회 (오늘 날짜 기준)"""
-        from datetime import date
-        today = date.today().isoformat()
-        for group in self._groups:
-            if not group.get("createdAt", "").startswith(today):
-                continue
+        """유저가 참여 중인 활성 그룹 조회 (오늘 날짜 파티션)"""
+        with self._lock:
+            groups = self._groups.on_day(date.today().isoformat())
+        for group in groups:
             for member in group.get("members", []):
                 if member.get("id") == user_id or member.get("userId") == user_id:
                     return group
         return None
     
     def is_user_in_active_lunch(self, user_id: str) -> dict:
-        """유저가 이미 점심 활동 중인지 확인 (방/그룹/매칭대기)"""
-        # 오늘 날짜의 활성 방 체크
-        active_room = self.get_user_active_room(user_id)
-        if active_room:
-            return {"active": True, "type": "room", "data": active_room}
-        
-        # 오늘 날짜의 활성 그룹 체크
-        active_group = self.get_user_active_group(user_id)
-        if active_group:
-            return {"active": True, "type": "group", "data": active_group}
-        
-        # 매칭 대기열 체크
-        waiting = self.get_waiting_user_by_user_id(user_id)
-        if waiting:
-            return {"active": True, "type": "waiting", "data": waiting}
-        
-        return {"active": False, "type": None, "data": None}
+        """
+        유저가 이미 점심 활동 중인지 확인 (방/그룹/매칭대기)
+        그룹 생성(create_group의 claim)과 같은 잠금 안에서 확인하므로,
+        확인 도중 스케줄러가 대기 요청을 그룹으로 옮겨도 둘 중 하나로는 보입니다.
+        """
+        with self._lock:
+            # 오늘 날짜의 활성 방 체크
+            active_room = self.get_user_active_room(user_id)
+            if active_room:
+                return {"active": True, "type": "room", "data": active_room}
+            
+            # 오늘 날짜의 활성 그룹 체크
+            active_group = self.get_user_active_group(user_id)
+            if active_group:
+                return {"active": True, "type": "group", "data": active_group}
+            
+            # 매칭 대기열 체크
+            waiting = self.get_waiting_user_by_user_id(user_id)
+            if waiting:
+                return {"active": True, "type": "waiting", "data": waiting.to_dict()}
+            
+            return {"active": False, "type": None, "data": None}
     
     def get_room_by_id(self, room_id: str) -> Optional[dict]:
         """ID로 점심방 조회"""
-        return next((r for r in self._rooms if r["id"] == room_id), None)
+        with self._lock:
+            return self._rooms.get(room_id)
     
     def create_room(self, room_data: dict) -> dict:
         """점심방 생성"""
@@ -286,41 +537,110 @@ class DataStore:
             **room_data,
             "createdAt": datetime.now().isoformat(),
         }
-        self._rooms.append(room)
+        with self._lock:
+            self._apply_retention(record_day(room))
+            self._rooms.add(room)
+            self._room_keys.add(record_key(room))
+            self._stats.rooms_changed(1)
+            self._versions.bump(ROOMS, room_user_ids(room))
         return room
     
     def update_room(self, room_id: str, updates: dict) -> Optional[dict]:
         """점심방 업데이트"""
-        room = self.get_room_by_id(room_id)
-        if room:
-            room.update(updates)
-        return room
+        with self._lock:
+            room = self.get_room_by_id(room_id)
+            if room:
+                members_before = room_user_ids(room)
+                room.update(updates)
+                self._versions.bump(ROOMS, members_before | room_user_ids(room))
+            return room
     
     def delete_room(self, room_id: str):
         """점심방 삭제"""
-        self._rooms = [r for r in self._rooms if r["id"] != room_id]
+        with self._lock:
+            room = self._rooms.pop(room_id)
+            if room is not None:
+                self._room_keys.discard(record_key(room))
+                self._stats.rooms_changed(-1)
+                self._versions.bump(ROOMS, room_user_ids(room))
+    
+    # ============ 날짜별 파티션 보관 기간 ============
+    def _apply_retention(self, today: str):
+        """날짜가 바뀌었으면 보관 기간이 지난 파티션 삭제 (self._lock 안에서 호출)"""
+        if today != self._current_day:
+            self._current_day = today
+            self.evict_expired_partitions(date.fromisoformat(today))
+    
+    def evict_expired_partitions(self, today: Optional[date] = None) -> dict:
+        """
+        PARTITION_RETENTION_DAYS(오늘 포함)보다 오래된 날짜의 그룹/점심방 삭제
+        삭제된 레코드 수 반환
+        """
+        today = today or date.today()
+        cutoff = (today - timedelta(days=PARTITION_RETENTION_DAYS - 1)).isoformat()
+        with self._lock:
+            groups = self._groups.evict_before(cutoff)
+            for group in groups:
+                self._stats.group_removed(group)
+                for member in group.get("members", []):
+                    if self._group_id_by_member_id.get(member["id"]) == group["id"]:
+                        del self._group_id_by_member_id[member["id"]]
+            rooms = self._rooms.evict_before(cutoff)
+            self._group_keys.discard_before((cutoff,))
+            self._room_keys.discard_before((cutoff,))
+            self._stats.rooms_changed(-len(rooms))
+            self._bump_evicted(len(groups), len(rooms))
+        return {"groups": len(groups), "rooms": len(rooms)}
+    
+    def _bump_evicted(self, groups: int, rooms: int):
+        """보관 기간 삭제 후 버전 갱신 (삭제된 레코드의 멤버를 다시 읽지 않고 유저별 화면 전체를 무효화)"""
+        if groups:
+            self._versions.bump_all_users(GROUPS)
+        if rooms:
+            self._versions.bump_all_users(ROOMS)
+    
+    def get_partition_stats(self) -> List[dict]:
+        """보관 중인 날짜별 그룹/점심방 수와 대략적인 메모리 사용량"""
+        with self._lock:
+            group_sizes = self._groups.day_sizes()
+            room_sizes = self._rooms.day_sizes()
+        return [
+            {
+                "day": day,
+                "groups": group_sizes.get(day, (0, 0))[0],
+                "rooms": room_sizes.get(day, (0, 0))[0],
+                "bytes": group_sizes.get(day, (0, 0))[1] + room_sizes.get(day, (0, 0))[1],
+            }
+            for day in sorted(set(group_sizes) | set(room_sizes))
+        ]
+    
+    # ============ 버전 (ETag) ============
+    @contextmanager
+    def read_snapshot(self):
+        """
+        버전과 응답 본문을 같은 시점의 데이터로 읽는 구간 (read view가 버전을 키로 본문을 보관하므로)
+        메모리 저장소는 버전을 먼저 읽고 레코드를 그 뒤에 읽어서 본문이 버전보다 오래될 수 없으므로 따로 잡지 않음
+        """
+        yield
+    
+    def get_version(self, *collections: str) -> str:
+        """컬렉션 목록/통계 화면의 버전 (해당 컬렉션에 쓰기가 있으면 바뀜)"""
+        with self._lock:
+            return f"{self._versions.epoch}.{self._versions.of(*collections)}"
+    
+    def get_user_version(self, user_id: str) -> str:
+        """유저별 화면(내 방 목록, 활성 상태)의 버전 - 유저가 속한 대기 요청/그룹/점심방이 바뀌면 바뀜"""
+        with self._lock:
+            return f"{self._versions.epoch}.{self._versions.of_user(user_id)}"
     
     # ============ 통계 관련 ============
     def get_stats(self) -> dict:
-        """통계 데이터 조회"""
-        all_participants = self._waiting_users + [
-            m for g in self._groups for m in g["members"]
-        ]
-        
-        menu_stats = {}
-        time_stats = {}
-        for u in all_participants:
-            if u.get("menu"):
-                menu_stats[u["menu"]] = menu_stats.get(u["menu"], 0) + 1
-            if u.get("timeSlot"):
-                time_stats[u["timeSlot"]] = time_stats.get(u["timeSlot"], 0) + 1
-        
-        return {
-            "totalParticipants": len(all_participants),
-            "waitingUsers": len(self._waiting_users),
-            "totalGroups": len(self._groups),
-            "totalRooms": len(self._rooms),
-            "menuStats": menu_stats,
-            "timeStats": time_stats,
-        }
+        """통계 데이터 조회 (쓰기 때마다 갱신되는 카운터)"""
+        with self._lock:
+            return self._stats.snapshot()
+    
+    def recount_stats(self) -> dict:
+        """저장된 레코드를 전부 다시 세어서 만든 통계 (카운터 검증용)"""
+        with self._lock:
+            return LiveStats.recount(self._waiting_users.values(), self._groups.values(), len(self._rooms)).snapshot()
 
@@ -0,0 +1,90 @@
+"""
+날짜별 파티션
+점심방/그룹을 createdAt 날짜(YYYY-MM-DD)별로 나눠 저장합니다.
+"오늘" 조회는 오늘 파티션만 보고, 보관 기간이 지난 파티션은 통째로 버립니다.
+"""
+import sys
+from typing import Optional, List, Dict, Tuple
+
+
+def record_day(record: dict) -> str:
+    """레코드의 파티션 키 (createdAt의 날짜 부분)"""
+    return record.get("createdAt", "")[:10]
+
+
+def deep_sizeof(obj, _seen: Optional[set] = None) -> int:
+    """dict/list/str 등으로 이루어진 레코드의 대략적인 메모리 사용량 (bytes)"""
+    seen = _seen if _seen is not None else set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set)):
+        size += sum(deep_sizeof(v, seen) for v in obj)
+    return size
+
+
+class DayPartitions:
+    """
+    날짜 -> (ID -> 레코드) + ID -> 날짜 인덱스
+    날짜 안에서는 삽입 순서를 유지하고, 전체 순회는 날짜 순입니다.
+    """
+
+    def __init__(self):
+        self._days: Dict[str, Dict[str, dict]] = {}
+        self._day_by_id: Dict[str, str] = {}
+
+    def __len__(self) -> int:
+        return len(self._day_by_id)
+
+    def add(self, record: dict):
+        """레코드 추가 (createdAt 날짜 파티션으로)"""
+        day = record_day(record)
+        self._days.setdefault(day, {})[record["id"]] = record
+        self._day_by_id[record["id"]] = day
+
+    def get(self, record_id: str) -> Optional[dict]:
+        """ID로 조회"""
+        day = self._day_by_id.get(record_id)
+        return self._days[day].get(record_id) if day is not None else None
+
+    def pop(self, record_id: str) -> Optional[dict]:
+        """ID로 제거"""
+        day = self._day_by_id.pop(record_id, None)
+        if day is None:
+            return None
+        partition = self._days[day]
+        record = partition.pop(record_id, None)
+        if not partition:
+            del self._days[day]
+        return record
+
+    def days(self) -> List[str]:
+        """보관 중인 날짜 목록 (오래된 순)"""
+        return sorted(self._days)
+
+    def on_day(self, day: str) -> List[dict]:
+        """해당 날짜 파티션의 레코드 목록"""
+        return list(self._days.get(day, {}).values())
+
+    def values(self) -> List[dict]:
+        """전체 레코드 (날짜 순)"""
+        return [r for day in self.days() for r in self._days[day].values()]
+
+    def evict_before(self, day: str) -> List[dict]:
+        """day보다 오래된 파티션을 버리고, 버린 레코드 목록 반환"""
+        evicted = []
+        for old_day in [d for d in self._days if d < day]:
+            for record_id, record in self._days.pop(old_day).items():
+                del self._day_by_id[record_id]
+                evicted.append(record)
+        return evicted
+
+    def day_sizes(self) -> Dict[str, Tuple[int, int]]:
+        """날짜 -> (레코드 수, 대략적인 메모리 bytes)"""
+        return {
+            day: (len(self._days[day]), deep_sizeof(self._days[day]))
+            for day in self.days()
+        }
@@ -0,0 +1,100 @@
+"""
+실시간 통계 카운터
+/stats 응답(참여자 수, 대기/그룹/점심방 수, 메뉴별/시간대별 참여자 수)을
+대기열 추가/제거, 그룹 생성/삭제, 점심방 생성/삭제 때마다 증감해서 조회를 O(1)로 만듭니다.
+참여자 = 대기 중인 매칭 요청 + 보관 중인 그룹의 멤버 (각 레코드의 menu / timeSlot 기준)
+저장소의 self._lock 안에서만 갱신합니다.
+"""
+from collections import Counter
+from typing import Iterable, List, Tuple
+
+
+class LiveStats:
+    """저장소 통계 카운터"""
+
+    def __init__(self):
+        self.waiting = 0
+        self.groups = 0
+        self.rooms = 0
+        self.participants = 0
+        self.menus: Counter = Counter()
+        self.time_slots: Counter = Counter()
+
+    def _count_participants(self, records: Iterable[dict], delta: int):
+        for record in records:
+            self.participants += delta
+            if record.get("menu"):
+                self.menus[record["menu"]] += delta
+            if record.get("timeSlot"):
+                self.time_slots[record["timeSlot"]] += delta
+
+    def _count_waiting(self, request, delta: int):
+        """대기 요청 (WaitingRequest) 1건"""
+        time_slot, _, menu = request.bucket_key
+        self.waiting += delta
+        self.participants += delta
+        if menu:
+            self.menus[menu] += delta
+        if time_slot:
+            self.time_slots[time_slot] += delta
+
+    def waiting_added(self, request):
+        self._count_waiting(request, 1)
+
+    def waiting_removed(self, request):
+        self._count_waiting(request, -1)
+
+    def group_added(self, group: dict):
+        self.groups += 1
+        self._count_participants(group.get("members", []), 1)
+
+    def group_removed(self, group: dict):
+        self.groups -= 1
+        self._count_participants(group.get("members", []), -1)
+
+    def rooms_changed(self, delta: int):
+        self.rooms += delta
+
+    @classmethod
+    def recount(cls, waiting: Iterable, groups: Iterable[dict], rooms: int) -> "LiveStats":
+        """레코드 전체를 세어서 카운터 생성 (시작 시 복원 / 검증용)"""
+        stats = cls()
+        for request in waiting:
+            stats.waiting_added(request)
+        for group in groups:
+            stats.group_added(group)
+        stats.rooms = rooms
+        return stats
+
+    def rows(self) -> List[Tuple[str, int]]:
+        """0이 아닌 카운터 (키, 값) 목록 (SQLite stats 테이블 형식, 메뉴/시간대는 "menu:" / "timeSlot:" 접두어)"""
+        rows = [("waiting", self.waiting), ("groups", self.groups), ("rooms", self.rooms),
+                ("participants", self.participants)]
+        rows += [(f"menu:{menu}", count) for menu, count in self.menus.items()]
+        rows += [(f"timeSlot:{slot}", count) for slot, count in self.time_slots.items()]
+        return [(key, count) for key, count in rows if count]
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Tuple[str, int]]) -> "LiveStats":
+        """rows()로 저장한 (키, 값) 목록 -> 카운터"""
+        stats = cls()
+        for key, count in rows:
+            kind, _, name = key.partition(":")
+            if kind == "menu":
+                stats.menus[name] = count
+            elif kind == "timeSlot":
+                stats.time_slots[name] = count
+            else:
+                setattr(stats, kind, count)
+        return stats
+
+    def snapshot(self) -> dict:
+        """/stats 응답 형식 (0이 된 메뉴/시간대는 제외)"""
+        return {
+            "totalParticipants": self.participants,
+            "waitingUsers": self.waiting,
+            "totalGroups": self.groups,
+            "totalRooms": self.rooms,
+            "menuStats": {menu: count for menu, count in self.menus.items() if count},
+            "timeStats": {slot: count for slot, count in self.time_slots.items() if count},
+        }
@@ -0,0 +1,51 @@
+"""
+정렬 키 인덱스
+목록 조회의 커서 페이지네이션용으로 (createdAt, id) 키를 정렬된 리스트로 유지하고
+bisect로 커서 위치를 찾아 한 페이지 분량의 키만 잘라냅니다.
+저장소의 self._lock 안에서만 사용합니다.
+"""
+from bisect import bisect_left, bisect_right, insort
+from typing import List, Optional, Tuple
+
+
+def record_key(record: dict) -> tuple:
+    """목록 정렬 키 (생성 시각, ID) - ID까지 포함해서 같은 시각에 만든 레코드도 순서가 고정됨"""
+    return (record.get("createdAt", ""), record["id"])
+
+
+class SortedKeys:
+    """정렬된 키 리스트"""
+
+    def __init__(self):
+        self._keys: List[tuple] = []
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: tuple):
+        insort(self._keys, key)
+
+    def discard(self, key: tuple):
+        i = bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            del self._keys[i]
+
+    def discard_before(self, bound: tuple):
+        """bound보다 작은 키 모두 제거 (보관 기간 삭제)"""
+        del self._keys[:bisect_left(self._keys, bound)]
+
+    def page(self, after: Optional[tuple], limit: int, descending: bool = False,
+             lower: Optional[tuple] = None, upper: Optional[tuple] = None) -> Tuple[List[tuple], bool]:
+        """
+        [lower, upper) 범위에서 커서(after) 다음 limit개 키와 다음 페이지 여부
+        descending이면 after보다 작은 쪽으로 큰 키부터
+        """
+        lo = bisect_left(self._keys, lower) if lower is not None else 0
+        hi = bisect_left(self._keys, upper) if upper is not None else len(self._keys)
+        if descending:
+            end = min(hi, bisect_left(self._keys, after)) if after is not None else hi
+            start = max(lo, end - limit)
+            return self._keys[start:end][::-1], start > lo
+        start = max(lo, bisect_right(self._keys, after)) if after is not None else lo
+        end = min(hi, start + limit)
+        return self._keys[start:end], end < hi
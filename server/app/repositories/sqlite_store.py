@@ -0,0 +1,749 @@
+"""
+SQLite 데이터 저장소
+DataStore와 같은 인터페이스로 유저/세션/그룹/점심방/매칭 대기열을 SQLite(WAL)에 저장합니다.
+재시작/배포 후에도 데이터가 유지됩니다.
+매칭 대기열 버킷, 완화 타이머, 타임아웃 결과, 매칭 스케줄러는 프로세스 메모리에 있으므로
+DB 파일 하나는 프로세스 하나만 엽니다 (옆의 .lock 파일을 배타적으로 잡고, 이미 잡혀 있으면 시작 실패).
+
+- 레코드는 JSON(data 컬럼)으로 저장하고, 조회 조건 컬럼만 따로 두고 인덱스를 겁니다.
+- 쓰기는 self._lock 안에서 전용 연결 하나로, 읽기는 스레드별 연결로 수행합니다 (WAL: 읽기가 쓰기를 막지 않음).
+- 그룹 생성(그룹 + 멤버 + 대기열 제거)은 한 트랜잭션에서 executemany로 묶어서 씁니다.
+- 그룹/점심방은 created_at 인덱스로 날짜 범위만 조회하고, 보관 기간이 지난 날짜는 범위 삭제합니다.
+- 매칭 대기열은 매칭용 버킷 인덱스가 필요하므로 메모리(DataStore)에도 두고,
+  시작 시 DB에서 다시 채웁니다. 완화 단계/타임아웃 결과는 메모리에만 둡니다.
+- /stats 카운터는 stats 테이블에 두고 레코드를 바꾸는 쓰기 트랜잭션 안에서 함께 증감합니다
+  (테이블이 비어 있으면 시작 시 DB를 한 번 세어서 채움).
+- ETag 버전도 versions 테이블에 두고 같은 트랜잭션에서 올립니다. epoch는 DB를 열 때마다 새로 써서
+  메모리에만 있던 상태(완화 단계, 타임아웃 결과)가 사라진 재시작 전 ETag와 섞이지 않게 합니다.
+"""
+import json
+import secrets
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from typing import Optional, List, Dict, Tuple, Callable, Iterable
+
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:  # Windows: 프로세스 잠금 없이 실행
+    FCNTL_AVAILABLE = False
+
+from ..core.config import PARTITION_RETENTION_DAYS, SESSION_TTL_SECONDS
+from ..core.utils import generate_id
+from .data_store import DataStore
+from .live_stats import LiveStats
+from .waiting_request import WaitingRequest
+from .versions import WAITING, GROUPS, ROOMS, room_user_ids, group_user_ids
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id TEXT PRIMARY KEY,
+    username TEXT NOT NULL UNIQUE,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sessions (
+    token TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_user_id ON sessions(user_id);
+CREATE TABLE IF NOT EXISTS revoked_tokens (
+    token_id TEXT PRIMARY KEY,
+    expires_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS revoked_users (
+    user_id TEXT PRIMARY KEY,
+    issued_before REAL NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS waiting (
+    id TEXT PRIMARY KEY,
+    user_id TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_waiting_user_id ON waiting(user_id);
+CREATE TABLE IF NOT EXISTS groups (
+    id TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_groups_created_at ON groups(created_at);
+CREATE INDEX IF NOT EXISTS idx_groups_created_at_id ON groups(created_at, id);
+CREATE TABLE IF NOT EXISTS group_members (
+    member_id TEXT PRIMARY KEY,
+    group_id TEXT NOT NULL,
+    user_id TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_group_members_user_id ON group_members(user_id);
+CREATE TABLE IF NOT EXISTS rooms (
+    id TEXT PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    status TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_rooms_created_at ON rooms(created_at);
+CREATE INDEX IF NOT EXISTS idx_rooms_status ON rooms(status);
+CREATE INDEX IF NOT EXISTS idx_rooms_created_at_id ON rooms(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_users_created_at_id ON users(json_extract(data, '$.createdAt'), id);
+CREATE TABLE IF NOT EXISTS room_members (
+    room_id TEXT NOT NULL,
+    user_id TEXT NOT NULL,
+    PRIMARY KEY (room_id, user_id)
+);
+CREATE INDEX IF NOT EXISTS idx_room_members_user_id ON room_members(user_id);
+CREATE TABLE IF NOT EXISTS stats (
+    key TEXT PRIMARY KEY,
+    count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS versions (
+    key TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+);
+"""
+
+# SQL 문은 상수로 두어 연결별 statement cache(prepared statement)를 재사용합니다.
+SQL_INSERT_USER = "INSERT OR IGNORE INTO users (id, username, data) VALUES (?, ?, ?)"
+SQL_UPDATE_USER = "UPDATE users SET data = ? WHERE id = ?"
+SQL_SELECT_USER = "SELECT data FROM users WHERE id = ?"
+SQL_SELECT_USER_BY_USERNAME = "SELECT data FROM users WHERE username = ?"
+SQL_SELECT_USERS = "SELECT data FROM users ORDER BY rowid"
+SQL_USER_EXISTS = "SELECT 1 FROM users WHERE username = ?"
+
+SQL_INSERT_SESSION = "INSERT OR REPLACE INTO sessions (token, user_id, expires_at) VALUES (?, ?, ?)"
+SQL_SELECT_SESSION = "SELECT user_id FROM sessions WHERE token = ? AND expires_at > ?"
+SQL_DELETE_SESSION = "DELETE FROM sessions WHERE token = ?"
+SQL_DELETE_USER_SESSIONS = "DELETE FROM sessions WHERE user_id = ?"
+SQL_SWEEP_SESSIONS = "DELETE FROM sessions WHERE expires_at <= ?"
+SQL_COUNT_SESSIONS = "SELECT COUNT(*) FROM sessions"
+SQL_INSERT_REVOKED_TOKEN = "INSERT OR REPLACE INTO revoked_tokens (token_id, expires_at) VALUES (?, ?)"
+SQL_INSERT_REVOKED_USER = "INSERT OR REPLACE INTO revoked_users (user_id, issued_before, expires_at) VALUES (?, ?, ?)"
+SQL_SELECT_REVOKED = (
+    "SELECT EXISTS(SELECT 1 FROM revoked_tokens WHERE token_id = ?)"
+    " OR EXISTS(SELECT 1 FROM revoked_users WHERE user_id = ? AND issued_before > ?)"
+)
+SQL_SWEEP_REVOKED_TOKENS = "DELETE FROM revoked_tokens WHERE expires_at <= ?"
+SQL_SWEEP_REVOKED_USERS = "DELETE FROM revoked_users WHERE expires_at <= ?"
+
+SQL_INSERT_WAITING = "INSERT OR REPLACE INTO waiting (id, user_id, data) VALUES (?, ?, ?)"
+SQL_DELETE_WAITING = "DELETE FROM waiting WHERE id = ?"
+SQL_SELECT_WAITING = "SELECT data FROM waiting ORDER BY rowid"
+
+SQL_INSERT_GROUP = "INSERT INTO groups (id, created_at, data) VALUES (?, ?, ?)"
+SQL_INSERT_GROUP_MEMBER = "INSERT OR REPLACE INTO group_members (member_id, group_id, user_id) VALUES (?, ?, ?)"
+SQL_SELECT_GROUP = "SELECT data FROM groups WHERE id = ?"
+SQL_SELECT_GROUPS = "SELECT data FROM groups ORDER BY rowid"
+SQL_SELECT_GROUP_BY_MEMBER = (
+    "SELECT g.data FROM group_members m JOIN groups g ON g.id = m.group_id WHERE m.member_id = ?"
+)
+SQL_SELECT_ACTIVE_GROUP_BY_USER = (
+    "SELECT g.data FROM group_members m JOIN groups g ON g.id = m.group_id"
+    " WHERE (m.member_id = ? OR m.user_id = ?) AND g.created_at >= ? AND g.created_at < ?"
+    " ORDER BY g.rowid LIMIT 1"
+)
+
+SQL_INSERT_ROOM = "INSERT INTO rooms (id, created_at, status, data) VALUES (?, ?, ?, ?)"
+SQL_UPDATE_ROOM = "UPDATE rooms SET status = ?, data = ? WHERE id = ?"
+SQL_DELETE_ROOM = "DELETE FROM rooms WHERE id = ?"
+SQL_SELECT_ROOM = "SELECT data FROM rooms WHERE id = ?"
+SQL_SELECT_ROOMS = "SELECT data FROM rooms ORDER BY rowid"
+SQL_COUNT_ROOMS = "SELECT COUNT(*) FROM rooms"
+SQL_SELECT_OPEN_ROOMS = "SELECT data FROM rooms WHERE status = 'open' ORDER BY rowid"
+SQL_SELECT_ROOMS_BETWEEN = "SELECT data FROM rooms WHERE created_at >= ? AND created_at < ? ORDER BY rowid"
+SQL_SELECT_USER_ROOMS = (
+    "SELECT r.data FROM room_members m JOIN rooms r ON r.id = m.room_id WHERE m.user_id = ? ORDER BY r.rowid"
+)
+SQL_SELECT_ACTIVE_ROOM_BY_USER = (
+    "SELECT r.data FROM room_members m JOIN rooms r ON r.id = m.room_id"
+    " WHERE m.user_id = ? AND r.created_at >= ? AND r.created_at < ? ORDER BY r.rowid LIMIT 1"
+)
+SQL_SELECT_GROUPS_BEFORE = "SELECT data FROM groups WHERE created_at < ?"
+SQL_EVICT_GROUP_MEMBERS = "DELETE FROM group_members WHERE group_id IN (SELECT id FROM groups WHERE created_at < ?)"
+SQL_EVICT_GROUPS = "DELETE FROM groups WHERE created_at < ?"
+SQL_EVICT_ROOM_MEMBERS = "DELETE FROM room_members WHERE room_id IN (SELECT id FROM rooms WHERE created_at < ?)"
+SQL_EVICT_ROOMS = "DELETE FROM rooms WHERE created_at < ?"
+SQL_GROUP_PARTITION_STATS = "SELECT substr(created_at, 1, 10) AS day, COUNT(*), SUM(length(data)) FROM groups GROUP BY day"
+SQL_ROOM_PARTITION_STATS = "SELECT substr(created_at, 1, 10) AS day, COUNT(*), SUM(length(data)) FROM rooms GROUP BY day"
+
+SQL_ADD_STAT = (
+    "INSERT INTO stats (key, count) VALUES (?, ?) ON CONFLICT(key) DO UPDATE SET count = count + excluded.count"
+)
+SQL_SELECT_STATS = "SELECT key, count FROM stats"
+SQL_COUNT_STAT_ROWS = "SELECT COUNT(*) FROM stats"
+SQL_DELETE_STATS = "DELETE FROM stats"
+
+# versions 키: "epoch", "clock"(단조 증가 시계), "collection:<이름>", "user:<유저 ID>", "all_users"
+SQL_SET_VERSION = "INSERT OR REPLACE INTO versions (key, version) VALUES (?, ?)"
+SQL_TICK_CLOCK = (
+    "INSERT INTO versions (key, version) VALUES ('clock', 1)"
+    " ON CONFLICT(key) DO UPDATE SET version = version + 1 RETURNING version"
+)
+SQL_DELETE_USER_VERSIONS = "DELETE FROM versions WHERE key >= 'user:' AND key < 'user;'"
+SQL_SELECT_USER_VERSION = (
+    "SELECT (SELECT version FROM versions WHERE key = 'epoch'),"
+    " COALESCE(MAX(version), 0) FROM versions WHERE key IN (?, 'all_users')"
+)
+
+
+def _collection_version_sql(count: int) -> str:
+    return (
+        "SELECT (SELECT version FROM versions WHERE key = 'epoch'),"
+        f" COALESCE(MAX(version), 0) FROM versions WHERE key IN ({', '.join('?' * count)})"
+    )
+
+
+SQL_INSERT_ROOM_MEMBER = "INSERT OR IGNORE INTO room_members (room_id, user_id) VALUES (?, ?)"
+SQL_DELETE_ROOM_MEMBERS = "DELETE FROM room_members WHERE room_id = ?"
+
+
+def _page_sql(table: str, key_column: str, where: str = "") -> Dict[Tuple[bool, bool], str]:
+    """(descending, 커서 있음) -> 키셋 페이지 조회 SQL ((key_column, id) 인덱스 사용)"""
+    queries = {}
+    for descending in (False, True):
+        for has_cursor in (False, True):
+            conditions = [where] if where else []
+            if has_cursor:
+                conditions.append(f"({key_column}, id) {'<' if descending else '>'} (?, ?)")
+            direction = "DESC" if descending else "ASC"
+            queries[(descending, has_cursor)] = (
+                f"SELECT data FROM {table}"
+                + (f" WHERE {' AND '.join(conditions)}" if conditions else "")
+                + f" ORDER BY {key_column} {direction}, id {direction} LIMIT ?"
+            )
+    return queries
+
+
+SQL_USERS_PAGE = _page_sql("users", "json_extract(data, '$.createdAt')")
+SQL_GROUPS_PAGE = _page_sql("groups", "created_at")
+SQL_ACTIVE_ROOMS_PAGE = _page_sql("rooms", "created_at", "created_at >= ? AND created_at < ?")
+
+# 연결별 statement cache 크기 (위 SQL 문 수보다 넉넉하게)
+STATEMENT_CACHE_SIZE = 128
+
+
+def _dumps(record: dict) -> str:
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+
+
+def _loads(row) -> Optional[dict]:
+    return json.loads(row[0]) if row else None
+
+
+def _today_range() -> tuple:
+    """오늘 날짜의 createdAt 범위 [오늘, 내일) (ISO 문자열 비교, 인덱스 사용)"""
+    today = date.today()
+    return today.isoformat(), (today + timedelta(days=1)).isoformat()
+
+
+class SqliteLiveStats:
+    """
+    stats 테이블에 둔 /stats 카운터 (LiveStats와 같은 증감 메서드)
+    증감은 저장소의 쓰기 트랜잭션 안에서 호출되므로 레코드 변경과 함께 커밋/롤백됩니다.
+    """
+
+    def __init__(self, store: "SqliteDataStore"):
+        self._store = store
+
+    def _add(self, change: Callable[[LiveStats], None]):
+        delta = LiveStats()
+        change(delta)
+        rows = delta.rows()
+        if rows:
+            with self._store._transaction() as conn:
+                conn.executemany(SQL_ADD_STAT, rows)
+
+    def waiting_added(self, request):
+        self._add(lambda delta: delta.waiting_added(request))
+
+    def waiting_removed(self, request):
+        self._add(lambda delta: delta.waiting_removed(request))
+
+    def group_added(self, group: dict):
+        self._add(lambda delta: delta.group_added(group))
+
+    def group_removed(self, group: dict):
+        self._add(lambda delta: delta.group_removed(group))
+
+    def rooms_changed(self, delta: int):
+        self._add(lambda stats: stats.rooms_changed(delta))
+
+    def reset(self, stats: LiveStats):
+        """카운터 전체를 다시 쓰기 (시작 시 테이블이 비어 있을 때)"""
+        with self._store._transaction() as conn:
+            conn.execute(SQL_DELETE_STATS)
+            conn.executemany(SQL_ADD_STAT, stats.rows())
+
+    def is_empty(self) -> bool:
+        return self._store._conn().execute(SQL_COUNT_STAT_ROWS).fetchone()[0] == 0
+
+    def snapshot(self) -> dict:
+        return LiveStats.from_rows(self._store._conn().execute(SQL_SELECT_STATS)).snapshot()
+
+
+class SqliteVersions:
+    """
+    versions 테이블에 둔 ETag 버전 (Versions와 같은 bump 메서드)
+    bump는 저장소의 쓰기 트랜잭션 안에서 호출되므로 레코드 변경과 함께 커밋/롤백됩니다.
+    """
+
+    def __init__(self, store: "SqliteDataStore"):
+        self._store = store
+        with store._transaction() as conn:
+            conn.execute(SQL_SET_VERSION, ("epoch", secrets.randbits(32)))
+
+    def bump(self, collection: str, user_ids: Iterable[str] = ()):
+        """시계를 하나 올리고 컬렉션 + 관련 유저들의 버전으로 기록"""
+        with self._store._transaction() as conn:
+            clock = conn.execute(SQL_TICK_CLOCK).fetchone()[0]
+            conn.executemany(SQL_SET_VERSION, [(f"collection:{collection}", clock)] + [
+                (f"user:{user_id}", clock) for user_id in set(user_ids) if user_id
+            ])
+
+    def bump_all_users(self, collection: str):
+        """레코드를 일괄 삭제해서 누구의 화면이 바뀌었는지 모를 때"""
+        with self._store._transaction() as conn:
+            clock = conn.execute(SQL_TICK_CLOCK).fetchone()[0]
+            conn.execute(SQL_DELETE_USER_VERSIONS)
+            conn.executemany(SQL_SET_VERSION, [(f"collection:{collection}", clock), ("all_users", clock)])
+
+    @staticmethod
+    def _format(row) -> str:
+        return f"{row[0]:08x}.{row[1]}"
+
+    def of(self, *collections: str) -> str:
+        """컬렉션들의 현재 버전 ("epoch.version", 여러 개면 가장 최근 것)"""
+        sql = _collection_version_sql(len(collections))
+        return self._format(self._store._conn().execute(sql, [f"collection:{c}" for c in collections]).fetchone())
+
+    def of_user(self, user_id: str) -> str:
+        """유저별 화면의 현재 버전 ("epoch.version")"""
+        return self._format(self._store._conn().execute(SQL_SELECT_USER_VERSION, (f"user:{user_id}",)).fetchone())
+
+
+class SqliteDataStore(DataStore):
+    """
+    SQLite(WAL) 데이터 저장소
+    app/core/config.py의 DATA_STORE_BACKEND = "sqlite"일 때 사용됩니다.
+    """
+
+    def __init__(self, path: str):
+        self._path = path
+        self._process_lock = self._lock_database_file(path)
+        self._local = threading.local()
+        self._tx_depth = 0
+        self._tx_owner: Optional[int] = None
+        self._writer = self._connect()
+        with self._writer:
+            self._migrate()
+            self._writer.executescript(SCHEMA)
+            self._writer.execute("CREATE INDEX IF NOT EXISTS idx_sessions_expires_at ON sessions(expires_at)")
+        super().__init__()
+        self._restore_waiting_users()
+        self._stats = SqliteLiveStats(self)
+        if self._stats.is_empty():
+            self._stats.reset(self._count_stats())
+        self._versions = SqliteVersions(self)
+
+    # ============ 연결 / 트랜잭션 ============
+    @staticmethod
+    def _lock_database_file(path: str):
+        """
+        DB 파일을 이 프로세스 전용으로 (path + ".lock"에 배타적 flock, 프로세스가 끝나면 OS가 해제)
+        다른 워커/인스턴스가 같은 파일을 열고 있으면 각자 다른 대기열을 보게 되므로 시작을 막습니다.
+        """
+        if not FCNTL_AVAILABLE or path == ":memory:":
+            return None
+        lock_file = open(f"{path}.lock", "a")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            raise RuntimeError(
+                f"다른 프로세스가 SQLite DB({path})를 사용 중입니다. "
+                "sqlite 저장소는 워커 1개로만 실행할 수 있습니다 (WEB_CONCURRENCY=1, --workers 1)."
+            )
+        return lock_file
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self._path, check_same_thread=False, isolation_level=None,
+            cached_statements=STATEMENT_CACHE_SIZE,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")  # WAL에서는 커밋마다 fsync하지 않아도 안전
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
+    def _migrate(self):
+        """이전 스키마 DB 갱신: 만료 시각이 없던 세션은 지금부터 SESSION_TTL_SECONDS 유지"""
+        columns = [row[1] for row in self._writer.execute("PRAGMA table_info(sessions)")]
+        if columns and "expires_at" not in columns:
+            self._writer.execute(
+                f"ALTER TABLE sessions ADD COLUMN expires_at REAL NOT NULL DEFAULT {time.time() + SESSION_TTL_SECONDS}"
+            )
+
+    def _conn(self) -> sqlite3.Connection:
+        """현재 스레드가 쓰기 트랜잭션 중이면 쓰기 연결(미커밋 내용 조회), 아니면 스레드별 읽기 연결"""
+        if self._tx_owner == threading.get_ident():
+            return self._writer
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = self._connect()
+        return conn
+
+    @contextmanager
+    def _transaction(self):
+        """쓰기 트랜잭션 (중첩 시 가장 바깥에서 한 번만 커밋)"""
+        with self._lock:
+            if self._tx_depth == 0:
+                self._writer.execute("BEGIN IMMEDIATE")
+                self._tx_owner = threading.get_ident()
+            self._tx_depth += 1
+            try:
+                yield self._writer
+            except BaseException:
+                self._tx_depth -= 1
+                if self._tx_depth == 0:
+                    self._tx_owner = None
+                    self._writer.execute("ROLLBACK")
+                raise
+            self._tx_depth -= 1
+            if self._tx_depth == 0:
+                self._tx_owner = None
+                self._writer.execute("COMMIT")
+
+    def _fetch_one(self, sql: str, params: tuple = ()) -> Optional[dict]:
+        return _loads(self._conn().execute(sql, params).fetchone())
+
+    def _fetch_all(self, sql: str, params: tuple = ()) -> List[dict]:
+        return [json.loads(row[0]) for row in self._conn().execute(sql, params)]
+
+    def close(self):
+        """쓰기 연결 종료 + DB 파일 잠금 해제 (스레드별 읽기 연결은 스레드 종료 시 정리)"""
+        self._writer.close()
+        if self._process_lock is not None:
+            self._process_lock.close()
+            self._process_lock = None
+
+    # ============ 유저 관련 ============
+    def increment_match_count(self, user_id: str) -> Optional[dict]:
+        """유저 매칭 횟수 증가"""
+        with self._transaction() as conn:
+            user = self.get_user_by_id(user_id)
+            if user:
+                user["matchCount"] = user.get("matchCount", 0) + 1
+                conn.execute(SQL_UPDATE_USER, (_dumps(user), user_id))
+            return user
+
+    def get_all_users(self) -> List[dict]:
+        """모든 유저 조회 (비밀번호 제외)"""
+        return [
+            {k: v for k, v in u.items() if k != "password"}
+            for u in self._fetch_all(SQL_SELECT_USERS)
+        ]
+
+    def _fetch_page(self, queries: dict, params: tuple, after: Optional[tuple], limit: int,
+                    descending: bool) -> Tuple[List[dict], bool]:
+        """키셋 페이지 조회: limit + 1개를 읽어서 다음 페이지 여부 판단"""
+        sql = queries[(descending, after is not None)]
+        records = self._fetch_all(sql, (*params, *(after or ()), limit + 1))
+        return records[:limit], len(records) > limit
+
+    def get_users_page(self, after: Optional[tuple], limit: int,
+                       descending: bool = False) -> Tuple[List[dict], bool]:
+        """(createdAt, id) 순 유저 한 페이지 (비밀번호 제외) + 다음 페이지 여부"""
+        users, has_more = self._fetch_page(SQL_USERS_PAGE, (), after, limit, descending)
+        return [{k: v for k, v in u.items() if k != "password"} for u in users], has_more
+
+    def get_user_by_id(self, user_id: str) -> Optional[dict]:
+        """ID로 유저 조회"""
+        return self._fetch_one(SQL_SELECT_USER, (user_id,))
+
+    def get_user_by_username(self, username: str) -> Optional[dict]:
+        """username으로 유저 조회"""
+        return self._fetch_one(SQL_SELECT_USER_BY_USERNAME, (username,))
+
+    def _index_user(self, user: dict):
+        """유저 저장 (기본 계정처럼 이미 있는 username이면 무시)"""
+        with self._transaction() as conn:
+            conn.execute(SQL_INSERT_USER, (user["id"], user["username"], _dumps(user)))
+
+    def user_exists(self, username: str) -> bool:
+        """유저 존재 여부 확인"""
+        return self._conn().execute(SQL_USER_EXISTS, (username,)).fetchone() is not None
+
+    # ============ 세션 관련 ============
+    def create_session(self, token: str, user_id: str, ttl_seconds: float = SESSION_TTL_SECONDS):
+        """세션 생성"""
+        with self._transaction() as conn:
+            conn.execute(SQL_INSERT_SESSION, (token, user_id, time.time() + ttl_seconds))
+
+    def get_session(self, token: str) -> Optional[str]:
+        """세션에서 user_id 조회 (만료된 세션은 없는 것으로 봄, 삭제는 주기적 정리에서)"""
+        row = self._conn().execute(SQL_SELECT_SESSION, (token, time.time())).fetchone()
+        return row[0] if row else None
+
+    def delete_session(self, token: str):
+        """세션 삭제"""
+        with self._transaction() as conn:
+            conn.execute(SQL_DELETE_SESSION, (token,))
+
+    def delete_user_sessions(self, user_id: str):
+        """특정 유저의 모든 세션 삭제 (user_id 인덱스)"""
+        with self._transaction() as conn:
+            conn.execute(SQL_DELETE_USER_SESSIONS, (user_id,))
+
+    def sweep_expired_sessions(self, now: Optional[float] = None) -> int:
+        """만료된 세션과 폐기 목록 항목 정리 (expires_at 인덱스), 삭제한 세션 수 반환"""
+        now = time.time() if now is None else now
+        with self._transaction() as conn:
+            deleted = conn.execute(SQL_SWEEP_SESSIONS, (now,)).rowcount
+            conn.execute(SQL_SWEEP_REVOKED_TOKENS, (now,))
+            conn.execute(SQL_SWEEP_REVOKED_USERS, (now,))
+        return deleted
+
+    def count_sessions(self) -> int:
+        """저장된 세션 수 (만료됐지만 아직 정리되지 않은 세션 포함)"""
+        return self._conn().execute(SQL_COUNT_SESSIONS).fetchone()[0]
+
+    # ============ 서명 토큰 폐기 목록 ============
+    def revoke_token(self, token_id: str, expires_at: float):
+        """서명 토큰 1개 폐기 (로그아웃, 재시작 후에도 DB로 확인)"""
+        with self._transaction() as conn:
+            conn.execute(SQL_INSERT_REVOKED_TOKEN, (token_id, expires_at))
+
+    def revoke_user_tokens(self, user_id: str, issued_before: float, expires_at: float):
+        """issued_before 전에 발급된 유저의 서명 토큰 모두 폐기 (새 로그인)"""
+        with self._transaction() as conn:
+            conn.execute(SQL_INSERT_REVOKED_USER, (user_id, issued_before, expires_at))
+
+    def is_token_revoked(self, token_id: str, user_id: str, issued_at: float) -> bool:
+        """서명 토큰이 폐기됐는지"""
+        return bool(self._conn().execute(SQL_SELECT_REVOKED, (token_id, user_id, issued_at)).fetchone()[0])
+
+    # ============ 매칭 대기열 관련 ============
+    def _restore_waiting_users(self):
+        """시작 시 DB의 대기 요청으로 메모리 버킷 복원 (stats/versions 테이블로 바꾸기 전이라 메모리 카운터에만 반영)"""
+        for data in self._fetch_all(SQL_SELECT_WAITING):
+            DataStore.add_waiting_user(self, WaitingRequest.from_dict(data))
+
+    def add_waiting_user(self, request: WaitingRequest) -> WaitingRequest:
+        """대기열에 유저 추가 (DB에는 to_dict 형식 JSON)"""
+        with self._transaction() as conn:
+            conn.execute(SQL_INSERT_WAITING, (request.id, request.user_id, _dumps(request.to_dict())))
+            return super().add_waiting_user(request)
+
+    def _pop_waiting_user(self, request_id: str) -> Optional[tuple]:
+        """대기열에서 제거하고 버킷 키 반환 (self._lock 안에서 호출, DB 삭제 + 통계를 한 트랜잭션으로)"""
+        if request_id not in self._waiting_users:
+            return None
+        with self._transaction() as conn:
+            conn.execute(SQL_DELETE_WAITING, (request_id,))
+            return super()._pop_waiting_user(request_id)
+
+    # ============ 그룹 관련 ============
+    def get_all_groups(self) -> List[dict]:
+        """모든 그룹 조회"""
+        return self._fetch_all(SQL_SELECT_GROUPS)
+
+    def get_groups_page(self, after: Optional[tuple], limit: int,
+                        descending: bool = False) -> Tuple[List[dict], bool]:
+        """(createdAt, id) 순 그룹 한 페이지 + 다음 페이지 여부"""
+        return self._fetch_page(SQL_GROUPS_PAGE, (), after, limit, descending)
+
+    def get_group_by_id(self, group_id: str) -> Optional[dict]:
+        """ID로 그룹 조회"""
+        return self._fetch_one(SQL_SELECT_GROUP, (group_id,))
+
+    def get_group_by_member_id(self, member_id: str) -> Optional[dict]:
+        """멤버 ID(매칭 요청 ID)로 그룹 조회"""
+        return self._fetch_one(SQL_SELECT_GROUP_BY_MEMBER, (member_id,))
+
+    def create_group(self, group_data: dict, claim_request_ids: Optional[List[str]] = None) -> Optional[dict]:
+        """
+        그룹 생성
+        그룹 + 멤버 + 대기열 제거를 한 트랜잭션으로 커밋합니다.
+        claim 동작은 DataStore.create_group과 같고,
+        통계/버전은 같은 트랜잭션에서 갱신하되 메모리 대기열은 커밋한 뒤에 빼므로 상태 조회에서 not_found가 보이지 않습니다.
+        """
+        claim_request_ids = list(dict.fromkeys(claim_request_ids or []))
+        with self._lock:
+            if any(request_id not in self._waiting_users for request_id in claim_request_ids):
+                return None
+            group = {
+                "id": generate_id(),
+                **group_data,
+                "createdAt": datetime.now().isoformat(),
+            }
+            with self._transaction() as conn:
+                self._apply_retention(group["createdAt"][:10])
+                conn.execute(SQL_INSERT_GROUP, (group["id"], group["createdAt"], _dumps(group)))
+                conn.executemany(SQL_INSERT_GROUP_MEMBER, [
+                    (member["id"], group["id"], member.get("userId"))
+                    for member in group.get("members", [])
+                ])
+                conn.executemany(SQL_DELETE_WAITING, [(request_id,) for request_id in claim_request_ids])
+                self._stats.group_added(group)
+                self._versions.bump(GROUPS, group_user_ids(group))
+                claimed = [self._waiting_users[request_id] for request_id in claim_request_ids]
+                for request in claimed:
+                    self._stats.waiting_removed(request)
+                if claimed:
+                    self._versions.bump(WAITING, [request.user_id for request in claimed])
+            for request_id in claim_request_ids:
+                self._unindex_waiting_user(request_id)
+            keys = {request.bucket_key for request in claimed}
+        for key in keys:
+            self._notify_waiting_change(key)
+        return group
+
+    def get_user_active_group(self, user_id: str) -> Optional[dict]:
+        """유저가 참여 중인 활성 그룹 조회 (오늘 날짜 기준)"""
+        return self._fetch_one(SQL_SELECT_ACTIVE_GROUP_BY_USER, (user_id, user_id, *_today_range()))
+
+    # ============ 점심방 관련 ============
+    def get_all_rooms(self) -> List[dict]:
+        """모든 점심방 조회"""
+        return self._fetch_all(SQL_SELECT_ROOMS)
+
+    def get_open_rooms(self) -> List[dict]:
+        """열린 점심방만 조회"""
+        return [r for r in self._fetch_all(SQL_SELECT_OPEN_ROOMS) if len(r["members"]) < r["maxCount"]]
+
+    def get_all_active_rooms(self) -> List[dict]:
+        """열린 방 + 매칭 완료된 방 모두 조회 (오늘 날짜 기준)"""
+        return self._fetch_all(SQL_SELECT_ROOMS_BETWEEN, _today_range())
+
+    def get_active_rooms_page(self, after: Optional[tuple], limit: int,
+                              descending: bool = False) -> Tuple[List[dict], bool]:
+        """오늘 생성된 방 (createdAt, id) 순 한 페이지 + 다음 페이지 여부"""
+        return self._fetch_page(SQL_ACTIVE_ROOMS_PAGE, _today_range(), after, limit, descending)
+
+    def get_user_rooms(self, user_id: str) -> List[dict]:
+        """특정 유저가 참여 중인 방 조회"""
+        return self._fetch_all(SQL_SELECT_USER_ROOMS, (user_id,))
+
+    def get_user_active_room(self, user_id: str) -> Optional[dict]:
+        """유저가 참여 중인 활성 방 조회 (오늘 날짜 기준)"""
+        return self._fetch_one(SQL_SELECT_ACTIVE_ROOM_BY_USER, (user_id, *_today_range()))
+
+    def get_room_by_id(self, room_id: str) -> Optional[dict]:
+        """ID로 점심방 조회"""
+        return self._fetch_one(SQL_SELECT_ROOM, (room_id,))
+
+    @staticmethod
+    def _room_member_rows(room: dict) -> List[tuple]:
+        return [(room["id"], m["id"]) for m in room.get("members", []) if m.get("id")]
+
+    def create_room(self, room_data: dict) -> dict:
+        """점심방 생성"""
+        room = {
+            "id": generate_id(),
+            **room_data,
+            "createdAt": datetime.now().isoformat(),
+        }
+        with self._lock:
+            with self._transaction() as conn:
+                self._apply_retention(room["createdAt"][:10])
+                conn.execute(SQL_INSERT_ROOM, (room["id"], room["createdAt"], room.get("status"), _dumps(room)))
+                conn.executemany(SQL_INSERT_ROOM_MEMBER, self._room_member_rows(room))
+                self._stats.rooms_changed(1)
+                self._versions.bump(ROOMS, room_user_ids(room))
+        return room
+
+    def update_room(self, room_id: str, updates: dict) -> Optional[dict]:
+        """점심방 업데이트 (members가 바뀌면 멤버 인덱스도 갱신)"""
+        with self._transaction() as conn:
+            room = self.get_room_by_id(room_id)
+            if room:
+                members_before = room_user_ids(room)
+                room.update(updates)
+                conn.execute(SQL_UPDATE_ROOM, (room.get("status"), _dumps(room), room_id))
+                if "members" in updates:
+                    conn.execute(SQL_DELETE_ROOM_MEMBERS, (room_id,))
+                    conn.executemany(SQL_INSERT_ROOM_MEMBER, self._room_member_rows(room))
+                self._versions.bump(ROOMS, members_before | room_user_ids(room))
+            return room
+
+    def delete_room(self, room_id: str):
+        """점심방 삭제"""
+        with self._lock:
+            with self._transaction() as conn:
+                room = self.get_room_by_id(room_id)
+                deleted = conn.execute(SQL_DELETE_ROOM, (room_id,)).rowcount
+                conn.execute(SQL_DELETE_ROOM_MEMBERS, (room_id,))
+                self._stats.rooms_changed(-deleted)
+                if deleted:
+                    self._versions.bump(ROOMS, room_user_ids(room))
+
+    # ============ 날짜별 파티션 보관 기간 ============
+    def evict_expired_partitions(self, today: Optional[date] = None) -> dict:
+        """PARTITION_RETENTION_DAYS(오늘 포함)보다 오래된 그룹/점심방 행 삭제 (created_at 인덱스 범위 삭제)"""
+        today = today or date.today()
+        cutoff = (today - timedelta(days=PARTITION_RETENTION_DAYS - 1)).isoformat()
+        with self._lock:
+            with self._transaction() as conn:
+                # 통계 카운터에서 뺄 멤버 수를 알아야 하므로 삭제 전에 읽어둠 (하루 한 번)
+                evicted = [json.loads(row[0]) for row in conn.execute(SQL_SELECT_GROUPS_BEFORE, (cutoff,))]
+                conn.execute(SQL_EVICT_GROUP_MEMBERS, (cutoff,))
+                groups = conn.execute(SQL_EVICT_GROUPS, (cutoff,)).rowcount
+                conn.execute(SQL_EVICT_ROOM_MEMBERS, (cutoff,))
+                rooms = conn.execute(SQL_EVICT_ROOMS, (cutoff,)).rowcount
+                for group in evicted:
+                    self._stats.group_removed(group)
+                self._stats.rooms_changed(-rooms)
+                self._bump_evicted(groups, rooms)
+        return {"groups": groups, "rooms": rooms}
+
+    def get_partition_stats(self) -> List[dict]:
+        """보관 중인 날짜별 그룹/점심방 수와 저장된 데이터 크기(bytes)"""
+        conn = self._conn()
+        stats: Dict[str, dict] = {}
+        for kind, sql in (("groups", SQL_GROUP_PARTITION_STATS), ("rooms", SQL_ROOM_PARTITION_STATS)):
+            for day, count, size in conn.execute(sql):
+                entry = stats.setdefault(day, {"day": day, "groups": 0, "rooms": 0, "bytes": 0})
+                entry[kind] = count
+                entry["bytes"] += size or 0
+        return [stats[day] for day in sorted(stats)]
+
+    # ============ 버전 (ETag) ============
+    @contextmanager
+    def read_snapshot(self):
+        """버전 조회와 본문 조회를 읽기 연결의 한 트랜잭션에서 (같은 WAL 스냅샷, 그 사이의 커밋은 보이지 않음)"""
+        conn = self._conn()
+        if conn is self._writer or conn.in_transaction:
+            yield
+            return
+        conn.execute("BEGIN")
+        try:
+            yield
+        finally:
+            conn.execute("COMMIT")
+
+    def get_version(self, *collections: str) -> str:
+        """컬렉션 목록/통계 화면의 버전 (versions 테이블)"""
+        return self._versions.of(*collections)
+
+    def get_user_version(self, user_id: str) -> str:
+        """유저별 화면(내 방 목록, 활성 상태)의 버전 (versions 테이블)"""
+        return self._versions.of_user(user_id)
+
+    # ============ 통계 관련 ============
+    def get_stats(self) -> dict:
+        """통계 데이터 조회 (stats 테이블, 쓰기와 같은 트랜잭션에서 갱신된 값)"""
+        return self._stats.snapshot()
+
+    def _count_stats(self) -> LiveStats:
+        """DB의 그룹/점심방 + 메모리 대기열을 세어서 통계 카운터 생성"""
+        with self._lock:
+            return LiveStats.recount(
+                self._waiting_users.values(),
+                self._fetch_all(SQL_SELECT_GROUPS),
+                self._conn().execute(SQL_COUNT_ROOMS).fetchone()[0],
+            )
+
+    def recount_stats(self) -> dict:
+        """저장된 레코드를 전부 다시 세어서 만든 통계 (카운터 검증용)"""
+        return self._count_stats().snapshot()
@@ -0,0 +1,57 @@
+"""
+저장소 버전 카운터 (ETag / 조건부 GET용)
+컬렉션(대기열/그룹/점심방)과 유저별 화면(내 방 목록, 활성 상태)마다
+쓰기가 있을 때 올라가는 버전을 유지합니다.
+버전은 하나의 단조 증가 시계에서 받으므로 여러 컬렉션에 걸친 화면은 최댓값 하나로 비교할 수 있고,
+프로세스마다 다른 epoch를 붙여서 재시작 전에 받은 ETag와 섞이지 않습니다.
+저장소의 self._lock 안에서만 갱신합니다.
+"""
+import secrets
+from typing import Dict, Iterable
+
+WAITING = "waiting"
+GROUPS = "groups"
+ROOMS = "rooms"
+
+
+class Versions:
+    """컬렉션별 / 유저별 버전"""
+
+    def __init__(self):
+        self.epoch = secrets.token_hex(4)
+        self._clock = 0
+        self._collections: Dict[str, int] = {}
+        self._users: Dict[str, int] = {}
+        self._all_users = 0  # 모든 유저 화면이 바뀐 시점 (보관 기간 삭제)
+
+    def bump(self, collection: str, user_ids: Iterable[str] = ()):
+        """컬렉션 + 관련 유저들의 버전 올리기"""
+        self._clock += 1
+        self._collections[collection] = self._clock
+        for user_id in user_ids:
+            if user_id:
+                self._users[user_id] = self._clock
+
+    def bump_all_users(self, collection: str):
+        """레코드를 일괄 삭제해서 누구의 화면이 바뀌었는지 모를 때"""
+        self.bump(collection)
+        self._all_users = self._clock
+        self._users.clear()
+
+    def of(self, *collections: str) -> int:
+        """컬렉션들의 현재 버전 (여러 개면 가장 최근 것)"""
+        return max(self._collections.get(collection, 0) for collection in collections)
+
+    def of_user(self, user_id: str) -> int:
+        """유저별 화면의 현재 버전"""
+        return max(self._users.get(user_id, 0), self._all_users)
+
+
+def room_user_ids(*rooms: dict) -> set:
+    """점심방 멤버 유저 ID"""
+    return {member.get("id") for room in rooms if room for member in room.get("members", [])}
+
+
+def group_user_ids(group: dict) -> set:
+    """그룹 멤버 유저 ID (멤버 id는 매칭 요청 ID라서 userId 사용)"""
+    return {member.get("userId") for member in group.get("members", [])}
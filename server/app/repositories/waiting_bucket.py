@@ -0,0 +1,108 @@
+"""
+매칭 대기열 버킷
+같은 (timeSlot, priceRange, menu) 대기 요청(WaitingRequest)을 모아두고
+성별 / 직급 / 나이대 보조 인덱스로 후보를 좁혀줍니다 (성별/직급 키는 코드).
+"""
+from typing import Optional, List, Dict, Iterable
+
+from ..core.config import SIMILAR_AGE_RANGE
+from .waiting_request import WaitingRequest
+
+# 나이대 인덱스 폭
+AGE_BAND_WIDTH = SIMILAR_AGE_RANGE
+
+
+class WaitingBucket:
+    """
+    대기 순서(FIFO)를 유지하는 버킷 + 보조 인덱스
+    값이 없는 요청(성별/나이/직급 미입력)은 None 키에 저장합니다 (코드 0 → None).
+    조건 체크에서 값이 없으면 통과하므로 후보 조회 시 항상 함께 포함됩니다.
+    """
+
+    def __init__(self):
+        self._members: Dict[str, WaitingRequest] = {}  # 매칭 요청 ID -> 요청 (대기 순서)
+        self._seq: Dict[str, int] = {}       # 매칭 요청 ID -> 대기 순번
+        self._next_seq = 0
+        self._by_gender: Dict[Optional[int], Dict[str, WaitingRequest]] = {}
+        self._by_level: Dict[Optional[int], Dict[str, WaitingRequest]] = {}
+        self._by_age_band: Dict[Optional[int], Dict[str, WaitingRequest]] = {}
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __contains__(self, request_id: str) -> bool:
+        return request_id in self._members
+
+    def values(self) -> List[WaitingRequest]:
+        """버킷의 모든 요청 (대기 순서)"""
+        return list(self._members.values())
+
+    @staticmethod
+    def _age_band(age) -> Optional[int]:
+        return age // AGE_BAND_WIDTH if age else None
+
+    def _index_keys(self, request: WaitingRequest):
+        return (
+            (self._by_gender, request.gender or None),
+            (self._by_level, request.level or None),
+            (self._by_age_band, self._age_band(request.age)),
+        )
+
+    def add(self, request: WaitingRequest):
+        """요청 추가"""
+        request_id = request.id
+        self._members[request_id] = request
+        self._seq[request_id] = self._next_seq
+        self._next_seq += 1
+        for index, key in self._index_keys(request):
+            index.setdefault(key, {})[request_id] = request
+
+    def remove(self, request_id: str) -> Optional[WaitingRequest]:
+        """요청 제거"""
+        request = self._members.pop(request_id, None)
+        if not request:
+            return None
+        del self._seq[request_id]
+        for index, key in self._index_keys(request):
+            entries = index.get(key)
+            if entries is not None:
+                entries.pop(request_id, None)
+                if not entries:
+                    del index[key]
+        return request
+
+    @staticmethod
+    def _collect(index: Dict, keys: Iterable) -> List[Dict[str, WaitingRequest]]:
+        """keys(+ 값 없음 None)에 해당하는 인덱스 항목들"""
+        return [index[k] for k in {*keys, None} if k in index]
+
+    def candidates(self, gender: int = 0, levels: Optional[List[int]] = None,
+                   age_range: Optional[tuple] = None) -> List[WaitingRequest]:
+        """
+        조건으로 좁힌 후보 목록 (대기 순서)
+        - gender: 같은 성별만 (코드)
+        - levels: 허용 직급 코드 목록
+        - age_range: (최소 나이, 최대 나이)
+        주어진 조건 중 가장 후보가 적은 인덱스 하나로 좁히고,
+        정확한 조건 체크는 호출 측(check_mutual_match)에서 수행합니다.
+        """
+        narrowed = []
+        if gender:
+            narrowed.append(self._collect(self._by_gender, [gender]))
+        if levels:
+            narrowed.append(self._collect(self._by_level, levels))
+        if age_range:
+            low, high = age_range
+            bands = range(low // AGE_BAND_WIDTH, high // AGE_BAND_WIDTH + 1)
+            narrowed.append(self._collect(self._by_age_band, bands))
+
+        if not narrowed:
+            return list(self._members.values())
+
+        smallest = min(narrowed, key=lambda parts: sum(len(p) for p in parts))
+        if len(smallest) == 1:
+            return list(smallest[0].values())
+        seq = self._seq
+        merged = [r for part in smallest for r in part.values()]
+        merged.sort(key=lambda r: seq[r.id])
+        return merged
@@ -0,0 +1,223 @@
+"""
+매칭 대기 요청 레코드
+join_match가 만드는 대기 요청을 dict 대신 __slots__ 객체로 보관합니다.
+- 성별 / 직급 / 시간대 / 가격대 / 메뉴: 값마다 한 번만 등록되는 정수 코드 (0 = 값 없음)
+- 선호 조건: 비트마스크 (완화 순서: 성별 → 나이 → 직급)
+- 참여 시각: time.time() 기준 float
+- 완화 단계별 남은 조건 마스크 + 받아들이는 직급 마스크: 생성 시 한 번만 계산
+매칭 판단과 버킷 인덱스는 코드/비트만 비교하고,
+API 응답 / 그룹 멤버 / SQLite 저장 같은 경계에서만 to_dict()로 기존 JSON 형식을 만듭니다.
+코드는 프로세스 안에서만 쓰는 값이라 저장하지 않습니다 (저장은 항상 to_dict 형식).
+"""
+import sys
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+from ..core.config import LEVEL_GROUPS
+
+# 선호 조건 비트 (완화 순서대로)
+SAME_GENDER = 1
+SIMILAR_AGE = 2
+SAME_LEVEL = 4
+PREFERENCE_BITS = {"sameGender": SAME_GENDER, "similarAge": SIMILAR_AGE, "sameLevel": SAME_LEVEL}
+RELAXATION_STEPS = len(PREFERENCE_BITS)  # 완화 단계가 이 이상이면 남은 조건 없음
+
+
+class CodeTable:
+    """
+    문자열 값 <-> 정수 코드 (0 = 값 없음)
+    처음 보는 값은 뒤에 새 코드로 추가합니다 (값 문자열은 intern해서 레코드끼리 공유).
+    """
+
+    def __init__(self, values: Iterable[str] = ()):
+        self.names: List[Optional[str]] = [None]
+        self._codes: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        for value in values:
+            self.code(value)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def code(self, value: Optional[str]) -> int:
+        if not value:
+            return 0
+        code = self._codes.get(value)
+        if code is None:
+            with self._lock:
+                code = self._codes.get(value)
+                if code is None:
+                    code = len(self.names)
+                    self.names.append(sys.intern(value))  # names를 먼저 늘려서 코드로 조회할 때 항상 있도록
+                    self._codes[value] = code
+        return code
+
+    def name(self, code: int) -> Optional[str]:
+        return self.names[code]
+
+
+GENDERS = CodeTable()
+LEVELS = CodeTable(level for row in LEVEL_GROUPS for level in row)
+TIME_SLOTS = CodeTable()
+PRICE_RANGES = CodeTable()
+MENUS = CodeTable()
+
+
+def _level_compatibility() -> List[int]:
+    """
+    직급 코드 -> 받아들이는 직급 코드 비트마스크 (LEVEL_GROUPS에 있는 직급만)
+    이전 직급 비교와 같은 규칙: 직급이 처음 나오는 LEVEL_GROUPS 행이 받아들이는 직급 목록
+    (그래서 비대칭일 수 있음, 예: staff는 manager를 받지 않지만 manager는 staff를 받음)
+    """
+    table = [0] * len(LEVELS)
+    for row in LEVEL_GROUPS:
+        row_mask = 0
+        for level in row:
+            row_mask |= 1 << LEVELS.code(level)
+        for level in row:
+            code = LEVELS.code(level)
+            if not table[code]:
+                table[code] = row_mask
+    return table
+
+
+LEVEL_COMPATIBILITY = _level_compatibility()
+
+
+def level_accepts(code: int) -> int:
+    """직급 코드가 받아들이는 직급 코드 비트마스크 (LEVEL_GROUPS에 없는 직급은 자기 자신만)"""
+    if code < len(LEVEL_COMPATIBILITY):
+        return LEVEL_COMPATIBILITY[code]
+    return 1 << code
+
+
+def similar_level_codes(code: int) -> List[int]:
+    """직급 코드가 받아들이는 직급 코드 목록 (버킷 인덱스 조회용)"""
+    mask = level_accepts(code)
+    return [c for c in range(mask.bit_length()) if mask >> c & 1]
+
+
+_condition_masks: Dict[tuple, tuple] = {}
+
+
+def compile_condition_masks(preferences: int, gender: int, age: int, level: int) -> tuple:
+    """
+    완화 단계별 남은 조건 비트마스크 (인덱스 = 완화 단계, 길이 RELAXATION_STEPS)
+    완화 순서대로 앞에서부터 선택된 조건을 하나씩 빼고,
+    자기 값이 없는 조건은 처음부터 뺍니다 (값이 없으면 조건 체크 통과).
+    조합이 64가지뿐이라 같은 마스크 tuple을 레코드끼리 공유합니다.
+    """
+    present = (SAME_GENDER if gender else 0) | (SIMILAR_AGE if age else 0) | (SAME_LEVEL if level else 0)
+    key = (preferences, present)
+    masks = _condition_masks.get(key)
+    if masks is None:
+        bits = [bit for bit in PREFERENCE_BITS.values() if preferences & bit]
+        masks = tuple(sum(bits[step:]) & present for step in range(RELAXATION_STEPS))
+        masks = _condition_masks.setdefault(key, masks)
+    return masks
+
+
+def encode_preferences(preferences: Optional[dict]) -> int:
+    """{"sameGender": True, ...} -> 비트마스크"""
+    mask = 0
+    for key, bit in PREFERENCE_BITS.items():
+        if preferences and preferences.get(key):
+            mask |= bit
+    return mask
+
+
+def decode_preferences(mask: int) -> dict:
+    """비트마스크 -> Preferences 스키마 형식 dict"""
+    return {
+        "similarAge": bool(mask & SIMILAR_AGE),
+        "sameGender": bool(mask & SAME_GENDER),
+        "sameLevel": bool(mask & SAME_LEVEL),
+    }
+
+
+class WaitingRequest:
+    """대기 중인 매칭 요청 1건 (필드 값은 코드, 문자열이 필요하면 to_dict / bucket_key)"""
+
+    __slots__ = (
+        "id", "user_id", "name", "department", "gender", "age", "level",
+        "time_slot", "price_range", "menu", "preferences", "joined_at", "relaxation_level",
+        "condition_masks", "level_accepts",
+    )
+
+    def __init__(self, request_id: str, user_id: str, name: Optional[str], department: Optional[str],
+                 gender: int, age: int, level: int, time_slot: int, price_range: int, menu: int,
+                 preferences: int, joined_at: float, relaxation_level: int = 0):
+        self.id = request_id
+        self.user_id = user_id
+        self.name = name
+        self.department = department
+        self.gender = gender
+        self.age = age  # 0 = 값 없음
+        self.level = level
+        self.time_slot = time_slot
+        self.price_range = price_range
+        self.menu = menu
+        self.preferences = preferences
+        self.joined_at = joined_at
+        self.relaxation_level = relaxation_level
+        # 조건 체크용 (선호 조건/성별/나이/직급은 대기 중 바뀌지 않음)
+        self.condition_masks = compile_condition_masks(preferences, gender, age, level)
+        self.level_accepts = level_accepts(level)
+
+    @classmethod
+    def create(cls, request_id: str, user_id: str, name: Optional[str], department: Optional[str],
+               gender: Optional[str], age: Optional[int], level: Optional[str],
+               time_slot: str, price_range: str, menu: str, preferences: Optional[dict],
+               joined_at: Optional[float] = None, relaxation_level: int = 0) -> "WaitingRequest":
+        """API 값(문자열/dict)으로 레코드 생성"""
+        return cls(
+            request_id, user_id, name, department,
+            GENDERS.code(gender), age or 0, LEVELS.code(level),
+            TIME_SLOTS.code(time_slot), PRICE_RANGES.code(price_range), MENUS.code(menu),
+            encode_preferences(preferences),
+            time.time() if joined_at is None else joined_at,
+            relaxation_level,
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "WaitingRequest":
+        """to_dict 형식(저장된 JSON)에서 복원"""
+        try:
+            joined_at = datetime.fromisoformat(data["joinedAt"]).timestamp()
+        except (KeyError, TypeError, ValueError):
+            joined_at = None
+        return cls.create(
+            data["id"], data.get("userId"), data.get("name"), data.get("department"),
+            data.get("gender"), data.get("age"), data.get("level"),
+            data["timeSlot"], data["priceRange"], data["menu"], data.get("preferences"),
+            joined_at, data.get("relaxationLevel", 0),
+        )
+
+    def remaining_conditions(self, relaxation_level: int) -> int:
+        """완화 단계에서 남은 조건 비트마스크 (자기 값이 없는 조건 제외)"""
+        return self.condition_masks[relaxation_level] if relaxation_level < RELAXATION_STEPS else 0
+
+    @property
+    def bucket_key(self) -> tuple:
+        """대기열 버킷 키 (timeSlot, priceRange, menu) - DataStore.waiting_bucket_key와 같은 형식"""
+        return (TIME_SLOTS.names[self.time_slot], PRICE_RANGES.names[self.price_range], MENUS.names[self.menu])
+
+    def to_dict(self) -> dict:
+        """API / 그룹 멤버 / 저장용 JSON 형식"""
+        return {
+            "id": self.id,
+            "userId": self.user_id,
+            "name": self.name,
+            "department": self.department,
+            "gender": GENDERS.names[self.gender],
+            "age": self.age or None,
+            "level": LEVELS.names[self.level],
+            "timeSlot": TIME_SLOTS.names[self.time_slot],
+            "priceRange": PRICE_RANGES.names[self.price_range],
+            "menu": MENUS.names[self.menu],
+            "preferences": decode_preferences(self.preferences),
+            "joinedAt": datetime.fromtimestamp(self.joined_at).isoformat(),
+            "relaxationLevel": self.relaxation_level,
+        }
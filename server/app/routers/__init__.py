@@ -5,6 +5,7 @@ from .rooms import router as rooms_router
 from .users import router as users_router
 from .restaurants import router as restaurants_router
 from .stats import router as stats_router
+from .metrics import router as metrics_router
 
 __all__ = [
     "auth_router",
@@ -13,5 +14,6 @@ __all__ = [
     "users_router",
     "restaurants_router",
     "stats_router",
+    "metrics_router",
 ]
 
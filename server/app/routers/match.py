@@ -2,10 +2,16 @@
 매칭 API 라우터
 점심 매칭 관련 엔드포인트
 """
-from fastapi import APIRouter, Query
+from datetime import date
+
+from fastapi import APIRouter, Query, Request, Response
+from fastapi.responses import StreamingResponse
 
 from ..schemas import MatchJoinRequest, MatchCancelRequest
 from ..services import MatchService
+from ..repositories import data_store
+from ..core.conditional import make_etag, not_modified
+from ..core.profiler import tag_match_request
 
 router = APIRouter(prefix="/match", tags=["매칭"])
 
@@ -13,7 +19,7 @@ router = APIRouter(prefix="/match", tags=["매칭"])
 @router.post("/join")
 def join_match(request: MatchJoinRequest):
     """매칭 참여"""
-    return MatchService.join_match(
+    result = MatchService.join_match(
         user_id=request.userId,
         name=request.name,
         department=request.department,
@@ -25,28 +31,46 @@ def join_match(request: MatchJoinRequest):
         menu=request.menu,
         preferences=request.preferences.dict() if request.preferences else None,
     )
+    tag_match_request(result.get("matchRequestId") or result.get("matchRequest", {}).get("id"))
+    return result
 
 
 @router.get("/status")
 def get_match_status(
     matchRequestId: str = Query(...),
-    elapsedSeconds: int = Query(0)
+    elapsedSeconds: int = Query(0, deprecated=True),
 ):
-    """매칭 상태 확인 (점진적 조건 완화)"""
-    return MatchService.get_match_status(
-        match_request_id=matchRequestId,
-        elapsed_seconds=elapsedSeconds,
+    """
+    매칭 상태 확인 (점진적 조건 완화) - 스트림을 쓸 수 없는 클라이언트용 폴링
+    완화 단계는 서버 시각 기준이며 elapsedSeconds는 이전 클라이언트 호환용으로만 받습니다.
+    """
+    tag_match_request(matchRequestId)
+    return MatchService.get_match_status(match_request_id=matchRequestId)
+
+
+@router.get("/stream")
+async def stream_match_status(matchRequestId: str = Query(...)):
+    """매칭 상태 스트림 (SSE) - 대기 인원/완화 단계 변경 및 최종 결과 push"""
+    return StreamingResponse(
+        MatchService.stream_match_status(matchRequestId),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
 @router.delete("/cancel")
 def cancel_match(request: MatchCancelRequest):
     """매칭 취소"""
+    tag_match_request(request.matchRequestId)
     return MatchService.cancel_match(request.matchRequestId)
 
 
 @router.get("/active/{user_id}")
-def get_active_status(user_id: str):
+def get_active_status(user_id: str, request: Request, response: Response):
     """현재 활성 상태 확인 (매칭 대기/방 참여/그룹 참여)"""
+    # 오늘 방/그룹만 활성으로 보므로 날짜도 ETag에 포함
+    cached = not_modified(request, response, make_etag(date.today().isoformat(), data_store.get_user_version(user_id)))
+    if cached:
+        return cached
     return MatchService.get_user_active_status(user_id)
 
@@ -0,0 +1,39 @@
+"""
+운영 지표 API 라우터
+Prometheus가 긁어 가는 텍스트 형식 지표 엔드포인트
+"""
+import anyio.to_thread
+from fastapi import APIRouter, Response
+
+from ..repositories import data_store
+from ..core.metrics import (
+    registry, CONTENT_TYPE,
+    threadpool_busy, threadpool_size, threadpool_waiting,
+    waiting_queue_depth, match_wait, match_timeouts, match_timeout_ratio,
+)
+
+router = APIRouter(tags=["시스템"])
+
+
+def collect_snapshot():
+    """조회 시점 값으로 채우는 게이지 갱신 (스레드풀 제한 조회는 이벤트 루프에서 호출해야 함)"""
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    threadpool_busy.set(limiter.borrowed_tokens)
+    threadpool_size.set(limiter.total_tokens)
+    threadpool_waiting.set(limiter.statistics().tasks_waiting)
+
+    waiting_queue_depth.replace({
+        key: data_store.count_waiting_users_by_conditions(*key)
+        for key in data_store.get_waiting_bucket_keys()
+    })
+
+    timeouts = match_timeouts.total()
+    resolved = timeouts + match_wait.total_count()
+    match_timeout_ratio.set(timeouts / resolved if resolved else 0.0)
+
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics():
+    """Prometheus 텍스트 형식 지표 (이 워커 프로세스 기준)"""
+    collect_snapshot()
+    return Response(registry.render(), media_type=CONTENT_TYPE)
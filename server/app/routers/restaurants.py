@@ -2,37 +2,46 @@
 식당 API 라우터
 식당 조회 관련 엔드포인트
 """
-import random
 import httpx
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 
-from ..core.config import RESTAURANTS, KAKAO_REST_API_KEY
+from ..core.config import (
+    KAKAO_REST_API_KEY, KAKAO_LOCAL_SEARCH_URL,
+    NEARBY_CACHE_GEOHASH_PRECISION, NEARBY_CACHE_TTL_SECONDS, NEARBY_CACHE_STALE_SECONDS,
+    NEARBY_CACHE_MAX_ENTRIES, PLACE_CATALOG_GENERIC_KEYWORDS,
+)
+from ..core.http_client import http_client
+from ..core.async_cache import AsyncTTLCache
+from ..core.conditional import make_etag
+from ..core.read_views import read_views
+from ..core.utils import geohash_encode, geohash_decode
+from ..services.place_catalog import PlaceCatalog
+from ..services.place_crawler import place_catalog_refresher, kakao_document_to_place
+from ..services.restaurant_catalog import restaurant_catalog
 
 router = APIRouter(prefix="/restaurants", tags=["식당"])
 
+# 주변 맛집 검색 응답 캐시
+nearby_cache = AsyncTTLCache(
+    max_entries=NEARBY_CACHE_MAX_ENTRIES,
+    ttl_seconds=NEARBY_CACHE_TTL_SECONDS,
+    stale_seconds=NEARBY_CACHE_STALE_SECONDS,
+)
+
 
 @router.get("")
-def get_restaurants(menu: str = None, priceRange: str = None):
-    """식당 목록"""
-    filtered = RESTAURANTS
-    if menu:
-        filtered = [r for r in filtered if r["type"] == menu]
-    if priceRange:
-        filtered = [r for r in filtered if r["price"] == priceRange]
-    return filtered
+def get_restaurants(request: Request, menu: str = None, priceRange: str = None):
+    """식당 목록 (카탈로그는 바뀌지 않으므로 조건별로 한 번만 직렬화)"""
+    return read_views.respond(
+        request, make_etag(restaurant_catalog.version),
+        lambda response: restaurant_catalog.find(menu, priceRange),
+    )
 
 
 @router.get("/random")
 def get_random_restaurant(menu: str = None, priceRange: str = None):
-    """랜덤 식당 추천"""
-    filtered = RESTAURANTS
-    if menu:
-        filtered = [r for r in filtered if r["type"] == menu]
-    if priceRange:
-        filtered = [r for r in filtered if r["price"] == priceRange]
-    if not filtered:
-        filtered = RESTAURANTS
-    return random.choice(filtered)
+    """랜덤 식당 추천 (평점/거리 가중)"""
+    return restaurant_catalog.pick(menu, priceRange)
 
 
 # ============ 카카오 맛집 검색 API ============
@@ -47,52 +56,141 @@ async def get_nearby_restaurants(
     size: int = 15
 ):
     """
-    카카오 API를 사용하여 주변 맛집 검색 (기본: 여의도)
+    주변 맛집 검색 (기본: 여의도)
+    크롤링된 로컬 카탈로그 영역 안이면 카탈로그에서 바로 찾고,
+    영역 밖이면 카카오 API를 호출합니다 (geohash 격자 + 검색 조건 단위로 캐시).
     """
+    radius, size = min(radius, 20000), min(size, 15)
+    catalog = place_catalog_refresher.catalog
+    if catalog is not None and catalog.covers(latitude, longitude, radius):
+        indices, distances = catalog.within(latitude, longitude, radius)
+        return catalog_response(catalog, indices, distances, keyword, page, size)
+    
     if not KAKAO_REST_API_KEY:
         raise HTTPException(
             status_code=500, 
             detail="카카오 API 키가 설정되지 않았습니다."
         )
     
-    url = "https://dapi.kakao.com/v2/local/search/keyword.json"
+    cell = geohash_encode(latitude, longitude, NEARBY_CACHE_GEOHASH_PRECISION)
+    cell_latitude, cell_longitude = geohash_decode(cell)
+    return await nearby_cache.get_or_fetch(
+        (cell, keyword, radius, page, size),
+        lambda: fetch_nearby_restaurants(cell_latitude, cell_longitude, keyword, radius, page, size),
+    )
+
+
+@router.get("/nearby/nearest")
+async def get_nearest_restaurants(
+    latitude: float = 37.530230,
+    longitude: float = 126.926439,
+    count: int = 10,
+):
+    """
+    가까운 음식점 count개
+    카탈로그는 count번째 결과까지의 반경이 크롤링 영역 안일 때만 사용하고 (영역 경계 밖에 더 가까운 곳이 있을 수 있음),
+    아니면 카카오 거리순 검색을 15건 페이지 단위로 count개가 찰 때까지 가져옵니다.
+    """
+    count = max(1, min(count, 50))
+    catalog = place_catalog_refresher.catalog
+    if catalog is not None and catalog.covers(latitude, longitude, 0):
+        indices, distances = catalog.nearest(latitude, longitude, count)
+        if len(indices) == count and catalog.covers(latitude, longitude, float(distances[-1])):
+            return catalog_response(catalog, indices, distances, "", 1, count)
+
+    restaurants, page = [], 1
+    while True:
+        result = await get_nearby_restaurants(latitude, longitude, radius=20000, page=page, size=15)
+        restaurants.extend(result["restaurants"])
+        if len(restaurants) >= count or result["meta"]["isEnd"] or not result["restaurants"]:
+            break
+        page += 1
+    return {
+        "restaurants": restaurants[:count],
+        "meta": {**result["meta"], "isEnd": result["meta"]["isEnd"] and len(restaurants) <= count, "currentPage": 1},
+    }
+
+
+@router.get("/nearby/catalog")
+def get_catalog_info():
+    """로컬 음식점 카탈로그 상태"""
+    catalog = place_catalog_refresher.catalog
+    if catalog is None:
+        return {"loaded": False}
+    return {
+        "loaded": True,
+        "places": len(catalog),
+        "center": {"latitude": catalog.center[0], "longitude": catalog.center[1]},
+        "radiusMeters": catalog.radius_meters,
+        "crawledAt": catalog.crawled_at,
+        "partial": catalog.partial,
+    }
+
+
+def catalog_response(catalog: PlaceCatalog, indices, distances, keyword: str, page: int, size: int) -> dict:
+    """카탈로그 검색 결과 -> 카카오 프록시와 같은 응답 형식 (검색어는 이름/카테고리 포함 여부로 필터)"""
+    if keyword and keyword not in PLACE_CATALOG_GENERIC_KEYWORDS:
+        matched = [
+            (i, d) for i, d in zip(indices, distances)
+            if keyword in (catalog.places[i]["name"] or "") or keyword in (catalog.places[i]["category"] or "")
+        ]
+    else:
+        matched = list(zip(indices, distances))
+    start = (max(page, 1) - 1) * size
+    return {
+        "restaurants": [catalog.to_response(int(i), float(d)) for i, d in matched[start:start + size]],
+        "meta": {
+            "totalCount": len(matched),
+            "pageableCount": len(matched),
+            "isEnd": start + size >= len(matched),
+            "currentPage": page,
+            "source": "catalog",
+        }
+    }
+
+
+@router.get("/nearby/cache")
+def get_nearby_cache_stats():
+    """주변 맛집 검색 캐시 통계 (hit / miss / eviction 등)"""
+    return nearby_cache.stats()
+
+
+async def fetch_nearby_restaurants(latitude: float, longitude: float, keyword: str,
+                                   radius: int, page: int, size: int) -> dict:
+    """카카오 키워드 검색 API 호출 + 응답 변환"""
+    url = KAKAO_LOCAL_SEARCH_URL
     headers = {"Authorization": f"KakaoAK {KAKAO_REST_API_KEY}"}
     params = {
         "query": keyword,
         "x": str(longitude),
         "y": str(latitude),
-        "radius": min(radius, 20000),
+        "radius": radius,
         "page": page,
-        "size": min(size, 15),
+        "size": size,
         "sort": "distance",
         "category_group_code": "FD6"
     }
     
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url, headers=headers, params=params)
-        
-        if response.status_code != 200:
-            raise HTTPException(
-                status_code=response.status_code,
-                detail=f"카카오 API 오류: {response.text}"
-            )
-        
-        data = response.json()
+    # lifespan에서 만든 공용 클라이언트 (keep-alive 연결 재사용)
+    try:
+        response = await http_client.client.get(url, headers=headers, params=params)
+    except httpx.TimeoutException:
+        raise HTTPException(status_code=504, detail="카카오 API 응답 시간 초과")
+    except httpx.TransportError as e:
+        raise HTTPException(status_code=502, detail=f"카카오 API 연결 오류: {e}")
+    
+    if response.status_code != 200:
+        raise HTTPException(
+            status_code=response.status_code,
+            detail=f"카카오 API 오류: {response.text}"
+        )
+    
+    data = response.json()
     
-    restaurants_list = []
-    for place in data.get("documents", []):
-        restaurants_list.append({
-            "id": place.get("id"),
-            "name": place.get("place_name"),
-            "category": place.get("category_name"),
-            "phone": place.get("phone"),
-            "address": place.get("address_name"),
-            "roadAddress": place.get("road_address_name"),
-            "latitude": float(place.get("y")),
-            "longitude": float(place.get("x")),
-            "distance": int(place.get("distance", 0)),
-            "placeUrl": place.get("place_url"),
-        })
+    restaurants_list = [
+        {**kakao_document_to_place(place), "distance": int(place.get("distance", 0))}
+        for place in data.get("documents", [])
+    ]
     
     return {
         "restaurants": restaurants_list,
@@ -101,6 +199,7 @@ async def get_nearby_restaurants(
             "pageableCount": data.get("meta", {}).get("pageable_count", 0),
             "isEnd": data.get("meta", {}).get("is_end", True),
             "currentPage": page,
+            "source": "kakao",
         }
     }
 
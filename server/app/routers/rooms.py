@@ -2,23 +2,40 @@
 점심방 API 라우터
 점심방 CRUD 관련 엔드포인트
 """
-from fastapi import APIRouter
+from datetime import date
+
+from fastapi import APIRouter, Request, Response
 
 from ..schemas import RoomCreateRequest, RoomJoinRequest, RoomLeaveRequest
 from ..services import RoomService
+from ..repositories import data_store
+from ..repositories.sorted_keys import record_key
+from ..repositories.versions import ROOMS
+from ..core.pagination import decode_cursor, clamp_limit, parse_order, page_response
+from ..core.conditional import make_etag, not_modified
+from ..core.read_views import read_views
 
 router = APIRouter(prefix="/rooms", tags=["점심방"])
 
 
 @router.get("")
-def get_rooms():
-    """열린 점심방 + 매칭 완료된 방 목록"""
-    return RoomService.get_all_rooms()
+def get_rooms(request: Request, cursor: str = None, limit: int = None, order: str = "asc", fields: str = None):
+    """열린 점심방 + 매칭 완료된 방 목록 (생성 순, 커서 페이지네이션 + 필드 선택)"""
+    def build(response: Response):
+        rooms, has_more = RoomService.get_rooms_page(decode_cursor(cursor), clamp_limit(limit), parse_order(order))
+        return page_response(response, rooms, has_more, record_key, fields)
+
+    # 오늘 방만 보여주므로 날짜도 ETag에 포함
+    with data_store.read_snapshot():
+        return read_views.respond(request, make_etag(date.today().isoformat(), data_store.get_version(ROOMS)), build)
 
 
 @router.get("/my/{user_id}")
-def get_my_rooms(user_id: str):
+def get_my_rooms(user_id: str, request: Request, response: Response):
     """내가 참여 중인 방 목록"""
+    cached = not_modified(request, response, make_etag(data_store.get_user_version(user_id)))
+    if cached:
+        return cached
     return RoomService.get_user_rooms(user_id)
 
 
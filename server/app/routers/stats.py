@@ -2,24 +2,42 @@
 통계 API 라우터
 통계 데이터 관련 엔드포인트
 """
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
 
 from ..repositories import data_store
-from ..core.utils import get_recommended_restaurants
+from ..repositories.sorted_keys import record_key
+from ..repositories.versions import WAITING, GROUPS, ROOMS
+from ..core.pagination import decode_cursor, clamp_limit, parse_order, page_response
+from ..core.conditional import make_etag
+from ..core.read_views import read_views
+from ..services.restaurant_catalog import restaurant_catalog
 
 router = APIRouter(tags=["통계"])
 
 
 @router.get("/stats")
-def get_stats():
+def get_stats(request: Request):
     """오늘의 통계"""
-    return data_store.get_stats()
+    with data_store.read_snapshot():
+        etag = make_etag(data_store.get_version(WAITING, GROUPS, ROOMS))
+        return read_views.respond(request, etag, lambda response: data_store.get_stats())
+
+
+@router.get("/stats/partitions")
+def get_partition_stats():
+    """보관 중인 날짜별 그룹/점심방 수와 메모리 사용량"""
+    return data_store.get_partition_stats()
 
 
 @router.get("/groups")
-def get_groups():
-    """모든 그룹 목록"""
-    return data_store.get_all_groups()
+def get_groups(request: Request, cursor: str = None, limit: int = None, order: str = "asc", fields: str = None):
+    """그룹 목록 (생성 순, 커서 페이지네이션 + 필드 선택)"""
+    def build(response: Response):
+        groups, has_more = data_store.get_groups_page(decode_cursor(cursor), clamp_limit(limit), parse_order(order))
+        return page_response(response, groups, has_more, record_key, fields)
+
+    with data_store.read_snapshot():
+        return read_views.respond(request, make_etag(data_store.get_version(GROUPS)), build)
 
 
 @router.get("/groups/{group_id}")
@@ -33,7 +51,7 @@ def get_group(group_id: str):
     
     return {
         **group,
-        "recommendedRestaurants": get_recommended_restaurants(
+        "recommendedRestaurants": restaurant_catalog.recommend_many(
             group["menu"], group["priceRange"], 3
         ),
     }
@@ -2,17 +2,20 @@
 유저 API 라우터
 유저 조회 관련 엔드포인트
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 
 from ..repositories import data_store
+from ..repositories.sorted_keys import record_key
+from ..core.pagination import decode_cursor, clamp_limit, parse_order, page_response
 
 router = APIRouter(prefix="/users", tags=["유저"])
 
 
 @router.get("")
-def get_users():
-    """모든 유저 목록"""
-    return data_store.get_all_users()
+def get_users(response: Response, cursor: str = None, limit: int = None, order: str = "asc", fields: str = None):
+    """유저 목록 (가입 순, 커서 페이지네이션 + 필드 선택)"""
+    users, has_more = data_store.get_users_page(decode_cursor(cursor), clamp_limit(limit), parse_order(order))
+    return page_response(response, users, has_more, record_key, fields)
 
 
 @router.get("/{user_id}")
@@ -1,7 +1,8 @@
 # Services - Business logic layer
-from .auth_service import AuthService
+from .auth_service import AuthService, session_sweeper
 from .match_service import MatchService
 from .room_service import RoomService
+from .match_scheduler import MatchScheduler, match_scheduler
 
-__all__ = ["AuthService", "MatchService", "RoomService"]
+__all__ = ["AuthService", "session_sweeper", "MatchService", "RoomService", "MatchScheduler", "match_scheduler"]
 
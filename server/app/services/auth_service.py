@@ -1,11 +1,20 @@
 """
 인증 서비스
 회원가입, 로그인, 로그아웃 비즈니스 로직
+
+세션 토큰은 두 가지 방식 (config.SESSION_TOKEN_MODE)
+- opaque (기본): 임의 토큰 -> 저장소 세션 (SESSION_TTL_SECONDS 후 만료)
+- signed: 유저 ID/만료 시각을 담은 HMAC 서명 토큰, 세션 조회 없이 검증하고
+  로그아웃/재로그인은 저장소의 작은 폐기 목록으로 처리 (토큰 만료 시각까지만 보관)
 """
+import asyncio
+import time
 from typing import Optional
 from fastapi import HTTPException
 
 from ..repositories import data_store
+from ..core.config import SESSION_TOKEN_MODE, SESSION_TTL_SECONDS, SESSION_SWEEP_INTERVAL_SECONDS
+from ..core.signed_tokens import issue_signed_token, verify_signed_token
 from ..core.utils import hash_password, generate_token
 
 
@@ -52,12 +61,15 @@ class AuthService:
         if not user or user["password"] != hash_password(password):
             raise HTTPException(status_code=401, detail="아이디 또는 비밀번호가 틀렸습니다")
         
-        # 기존 세션 제거
-        data_store.delete_user_sessions(user["id"])
-        
-        # 새 세션 생성
-        token = generate_token()
-        data_store.create_session(token, user["id"])
+        # 기존 세션 제거 + 새 세션 생성
+        if SESSION_TOKEN_MODE == "signed":
+            now = time.time()
+            data_store.revoke_user_tokens(user["id"], issued_before=now, expires_at=now + SESSION_TTL_SECONDS)
+            token = issue_signed_token(user["id"], issued_at=now)
+        else:
+            data_store.delete_user_sessions(user["id"])
+            token = generate_token()
+            data_store.create_session(token, user["id"])
         
         # 레벨 정보 추가
         match_count = user.get("matchCount", 0)
@@ -76,7 +88,11 @@ class AuthService:
     @staticmethod
     def logout(token: str) -> dict:
         """로그아웃"""
-        if token:
+        if token and SESSION_TOKEN_MODE == "signed":
+            claims = verify_signed_token(token)
+            if claims:
+                data_store.revoke_token(claims["jti"], claims["exp"])
+        elif token:
             data_store.delete_session(token)
         return {"success": True}
     
@@ -86,10 +102,48 @@ class AuthService:
         if not token:
             return None
         
-        user_id = data_store.get_session(token)
+        if SESSION_TOKEN_MODE == "signed":
+            claims = verify_signed_token(token)
+            if not claims or data_store.is_token_revoked(claims["jti"], claims["sub"], claims["iat"]):
+                return None
+            user_id = claims["sub"]
+        else:
+            user_id = data_store.get_session(token)
         if not user_id:
             return None
         
         # 레벨 정보 포함해서 반환
         return data_store.get_user_with_level(user_id)
 
+
+class SessionSweeper:
+    """만료된 세션/폐기 목록을 주기적으로 정리하는 백그라운드 작업 (FastAPI lifespan에서 시작/종료)"""
+
+    def __init__(self, interval_seconds: float = SESSION_SWEEP_INTERVAL_SECONDS):
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    async def _loop(self):
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await asyncio.to_thread(data_store.sweep_expired_sessions)
+            except Exception as e:
+                print(f"⚠️ 세션 정리 실패: {e}")
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# 싱글톤 인스턴스
+session_sweeper = SessionSweeper()
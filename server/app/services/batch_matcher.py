@@ -0,0 +1,316 @@
+"""
+배치 매칭
+버킷 하나의 대기 요청 전체를 한 번에 보고, 매칭되는 인원이 최대가 되도록 그룹을 나눕니다.
+양방향 조건 체크를 NumPy 행렬 연산으로 한 번에 계산합니다.
+"""
+from typing import List, Dict, Tuple
+
+import numpy as np
+
+from ..core.config import MAX_GROUP_SIZE, SIMILAR_AGE_RANGE
+from ..repositories.waiting_request import WaitingRequest, SAME_GENDER, SIMILAR_AGE, SAME_LEVEL, level_accepts
+
+
+def _encode(values: list) -> Tuple[np.ndarray, Dict[int, int]]:
+    """레코드 코드 값을 이 배치 안에서만 쓰는 연속 코드로 (값 없음 = 0)"""
+    codes = {}
+    return np.array([codes.setdefault(v, len(codes) + 1) if v else 0 for v in values], dtype=np.int64), codes
+
+
+def _one_way(requests: List[WaitingRequest]) -> Tuple[np.ndarray, ...]:
+    """
+    단방향 조건을 비트 연산용 배열로 변환
+    - target_bit[j]: j의 (성별, 직급) 조합 비트
+    - allowed[i]: i가 받아들이는 (성별, 직급) 조합 비트마스크 (남은 조건 기준)
+    - age_low[i], age_high[i]: i가 받아들이는 나이 범위 (조건 없으면 전체)
+    - ages[j]: j의 나이 (값 없음 = 0, 항상 통과)
+    값이 없는 성별/직급은 코드 0이고, 모든 checker가 코드 0을 허용합니다.
+    """
+    n = len(requests)
+    genders, gender_codes = _encode([r.gender for r in requests])
+    levels, level_codes = _encode([r.level for r in requests])
+    ages = np.array([r.age for r in requests], dtype=np.int64)
+    num_levels = len(level_codes) + 1
+    num_genders = len(gender_codes) + 1
+    if num_genders * num_levels > 63:
+        raise ValueError("성별/직급 종류가 너무 많아 비트마스크로 인코딩할 수 없습니다")
+
+    # 직급 코드별 허용 직급 비트마스크 (직급 호환 테이블을 배치 코드로, 0 = 값 없음은 항상 허용)
+    level_allowed = np.ones(num_levels, dtype=np.int64)  # 조건 있음 → 코드 0만 기본 허용
+    for a, code_a in level_codes.items():
+        accepts = level_accepts(a)
+        for b, code_b in level_codes.items():
+            if accepts >> b & 1:
+                level_allowed[code_a] |= 1 << code_b
+    all_levels = (1 << num_levels) - 1
+    all_genders = (1 << num_genders) - 1
+
+    # 남은 조건 마스크 (checker 값이 없는 조건은 이미 빠져 있음)
+    conditions = np.array([r.remaining_conditions(r.relaxation_level) for r in requests], dtype=np.int64)
+    gender_cond = (conditions & SAME_GENDER) != 0
+    level_cond = (conditions & SAME_LEVEL) != 0
+    age_cond = (conditions & SIMILAR_AGE) != 0
+
+    # 허용 성별/직급 집합 → (성별, 직급) 조합 비트마스크
+    allowed_genders = np.where(gender_cond, 1 | (1 << genders), all_genders)
+    allowed_levels = np.where(level_cond, level_allowed[levels], all_levels)
+    allowed = np.zeros(n, dtype=np.int64)
+    for g in range(num_genders):
+        has_gender = (allowed_genders >> g) & 1
+        allowed |= (allowed_levels * has_gender) << (g * num_levels)
+    target_bit = np.left_shift(1, genders * num_levels + levels)
+
+    age_low = np.where(age_cond, ages - SIMILAR_AGE_RANGE, 0)
+    age_high = np.where(age_cond, ages + SIMILAR_AGE_RANGE, np.iinfo(np.int32).max)
+    return target_bit, allowed, age_low, age_high, ages
+
+
+def build_compatibility(requests: List[WaitingRequest]) -> np.ndarray:
+    """
+    양방향 매칭 가능 행렬 (N x N bool)
+    compatible[i, j] = i가 j를 원하고 AND j가 i를 원함 (check_mutual_match와 동일)
+    각 요청의 완화 단계는 request.relaxation_level을 사용합니다.
+
+    checker가 가질 수 있는 (허용 조합, 나이 범위)의 종류는 적으므로
+    종류별로 target 벡터를 한 번만 계산하고 행/열 gather로 N x N을 채웁니다.
+    """
+    target_bit, allowed, age_low, age_high, ages = _one_way(requests)
+
+    # 허용 (성별, 직급) 조합 종류별: 받아들이는 target (K x N)
+    allowed_kinds, allowed_idx = np.unique(allowed, return_inverse=True)
+    profile_ok = (allowed_kinds[:, None] & target_bit[None, :]) != 0
+
+    # 나이 범위 종류별: 받아들이는 target (M x N), 값 없는 target은 항상 통과
+    age_kinds, age_idx = np.unique(np.stack([age_low, age_high], axis=1), axis=0, return_inverse=True)
+    age_idx = age_idx.reshape(-1)
+    age_ok = (ages[None, :] >= age_kinds[:, :1]) & (ages[None, :] <= age_kinds[:, 1:]) | (ages == 0)[None, :]
+
+    # i가 j를 원함 (행 gather) AND j가 i를 원함 (열 gather)
+    wants = profile_ok[allowed_idx]
+    wants &= age_ok[age_idx]
+    wants &= np.ascontiguousarray(profile_ok.T).take(allowed_idx, axis=1)
+    wants &= np.ascontiguousarray(age_ok.T).take(age_idx, axis=1)
+    np.fill_diagonal(wants, False)
+    return wants
+
+
+def _greedy_pairs(compatible: np.ndarray) -> List[int]:
+    """최소 차수 우선 greedy 2인 매칭 (선택지가 적은 사람부터), match[i] = 짝 인덱스 (-1 = 없음)"""
+    n = compatible.shape[0]
+    match = [-1] * n
+    unmatched = np.ones(n, dtype=bool)
+    degree = compatible.sum(axis=1, dtype=np.int32)
+    big = np.iinfo(np.int32).max
+    while True:
+        candidates = np.where(unmatched & (degree > 0), degree, big)
+        u = int(candidates.argmin())
+        if candidates[u] == big:
+            break
+        neighbors = np.where(unmatched & compatible[u], degree, big)
+        v = int(neighbors.argmin())
+        match[u], match[v] = v, u
+        for x in (u, v):
+            unmatched[x] = False
+            degree -= compatible[x]  # 대칭 행렬이므로 행 = 열
+    return match
+
+
+def _augment(compatible: np.ndarray, match: List[int], root: int) -> bool:
+    """
+    Edmonds blossom 탐색: root(짝 없음)에서 시작하는 증가 경로를 찾으면 경로를 뒤집어서
+    매칭을 1쌍 늘리고 True, 없으면 False
+    """
+    n = len(match)
+    used = [False] * n
+    parent = [-1] * n
+    base = list(range(n))
+    used[root] = True
+    queue = [root]
+
+    def lca(a: int, b: int) -> int:
+        seen = [False] * n
+        while True:
+            a = base[a]
+            seen[a] = True
+            if match[a] == -1:
+                break
+            a = parent[match[a]]
+        while True:
+            b = base[b]
+            if seen[b]:
+                return b
+            b = parent[match[b]]
+
+    def mark_path(v: int, b: int, child: int, blossom: List[bool]):
+        while base[v] != b:
+            blossom[base[v]] = blossom[base[match[v]]] = True
+            parent[v] = child
+            child = match[v]
+            v = parent[match[v]]
+
+    head = 0
+    while head < len(queue):
+        v = queue[head]
+        head += 1
+        for to in np.flatnonzero(compatible[v]).tolist():
+            if base[v] == base[to] or match[v] == to:
+                continue
+            if to == root or (match[to] != -1 and parent[match[to]] != -1):
+                # 홀수 사이클(blossom) 축약
+                current = lca(v, to)
+                blossom = [False] * n
+                mark_path(v, current, to, blossom)
+                mark_path(to, current, v, blossom)
+                for i in range(n):
+                    if blossom[base[i]]:
+                        base[i] = current
+                        if not used[i]:
+                            used[i] = True
+                            queue.append(i)
+            elif parent[to] == -1:
+                parent[to] = v
+                if match[to] == -1:
+                    # 증가 경로 뒤집기
+                    while to != -1:
+                        v = parent[to]
+                        next_to = match[v]
+                        match[to], match[v] = v, to
+                        to = next_to
+                    return True
+                used[match[to]] = True
+                queue.append(match[to])
+    return False
+
+
+def _maximum_matching(compatible: np.ndarray) -> List[int]:
+    """
+    최대 카디널리티 2인 매칭 (greedy 결과에서 시작해 증가 경로가 없을 때까지 보강)
+    증가 경로를 못 찾은 정점은 이후에도 찾을 수 없으므로 정점마다 한 번만 탐색합니다.
+    """
+    match = _greedy_pairs(compatible)
+    has_neighbor = compatible.any(axis=1)
+    for root in range(len(match)):
+        if match[root] != -1 or not has_neighbor[root]:
+            continue
+        _augment(compatible, match, root)
+    return match
+
+
+def _merge_groups(compatible: np.ndarray, groups: List[List[int]], anchors: List[List[int]],
+                  max_group_size: int) -> Tuple[List[List[int]], List[List[int]]]:
+    """
+    대기 순서대로 그룹마다, 크기가 맞고 한쪽의 기준 멤버가 다른 쪽 전원과 매칭되는 첫 그룹을 합치기
+    (합친 그룹의 기준 멤버 = 합친 그룹 전원과 매칭되는 사람, 한쪽 기준 멤버가 그 조건을 만족하므로 항상 있음)
+    그룹 간 합칠 수 있는지는 처음에 행렬 연산으로 한 번에 계산하고, 합친 뒤 자리가 남은 그룹만 다시 계산합니다.
+    """
+    count = len(groups)
+    if count < 2:
+        return groups, anchors
+    sizes = np.array([len(group) for group in groups], dtype=np.int64)
+    alive = np.ones(count, dtype=bool)
+    members = np.full((count, max_group_size), -1, dtype=np.int64)  # 그룹별 멤버 (빈칸 -1)
+    anchor_slots = np.full((count, max_group_size), -1, dtype=np.int64)  # 그룹별 기준 멤버 (빈칸 -1)
+    for g, group in enumerate(groups):
+        members[g, :len(group)] = group
+        anchor_slots[g, :len(anchors[g])] = anchors[g]
+
+    # covers[h, p]: p가 그룹 h 전원과 매칭 (compatible은 대칭이므로 행으로 모음)
+    covers = np.ones((count, compatible.shape[0]), dtype=bool)
+    for k in range(max_group_size):
+        column = members[:, k]
+        covers &= compatible[np.maximum(column, 0)] | (column < 0)[:, None]
+    # mergeable[g, h]: g의 기준 멤버가 h 전원과 매칭되거나 그 반대
+    mergeable = np.zeros((count, count), dtype=bool)
+    for k in range(max_group_size):
+        slot = anchor_slots[:, k]
+        mergeable[slot >= 0] |= covers[:, slot[slot >= 0]].T
+    mergeable |= mergeable.T
+
+    for g in range(count):
+        while alive[g]:
+            candidates = np.flatnonzero(alive & mergeable[g] & (sizes + sizes[g] <= max_group_size))
+            candidates = candidates[candidates != g]
+            if len(candidates) == 0:
+                break
+            h = int(candidates[0])
+            merged = groups[g] + groups[h]
+            anchors[g] = [a for a in merged if all(compatible[a, b] for b in merged if b != a)]
+            groups[g] = merged
+            sizes[g], sizes[h] = len(merged), 0
+            alive[h] = False
+            if sizes[g] >= max_group_size:
+                break
+            # 자리가 남았으면 합친 그룹 기준으로 다시 계산
+            covers[g] = compatible[merged].all(axis=0)
+            anchor_slots[g] = -1
+            anchor_slots[g, :len(anchors[g])] = anchors[g]
+            row = covers[:, anchors[g]].any(axis=1)
+            for k in range(max_group_size):
+                slot = anchor_slots[:, k]
+                row[slot >= 0] |= covers[g, slot[slot >= 0]]
+            mergeable[g], mergeable[:, g] = row, row
+
+    kept = np.flatnonzero(alive)
+    return [groups[g] for g in kept], [anchors[g] for g in kept]
+
+
+def form_groups(compatible: np.ndarray, max_group_size: int = MAX_GROUP_SIZE) -> List[List[int]]:
+    """
+    매칭되는 인원이 최대가 되도록 2 ~ max_group_size명 그룹으로 나누기
+    기존 매칭과 같이 그룹에는 나머지 전원과 매칭 가능한 기준 멤버(anchor)가 있어야 합니다.
+
+    1) 최대 카디널리티 2인 매칭 (Edmonds blossom, 짝지어지는 인원은 최대)
+    2) 남은 사람을 기준 멤버가 받아줄 수 있는 그룹에 추가 (최대 max_group_size명)
+       2단계는 대기 순서대로 들어갈 수 있는 첫 그룹에 넣는 greedy라서,
+       그룹 크기 제한 때문에 다른 배치였다면 들어갈 수 있었던 사람이 남을 수 있습니다.
+    3) 합쳐도 max_group_size 이하이고 합친 그룹에 기준 멤버가 있는 그룹끼리 합치기
+       (매칭 인원은 그대로, 기존 경로처럼 그룹이 max_group_size명까지 차도록)
+    그룹은 요청 인덱스 목록이며, 첫 번째가 기준 멤버입니다.
+    """
+    n = compatible.shape[0]
+    if n < 2:
+        return []
+
+    # 1) 2인 매칭
+    match = _maximum_matching(compatible)
+    groups: List[List[int]] = [[u, v] for u, v in enumerate(match) if u < v]
+    unmatched = np.array([v == -1 for v in match], dtype=bool)
+
+    # 2) 남은 사람 추가
+    if max_group_size > 2:
+        # 그룹별 기준 멤버가 될 수 있는 사람 (그룹 전원과 매칭 가능)
+        anchors = [list(group) for group in groups]
+        group_of = np.full(n, -1, dtype=np.int32)
+        for g, group in enumerate(groups):
+            group_of[group] = g
+        for w in np.flatnonzero(unmatched & compatible.any(axis=1)):
+            for g in np.unique(group_of[compatible[w] & (group_of >= 0)]):
+                group = groups[g]
+                if len(group) >= max_group_size:
+                    continue
+                new_anchors = [a for a in anchors[g] if compatible[a, w]]
+                if compatible[w, group].all():
+                    new_anchors.append(int(w))
+                if new_anchors:
+                    group.append(int(w))
+                    anchors[g] = new_anchors
+                    unmatched[w] = False
+                    break
+
+        # 3) 그룹 합치기
+        groups, anchors = _merge_groups(compatible, groups, anchors, max_group_size)
+
+        # 기준 멤버를 맨 앞으로
+        for group, group_anchors in zip(groups, anchors):
+            group.remove(group_anchors[0])
+            group.insert(0, group_anchors[0])
+
+    return groups
+
+
+def match_batch(requests: List[WaitingRequest], max_group_size: int = MAX_GROUP_SIZE) -> List[List[WaitingRequest]]:
+    """버킷 대기 요청 목록 -> 그룹(요청 목록) 목록"""
+    if len(requests) < 2:
+        return []
+    groups = form_groups(build_compatibility(requests), max_group_size)
+    return [[requests[i] for i in group] for group in groups]
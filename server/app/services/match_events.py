@@ -0,0 +1,71 @@
+"""
+매칭 이벤트 허브
+대기열 버킷이 바뀌면(참여/취소/매칭) 해당 버킷을 구독 중인 스트림을 깨웁니다.
+"""
+import asyncio
+import threading
+from typing import Dict, Set
+
+from ..repositories import data_store
+
+
+class MatchSubscription:
+    """스트림 1개의 구독 정보 (이벤트 루프 + 깨우기용 Event)"""
+
+    def __init__(self, bucket_key: tuple):
+        self.bucket_key = bucket_key
+        self.loop = asyncio.get_running_loop()
+        self.event = asyncio.Event()
+
+    async def wait(self, timeout: float) -> bool:
+        """변경 알림 또는 timeout까지 대기 (알림이면 True)"""
+        try:
+            await asyncio.wait_for(self.event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        self.event.clear()
+        return True
+
+
+class MatchEventHub:
+    """
+    버킷 키 -> 구독 목록
+    publish는 스레드풀(동기 핸들러)이나 스케줄러 스레드에서 호출되므로
+    call_soon_threadsafe로 각 구독의 이벤트 루프에 알림을 넘깁니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: Dict[tuple, Set[MatchSubscription]] = {}
+
+    def subscribe(self, bucket_key: tuple) -> MatchSubscription:
+        """버킷 변경 구독 (이벤트 루프 안에서 호출)"""
+        subscription = MatchSubscription(bucket_key)
+        with self._lock:
+            self._subscribers.setdefault(bucket_key, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: MatchSubscription):
+        """구독 해제"""
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.bucket_key)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.bucket_key]
+
+    def publish(self, bucket_key: tuple):
+        """버킷 변경 알림"""
+        with self._lock:
+            subscribers = list(self._subscribers.get(bucket_key, ()))
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.event.set)
+            except RuntimeError:
+                # 이미 종료된 이벤트 루프
+                pass
+
+
+# 싱글톤 인스턴스 (대기열 변경을 구독)
+match_events = MatchEventHub()
+data_store.subscribe_waiting_changes(match_events.publish)
@@ -0,0 +1,152 @@
+"""
+매칭 스케줄러
+완화 타이머가 울린 요청만 골라 다시 매칭하는 백그라운드 작업
+"""
+import asyncio
+import time
+from typing import Optional, Dict, List
+
+from ..repositories import data_store
+from ..core.locks import bucket_locks
+from ..core.config import (
+    MATCHING_TICK_SECONDS, MATCHING_PASS_BUDGET_MS, BATCH_MATCHING_ENABLED, BATCH_MATCHING_MAX_REQUESTS,
+)
+from ..core.metrics import match_timeouts
+from .match_service import MatchService
+from .relaxation_timers import relaxation_timers, TIMEOUT
+from .batch_matcher import match_batch
+
+
+class MatchScheduler:
+    """
+    FastAPI lifespan에서 시작/종료되는 매칭 루프
+    - 완화 단계가 바뀐 요청: 새 단계로 다시 매칭 시도
+      (BATCH_MATCHING_ENABLED면 그 요청이 속한 버킷을 최대 BATCH_MATCHING_MAX_REQUESTS명씩 배치 매칭)
+    - 타임아웃된 요청: 대기열에서 빼고 timeout 결과로 보관
+    한 번의 회전은 MATCHING_PASS_BUDGET_MS 안에서만 수행하고,
+    남은 요청은 다음 회전에 이어서 처리합니다.
+    """
+
+    def __init__(self, tick_seconds: float = MATCHING_TICK_SECONDS,
+                 budget_ms: float = MATCHING_PASS_BUDGET_MS,
+                 batch: bool = BATCH_MATCHING_ENABLED,
+                 batch_max_requests: int = BATCH_MATCHING_MAX_REQUESTS):
+        self.tick_seconds = tick_seconds
+        self.budget_seconds = budget_ms / 1000
+        self.batch = batch
+        self.batch_max_requests = batch_max_requests
+        self._pending: Dict[str, None] = {}  # 다시 매칭할 요청 ID (순서 유지 + 중복 제거)
+        self._task: Optional[asyncio.Task] = None
+
+    def run_pass(self) -> int:
+        """매칭 1회전, 처리한 요청 수 반환"""
+        now = time.monotonic()
+        for request_id, level in relaxation_timers.pop_due(now):
+            if level == TIMEOUT:
+                if data_store.expire_waiting_user(request_id):
+                    match_timeouts.inc()
+                self._pending.pop(request_id, None)
+                continue
+            request = data_store.get_waiting_user_by_id(request_id)
+            if request and level > request.relaxation_level:
+                data_store.set_waiting_relaxation_level(request_id, level)
+                self._pending[request_id] = None
+
+        if not self._pending:
+            return 0
+        request_ids = list(self._pending)
+        deadline = now + self.budget_seconds
+        if self.batch:
+            handled = self._run_batch_pass(request_ids, deadline)
+        else:
+            handled = request_ids[:MatchService.run_matching_pass(request_ids, deadline)]
+        for request_id in handled:
+            del self._pending[request_id]
+        return len(handled)
+
+    def _run_batch_pass(self, request_ids: List[str], deadline: float) -> List[str]:
+        """
+        요청들이 속한 버킷을 하나씩 배치 매칭, 처리한 요청 ID 목록 반환
+        버킷마다 이번 회전 요청을 먼저, 나머지는 오래 기다린 순서로 최대 batch_max_requests명만 넣고
+        (넣지 못한 요청은 다음 회전에 처리), 행렬 계산은 버킷 락 밖에서 스냅샷으로 수행합니다.
+        deadline은 버킷 사이와 그룹 생성 사이에서 확인합니다.
+        """
+        pending = set(request_ids)
+        handled = []
+        for request_id in request_ids:
+            if request_id not in pending:
+                continue
+            if time.monotonic() >= deadline:
+                break
+            request = data_store.get_waiting_user_by_id(request_id)
+            if not request:
+                pending.discard(request_id)
+                handled.append(request_id)
+                continue
+            key = request.bucket_key
+            bucket = data_store.get_waiting_users_by_conditions(*key)
+            ordered = [r for r in bucket if r.id in pending] + [r for r in bucket if r.id not in pending]
+            chosen = {r.id for r in ordered[:self.batch_max_requests]} | {request_id}
+            batch = [r for r in bucket if r.id in chosen]  # 대기 순서 유지
+            try:
+                groups = match_batch(batch)
+            except ValueError as e:
+                print(f"⚠️ 배치 매칭 불가, 요청별 매칭으로 처리: 버킷 {key} ({len(batch)}명): {e}")
+                groups = None
+            if groups is None:
+                # 비트마스크로 표현할 수 없는 입력이면 요청별 greedy로 처리 (남은 예산 안에서)
+                batch_ids = [r.id for r in batch]
+                batched = set(batch_ids[:MatchService.run_matching_pass(batch_ids, deadline)])
+            else:
+                # 스냅샷 이후 취소/매칭된 요청이 있으면 그 그룹만 만들어지지 않음 (create_group의 claim)
+                # deadline을 넘기면 남은 그룹의 요청은 다음 회전에 다시 배치 매칭
+                created = len(groups)
+                with bucket_locks.hold(key):
+                    for index, members in enumerate(groups):
+                        if time.monotonic() >= deadline:
+                            created = index
+                            break
+                        relaxation_level = max(m.relaxation_level for m in members)
+                        MatchService.create_match_group(members, relaxation_level)
+                batched = chosen - {m.id for members in groups[created:] for m in members}
+            for batched_id in batched & pending:
+                pending.discard(batched_id)
+                handled.append(batched_id)
+        return handled
+
+    def _next_delay(self) -> float:
+        """다음 회전까지 대기 시간 (가장 가까운 완화 deadline, 최대 tick)"""
+        if self._pending:
+            return 0
+        deadline = relaxation_timers.next_deadline()
+        if deadline is None:
+            return self.tick_seconds
+        return min(self.tick_seconds, max(deadline - time.monotonic(), 0))
+
+    async def _loop(self):
+        while True:
+            await asyncio.sleep(self._next_delay())
+            try:
+                # 매칭은 동기 코드이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+                await asyncio.to_thread(self.run_pass)
+            except Exception as e:
+                print(f"⚠️ 매칭 스케줄러 오류: {e}")
+
+    def start(self):
+        """백그라운드 매칭 루프 시작"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        """백그라운드 매칭 루프 종료"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# 싱글톤 인스턴스
+match_scheduler = MatchScheduler()
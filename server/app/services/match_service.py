@@ -2,129 +2,123 @@
 매칭 서비스
 점심 매칭 관련 비즈니스 로직
 """
-from typing import Optional, List
-from datetime import datetime
+import asyncio
+import json
+import time
+from typing import Optional, List, AsyncIterator
 
 from ..repositories import data_store
-from ..core.utils import generate_id, is_similar_age, is_similar_level, get_recommended_restaurant
-from ..core.config import MATCHING_TIMEOUT_SECONDS, RELAXATION_INTERVAL_SECONDS, MAX_GROUP_SIZE
+from ..repositories.waiting_request import (
+    WaitingRequest, SAME_GENDER, SIMILAR_AGE, SAME_LEVEL, RELAXATION_STEPS, similar_level_codes,
+)
+from ..core.utils import generate_id
+from ..core.config import (
+    RELAXATION_INTERVAL_SECONDS, MAX_RELAXATION_LEVEL, MAX_GROUP_SIZE, SIMILAR_AGE_RANGE,
+    MATCH_STREAM_KEEPALIVE_SECONDS,
+)
+from ..core.locks import user_locks, bucket_locks
+from ..core.metrics import match_joins, match_wait, match_group_size
+from .match_events import match_events
+from .relaxation_timers import relaxation_timers
+from .restaurant_catalog import restaurant_catalog
+
+
+# 완화 순서 (성별 → 나이 → 직급)
+CONDITION_ORDER = ((SAME_GENDER, "gender"), (SIMILAR_AGE, "age"), (SAME_LEVEL, "level"))
 
 
 class MatchService:
     """매칭 관련 비즈니스 로직"""
     
     @staticmethod
-    def get_elapsed_seconds(joined_at: str) -> int:
-        """joinedAt 시간으로부터 경과 시간(초) 계산"""
-        try:
-            joined_time = datetime.fromisoformat(joined_at)
-            elapsed = (datetime.now() - joined_time).total_seconds()
-            return max(0, int(elapsed))
-        except:
-            return 0
+    def get_elapsed_seconds(joined_at: float) -> int:
+        """참여 시각(time.time 기준)으로부터 경과 시간(초) 계산"""
+        return max(0, int(time.time() - joined_at))
     
     @staticmethod
     def get_relaxation_level_from_elapsed(elapsed_seconds: int) -> int:
         """경과 시간으로 relaxation level 계산"""
-        return min(elapsed_seconds // RELAXATION_INTERVAL_SECONDS, 3)
+        return min(elapsed_seconds // RELAXATION_INTERVAL_SECONDS, MAX_RELAXATION_LEVEL)
+    
+    @staticmethod
+    def get_active_conditions(preferences: int) -> List[str]:
+        """선택된 조건 목록 (선호 조건 비트마스크, 완화 순서: 성별 → 나이 → 직급)"""
+        return [cond for bit, cond in CONDITION_ORDER if preferences & bit]
+    
+    @staticmethod
+    def _wants(checker: WaitingRequest, target: WaitingRequest, conditions: int) -> bool:
+        """checker의 남은 조건 마스크로 target 체크 (target 값이 없으면 통과)"""
+        if conditions & SAME_GENDER and target.gender and target.gender != checker.gender:
+            return False
+        if conditions & SIMILAR_AGE and target.age and abs(target.age - checker.age) > SIMILAR_AGE_RANGE:
+            return False
+        if conditions & SAME_LEVEL and target.level and not checker.level_accepts >> target.level & 1:
+            return False
+        return True
     
     @staticmethod
-    def check_one_way_match(checker: dict, target: dict, checker_relaxation: int) -> bool:
+    def check_one_way_match(checker: WaitingRequest, target: WaitingRequest, checker_relaxation: int) -> bool:
         """
         단방향 조건 체크: checker가 target을 원하는가?
-        checker의 preferences와 relaxation_level로 target을 체크
+        참여 시 계산해 둔 완화 단계별 조건 마스크로 남은 조건만 체크 (없으면 무조건 OK)
         """
-        preferences = checker.get("preferences", {})
-        
-        # 조건이 없으면 무조건 OK
-        if not preferences:
+        if checker_relaxation >= RELAXATION_STEPS:
             return True
-        
-        # 선택된 조건 순서 결정
-        active_conditions = []
-        if preferences.get("sameGender"):
-            active_conditions.append("gender")
-        if preferences.get("similarAge"):
-            active_conditions.append("age")
-        if preferences.get("sameLevel"):
-            active_conditions.append("level")
-        
-        # 조건이 없으면 OK
-        if not active_conditions:
-            return True
-        
-        # relaxation_level에 따라 남은 조건 (완화되지 않은 조건)
-        remaining_conditions = active_conditions[checker_relaxation:] if checker_relaxation < len(active_conditions) else []
-        
-        # 남은 조건 체크
-        for cond in remaining_conditions:
-            if cond == "gender":
-                if checker.get("gender") and target.get("gender"):
-                    if checker["gender"] != target["gender"]:
-                        return False
-            elif cond == "age":
-                if checker.get("age") and target.get("age"):
-                    if not is_similar_age(checker["age"], target["age"]):
-                        return False
-            elif cond == "level":
-                if checker.get("level") and target.get("level"):
-                    if not is_similar_level(checker["level"], target["level"]):
-                        return False
-        
-        return True
+        conditions = checker.condition_masks[checker_relaxation]
+        return not conditions or MatchService._wants(checker, target, conditions)
     
     @staticmethod
-    def check_mutual_match(user_a: dict, user_b: dict, a_relaxation: int, b_relaxation: int) -> bool:
+    def check_mutual_match(user_a: WaitingRequest, user_b: WaitingRequest,
+                           a_relaxation: int, b_relaxation: int) -> bool:
         """
         양방향 조건 체크: 두 사용자가 서로를 원하는가?
         A가 B를 원하고 AND B가 A를 원해야 함
         """
-        a_wants_b = MatchService.check_one_way_match(user_a, user_b, a_relaxation)
-        b_wants_a = MatchService.check_one_way_match(user_b, user_a, b_relaxation)
-        return a_wants_b and b_wants_a
+        a_conditions = user_a.condition_masks[a_relaxation] if a_relaxation < RELAXATION_STEPS else 0
+        b_conditions = user_b.condition_masks[b_relaxation] if b_relaxation < RELAXATION_STEPS else 0
+        if a_conditions and not MatchService._wants(user_a, user_b, a_conditions):
+            return False
+        return not b_conditions or MatchService._wants(user_b, user_a, b_conditions)
     
     @staticmethod
-    def find_matching_users(requester: dict, relaxation_level: int = 0) -> List[dict]:
+    def find_matching_users(requester: WaitingRequest, relaxation_level: int = 0,
+                            limit: Optional[int] = None) -> List[WaitingRequest]:
         """
-        조건에 맞는 매칭 대상 찾기 (양방향 체크)
+        조건에 맞는 매칭 대상 찾기 (양방향 체크, 대기 순서로 최대 limit명)
+        - 기본 조건(시간, 가격대, 메뉴)이 같은 대기열 버킷만 탐색
         - requester가 candidate를 원하는가? (requester의 조건)
         - candidate가 requester를 원하는가? (candidate의 조건)
         """
+        # requester의 남은 조건으로 버킷 인덱스에서 후보를 먼저 좁힘
+        narrowing = {}
+        conditions = requester.remaining_conditions(relaxation_level)
+        if conditions & SAME_GENDER:
+            narrowing["gender"] = requester.gender
+        if conditions & SIMILAR_AGE:
+            narrowing["age_range"] = (requester.age - SIMILAR_AGE_RANGE, requester.age + SIMILAR_AGE_RANGE)
+        if conditions & SAME_LEVEL:
+            narrowing["levels"] = similar_level_codes(requester.level)
+        
         matching_users = []
-        all_waiting = data_store.get_all_waiting_users()
+        candidates = data_store.get_waiting_candidates(*requester.bucket_key, **narrowing)
         
-        for candidate in all_waiting:
-            if candidate["id"] == requester["id"]:
+        for candidate in candidates:
+            if candidate.id == requester.id:
                 continue
             
-            # 기본 조건: 시간, 가격대, 메뉴 (필수)
-            if candidate["timeSlot"] != requester["timeSlot"]:
-                continue
-            if candidate["priceRange"] != requester["priceRange"]:
-                continue
-            if candidate["menu"] != requester["menu"]:
-                continue
-            
-            # candidate의 경과 시간으로 relaxation level 계산
-            candidate_elapsed = MatchService.get_elapsed_seconds(candidate.get("joinedAt", ""))
-            candidate_relaxation = MatchService.get_relaxation_level_from_elapsed(candidate_elapsed)
-            
-            # 양방향 조건 체크
+            # 양방향 조건 체크 (candidate의 완화 단계는 RelaxationTimers가 갱신)
+            candidate_relaxation = candidate.relaxation_level
             if MatchService.check_mutual_match(requester, candidate, relaxation_level, candidate_relaxation):
                 matching_users.append(candidate)
+                if limit and len(matching_users) >= limit:
+                    break
         
         return matching_users
     
     @staticmethod
-    def get_relaxation_message(relaxation_level: int, preferences: dict) -> Optional[str]:
+    def get_relaxation_message(relaxation_level: int, preferences: int) -> Optional[str]:
         """현재 완화 단계에 대한 메시지 반환"""
-        active_conditions = []
-        if preferences.get("sameGender"):
-            active_conditions.append("gender")
-        if preferences.get("similarAge"):
-            active_conditions.append("age")
-        if preferences.get("sameLevel"):
-            active_conditions.append("level")
+        active_conditions = MatchService.get_active_conditions(preferences)
         
         if relaxation_level == 0 or relaxation_level >= len(active_conditions):
             return None
@@ -148,232 +142,229 @@ class MatchService:
                    age: int, level: str, time_slot: str, price_range: str,
                    menu: str, preferences: dict) -> dict:
         """매칭 참여"""
+        # 같은 유저의 동시 참여 요청은 하나씩 처리 (활동 확인 ~ 대기열 추가)
+        with user_locks.hold(user_id):
+            # 이미 참여 중인 점심 활동이 있는지 확인 (방 또는 완료된 그룹)
+            if user_id:
+                active_room = data_store.get_user_active_room(user_id)
+                if active_room:
+                    return {
+                        "status": "already_active",
+                        "message": "이미 점심방에 참여 중입니다. 먼저 나가기를 해주세요.",
+                        "activeType": "room",
+                        "activeId": active_room["id"],
+                    }
+            
+                active_group = data_store.get_user_active_group(user_id)
+                if active_group:
+                    return {
+                        "status": "already_active",
+                        "message": "이미 매칭이 완료된 그룹이 있습니다.",
+                        "activeType": "group",
+                        "activeId": active_group["id"],
+                    }
         
-        # 이미 참여 중인 점심 활동이 있는지 확인 (방 또는 완료된 그룹)
-        if user_id:
-            active_room = data_store.get_user_active_room(user_id)
-            if active_room:
-                return {
-                    "status": "already_active",
-                    "message": "이미 점심방에 참여 중입니다. 먼저 나가기를 해주세요.",
-                    "activeType": "room",
-                    "activeId": active_room["id"],
-                }
+            # 동일 userId의 기존 매칭 요청 제거 (중복 참여 방지)
+            if user_id:
+                data_store.remove_waiting_user_by_user_id(user_id)
+        
+            match_request = WaitingRequest.create(
+                generate_id(), user_id or generate_id(), name, department, gender, age, level,
+                time_slot, price_range, menu, preferences,
+            )
+        
+            # 매칭 시도 ~ 대기열 추가는 버킷 단위로 직렬화
+            # (같은 버킷에 동시에 들어온 두 요청이 서로를 못 보고 둘 다 대기하지 않도록)
+            with bucket_locks.hold(data_store.waiting_bucket_key(time_slot, price_range, menu)):
+                # 모든 조건으로 매칭 시도
+                result = MatchService.try_match(match_request, relaxation_level=0, queued=False)
             
-            active_group = data_store.get_user_active_group(user_id)
-            if active_group:
-                return {
-                    "status": "already_active",
-                    "message": "이미 매칭이 완료된 그룹이 있습니다.",
-                    "activeType": "group",
-                    "activeId": active_group["id"],
-                }
+                # 매칭 성공
+                if result:
+                    match_joins.inc("matched")
+                    return {**result, "matchRequest": match_request.to_dict()}
+            
+                # 대기열에 추가 (이후 완화 단계가 바뀔 때마다 MatchScheduler가 다시 시도)
+                data_store.add_waiting_user(match_request)
+                relaxation_timers.schedule(match_request.id)
+                match_joins.inc("waiting")
+        
+            waiting_count = data_store.count_waiting_users_by_conditions(
+                time_slot, price_range, menu
+            )
+        
+            return {
+                "status": "waiting",
+                "matchRequestId": match_request.id,
+                "userId": match_request.user_id,
+                "waitingCount": waiting_count,
+                "relaxationLevel": 0,
+                "relaxationMessage": None,
+            }
+    
+    @staticmethod
+    def try_match(requester: WaitingRequest, relaxation_level: int, queued: bool = True) -> Optional[dict]:
+        """
+        requester 기준으로 매칭 시도
+        성공하면 대기열에서 멤버를 빼고 그룹 + 점심방을 만든 뒤 결과 반환, 실패하면 None
+        queued: requester가 대기열에 있는 요청인지 (새 참여 요청이면 False)
+        """
+        matching_users = MatchService.find_matching_users(
+            requester, relaxation_level, limit=MAX_GROUP_SIZE - 1
+        )
+        if not matching_users:
+            return None
         
-        # 동일 userId의 기존 매칭 요청 제거 (중복 참여 방지)
-        if user_id:
-            data_store.remove_waiting_user_by_user_id(user_id)
+        group_members = [requester] + matching_users[:MAX_GROUP_SIZE - 1]
+        claim_ids = [m.id for m in group_members[0 if queued else 1:]]
+        return MatchService.create_match_group(group_members, relaxation_level, claim_ids)
+    
+    @staticmethod
+    def create_match_group(group_members: List[WaitingRequest], relaxation_level: int,
+                           claim_ids: Optional[List[str]] = None) -> Optional[dict]:
+        """
+        매칭된 멤버들로 그룹 + 점심방 생성 (첫 번째 멤버 기준)
+        claim_ids(기본: 전체 멤버)는 그룹 생성과 함께 대기열에서 제거됩니다.
+        그 사이 다른 곳에서 취소/매칭되어 대기열에 없는 멤버가 있으면 None
+        그룹 멤버는 매칭 시점의 to_dict() 형식으로 저장됩니다.
+        """
+        if claim_ids is None:
+            claim_ids = [m.id for m in group_members]
         
-        match_request = {
-            "id": generate_id(),
-            "userId": user_id or generate_id(),
-            "name": name,
-            "department": department,
-            "gender": gender,
-            "age": age,
-            "level": level,
+        # 그룹 생성 + 대기열에서 제거 (한 번에 처리되어 한 요청이 두 그룹에 들어가지 않음)
+        time_slot, price_range, menu = group_members[0].bucket_key
+        restaurant = restaurant_catalog.recommend(menu, price_range)
+        members = [m.to_dict() for m in group_members]
+        group = data_store.create_group({
+            "members": members,
             "timeSlot": time_slot,
             "priceRange": price_range,
             "menu": menu,
-            "preferences": preferences or {},
-            "joinedAt": datetime.now().isoformat(),
-            "relaxationLevel": 0,
-        }
+            "restaurant": restaurant,
+            "relaxationApplied": relaxation_level > 0,
+        }, claim_request_ids=claim_ids)
+        if group is None:
+            return None
         
-        # 모든 조건으로 매칭 시도
-        matching_users = MatchService.find_matching_users(match_request, relaxation_level=0)
+        # 참여 → 매칭 대기 시간 (멤버별 매칭 시점 완화 단계) + 그룹 크기
+        now = time.time()
+        for member in group_members:
+            match_wait.observe(max(now - member.joined_at, 0.0), str(member.relaxation_level))
+        match_group_size.observe(len(group_members))
         
-        # 매칭 성공
-        if len(matching_users) >= 1:
-            group_members = [match_request] + matching_users[:MAX_GROUP_SIZE - 1]
-            member_ids = [m["id"] for m in group_members]
-            
-            # 대기열에서 제거
-            data_store.remove_waiting_users(member_ids)
-            
-            # 각 멤버의 매칭 횟수 증가
-            for member in group_members:
-                if member.get("userId"):
-                    data_store.increment_match_count(member["userId"])
-            
-            # 그룹 생성
-            restaurant = get_recommended_restaurant(menu, price_range)
-            group = data_store.create_group({
-                "members": group_members,
-                "timeSlot": time_slot,
-                "priceRange": price_range,
-                "menu": menu,
-                "restaurant": restaurant,
-            })
-            
-            # 매칭 완료 시 자동으로 점심방도 생성
-            room_members = [
-                {
-                    "id": m.get("userId"),
-                    "name": m.get("name"),
-                    "department": m.get("department"),
-                    "level": m.get("level"),
-                }
-                for m in group_members
-                if m.get("userId")
-            ]
-            
-            menu_names = {
-                "korean": "한식",
-                "japanese": "일식", 
-                "chinese": "중식",
-                "western": "양식",
-                "salad": "샐러드",
-                "snack": "분식",
-            }
-            
-            room = data_store.create_room({
-                "title": f"{menu_names.get(menu, menu)} 점심 모임",
-                "timeSlot": time_slot,
-                "priceRange": price_range,
-                "menu": menu,
-                "maxCount": len(room_members),
-                "members": room_members,
-                "restaurant": restaurant,
-                "status": "full",  # 매칭 완료된 방
-                "isAutoMatched": True,  # 자동 매칭으로 생성된 방
-                "groupId": group["id"],  # 연결된 그룹 ID
-            })
-            
-            return {
-                "status": "matched",
-                "groupId": group["id"],
-                "roomId": room["id"],
-                "matchRequest": match_request,
+        # 각 멤버의 매칭 횟수 증가
+        for member in group_members:
+            if member.user_id:
+                data_store.increment_match_count(member.user_id)
+        
+        # 매칭 완료 시 자동으로 점심방도 생성
+        room_members = [
+            {
+                "id": m.get("userId"),
+                "name": m.get("name"),
+                "department": m.get("department"),
+                "level": m.get("level"),
             }
+            for m in members
+            if m.get("userId")
+        ]
         
-        # 대기열에 추가
-        data_store.add_waiting_user(match_request)
+        menu_names = {
+            "korean": "한식",
+            "japanese": "일식", 
+            "chinese": "중식",
+            "western": "양식",
+            "salad": "샐러드",
+            "snack": "분식",
+        }
         
-        waiting_count = len(data_store.get_waiting_users_by_conditions(
-            time_slot, price_range, menu
-        ))
+        room = data_store.create_room({
+            "title": f"{menu_names.get(menu, menu)} 점심 모임",
+            "timeSlot": time_slot,
+            "priceRange": price_range,
+            "menu": menu,
+            "maxCount": len(room_members),
+            "members": room_members,
+            "restaurant": restaurant,
+            "status": "full",  # 매칭 완료된 방
+            "isAutoMatched": True,  # 자동 매칭으로 생성된 방
+            "groupId": group["id"],  # 연결된 그룹 ID
+        })
         
         return {
-            "status": "waiting",
-            "matchRequestId": match_request["id"],
-            "userId": match_request["userId"],
-            "waitingCount": waiting_count,
-            "relaxationLevel": 0,
-            "relaxationMessage": None,
+            "status": "matched",
+            "groupId": group["id"],
+            "roomId": room["id"],
+            "relaxationLevel": relaxation_level,
         }
     
     @staticmethod
-    def get_match_status(match_request_id: str, elapsed_seconds: int = 0) -> dict:
-        """매칭 상태 확인 (점진적 조건 완화)"""
+    def run_matching_pass(request_ids: List[str], deadline: float) -> int:
+        """
+        완화 단계가 바뀐 요청들만 다시 매칭 시도 (MatchScheduler에서 호출)
+        deadline(time.monotonic 기준)을 넘기면 중단하고 처리한 요청 수를 반환합니다.
+        """
+        for done, request_id in enumerate(request_ids):
+            if time.monotonic() >= deadline:
+                return done
+            # 그 사이 다른 요청과 매칭/취소된 경우 건너뜀
+            requester = data_store.get_waiting_user_by_id(request_id)
+            if not requester:
+                continue
+            with bucket_locks.hold(requester.bucket_key):
+                MatchService.try_match(requester, requester.relaxation_level)
+        return len(request_ids)
+    
+    @staticmethod
+    def restore_waiting_timers() -> int:
+        """
+        저장소에 남아 있던 대기 요청의 완화 타이머를 joinedAt 기준으로 다시 등록 (서버 시작 시)
+        이미 지난 완화 단계/타임아웃은 첫 회전에서 바로 처리됩니다.
+        """
+        requests = data_store.get_all_waiting_users()
+        now = time.monotonic()
+        for request in requests:
+            elapsed = MatchService.get_elapsed_seconds(request.joined_at)
+            relaxation_timers.schedule(request.id, joined=now - elapsed)
+        return len(requests)
+    
+    @staticmethod
+    def get_match_status(match_request_id: str) -> dict:
+        """
+        매칭 상태 확인 (점진적 조건 완화)
+        매칭 시도와 완화 단계/타임아웃 갱신은 MatchScheduler가 서버 시각 기준으로 수행하고,
+        여기서는 결과만 조회합니다.
+        """
         
         # 그룹에서 이미 매칭됐는지 확인
         group = data_store.get_group_by_member_id(match_request_id)
         if group:
             return {"status": "matched", "groupId": group["id"]}
         
+        # 타임아웃으로 대기열에서 빠진 요청
+        expired = data_store.get_expired_request(match_request_id)
+        if expired:
+            return {
+                "status": "timeout",
+                "relaxationLevel": expired.relaxation_level,
+                "relaxationMessage": "매칭 시간이 초과되었습니다.",
+            }
+        
         # 대기열 확인
         in_waiting = data_store.get_waiting_user_by_id(match_request_id)
         if not in_waiting:
             return {"status": "not_found"}
         
-        # 경과 시간에 따른 완화 단계 계산
-        relaxation_level = min(elapsed_seconds // RELAXATION_INTERVAL_SECONDS, 3)
-        
-        # 현재 완화 단계로 매칭 시도
-        matching_users = MatchService.find_matching_users(in_waiting, relaxation_level)
-        
-        # 매칭 성공
-        if len(matching_users) >= 1:
-            group_members = [in_waiting] + matching_users[:MAX_GROUP_SIZE - 1]
-            member_ids = [m["id"] for m in group_members]
-            
-            # 대기열에서 제거
-            data_store.remove_waiting_users(member_ids)
-            
-            # 각 멤버의 매칭 횟수 증가
-            for member in group_members:
-                if member.get("userId"):
-                    data_store.increment_match_count(member["userId"])
-            
-            # 그룹 생성
-            restaurant = get_recommended_restaurant(in_waiting["menu"], in_waiting["priceRange"])
-            group = data_store.create_group({
-                "members": group_members,
-                "timeSlot": in_waiting["timeSlot"],
-                "priceRange": in_waiting["priceRange"],
-                "menu": in_waiting["menu"],
-                "restaurant": restaurant,
-                "relaxationApplied": relaxation_level > 0,
-            })
-            
-            # 매칭 완료 시 자동으로 점심방도 생성
-            room_members = [
-                {
-                    "id": m.get("userId"),
-                    "name": m.get("name"),
-                    "department": m.get("department"),
-                    "level": m.get("level"),
-                }
-                for m in group_members
-                if m.get("userId")
-            ]
-            
-            menu_names = {
-                "korean": "한식",
-                "japanese": "일식", 
-                "chinese": "중식",
-                "western": "양식",
-                "salad": "샐러드",
-                "snack": "분식",
-            }
-            
-            room = data_store.create_room({
-                "title": f"{menu_names.get(in_waiting['menu'], in_waiting['menu'])} 점심 모임",
-                "timeSlot": in_waiting["timeSlot"],
-                "priceRange": in_waiting["priceRange"],
-                "menu": in_waiting["menu"],
-                "maxCount": len(room_members),
-                "members": room_members,
-                "restaurant": restaurant,
-                "status": "full",  # 매칭 완료된 방
-                "isAutoMatched": True,  # 자동 매칭으로 생성된 방
-                "groupId": group["id"],  # 연결된 그룹 ID
-            })
-            
-            return {
-                "status": "matched",
-                "groupId": group["id"],
-                "roomId": room["id"],
-                "relaxationLevel": relaxation_level,
-            }
+        relaxation_level = in_waiting.relaxation_level
+        elapsed_seconds = relaxation_timers.elapsed_seconds(match_request_id)
+        if elapsed_seconds is None:
+            elapsed_seconds = MatchService.get_elapsed_seconds(in_waiting.joined_at)
         
         # 완화 메시지 생성
-        preferences = in_waiting.get("preferences", {})
-        relaxation_message = MatchService.get_relaxation_message(relaxation_level, preferences)
-        
-        # 타임아웃 체크
-        if elapsed_seconds >= MATCHING_TIMEOUT_SECONDS:
-            return {
-                "status": "timeout",
-                "relaxationLevel": relaxation_level,
-                "relaxationMessage": "매칭 시간이 초과되었습니다.",
-            }
+        relaxation_message = MatchService.get_relaxation_message(relaxation_level, in_waiting.preferences)
         
         # 대기 중인 전체 인원 (나 포함)
-        all_waiting = data_store.get_waiting_users_by_conditions(
-            in_waiting["timeSlot"], in_waiting["priceRange"], in_waiting["menu"]
-        )
-        waiting_count = len(all_waiting)  # 나 포함 전체 인원
+        waiting_count = data_store.count_waiting_users_by_conditions(*in_waiting.bucket_key)
         
         return {
             "status": "waiting",
@@ -383,6 +374,38 @@ class MatchService:
             "elapsedSeconds": elapsed_seconds,
         }
     
+    @staticmethod
+    async def stream_match_status(match_request_id: str) -> AsyncIterator[str]:
+        """
+        매칭 상태 SSE 스트림
+        대기 인원/완화 단계가 바뀔 때만 이벤트를 보내고,
+        matched / timeout / not_found는 한 번 보낸 뒤 종료합니다.
+        """
+        # 저장소 조회는 동기 코드(sqlite면 DB 쿼리)이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+        in_waiting = await asyncio.to_thread(data_store.get_waiting_user_by_id, match_request_id)
+        subscription = None
+        if in_waiting:
+            subscription = match_events.subscribe(in_waiting.bucket_key)
+        
+        last_sent = None
+        try:
+            while True:
+                status = await asyncio.to_thread(MatchService.get_match_status, match_request_id)
+                # 경과 시간은 매초 바뀌므로 변경 판단에서 제외
+                changed = {k: v for k, v in status.items() if k != "elapsedSeconds"}
+                if changed != last_sent:
+                    last_sent = changed
+                    yield f"data: {json.dumps(status, ensure_ascii=False)}\n\n"
+                if status["status"] != "waiting":
+                    return
+                
+                # 대기 인원/완화 단계/타임아웃 변경은 모두 버킷 변경 알림으로 들어옴
+                if not await subscription.wait(MATCH_STREAM_KEEPALIVE_SECONDS):
+                    yield ": keepalive\n\n"
+        finally:
+            if subscription:
+                match_events.unsubscribe(subscription)
+    
     @staticmethod
     def cancel_match(match_request_id: str) -> dict:
         """매칭 취소"""
@@ -395,15 +418,16 @@ class MatchService:
         # 매칭 대기 중인지 확인
         waiting = data_store.get_waiting_user_by_user_id(user_id)
         if waiting:
+            request = waiting.to_dict()
             return {
                 "active": True,
                 "type": "waiting",
                 "data": {
-                    "matchRequestId": waiting["id"],
-                    "timeSlot": waiting.get("timeSlot"),
-                    "menu": waiting.get("menu"),
-                    "priceRange": waiting.get("priceRange"),
-                    "joinedAt": waiting.get("joinedAt"),
+                    "matchRequestId": request["id"],
+                    "timeSlot": request["timeSlot"],
+                    "menu": request["menu"],
+                    "priceRange": request["priceRange"],
+                    "joinedAt": request["joinedAt"],
                 }
             }
         
@@ -0,0 +1,141 @@
+"""
+로컬 음식점(FD6) 카탈로그
+크롤링한 음식점 목록을 격자(grid) 공간 인덱스로 들고 있다가
+반경 검색 / 가까운 N개 검색을 카카오 API 호출 없이 처리합니다.
+
+디스크 파일은 gzip JSON 컬럼 형식입니다 (좌표는 1e-6도 정수).
+"""
+import gzip
+import json
+import math
+import os
+from typing import Optional, List, Tuple
+
+import numpy as np
+
+from ..core.config import PLACE_CATALOG_GRID_METERS
+
+EARTH_RADIUS_METERS = 6_371_000
+METERS_PER_DEGREE = math.pi * EARTH_RADIUS_METERS / 180
+COORDINATE_SCALE = 1_000_000  # 파일에 저장하는 좌표 단위 (1e-6도)
+CELL_KEY_STRIDE = 1 << 32  # 격자 칸 (x, y) -> 정렬 키 y * STRIDE + x
+CATALOG_FILE_VERSION = 1
+
+# 좌표 외에 저장하는 음식점 필드 (API 응답 필드명)
+PLACE_FIELDS = ["id", "name", "category", "phone", "address", "roadAddress", "placeUrl"]
+
+
+def haversine_meters(lat1, lon1, lat2, lon2):
+    """두 좌표 사이 거리(m), NumPy 배열도 지원"""
+    lat1, lon1, lat2, lon2 = map(np.radians, (lat1, lon1, lat2, lon2))
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_METERS * np.arcsin(np.sqrt(a))
+
+
+class PlaceCatalog:
+    """
+    크롤링 영역(중심 + 반경) 안의 음식점 + 격자 인덱스 (생성 후 변경하지 않음)
+    partial이면 요청 수 한도로 크롤링이 중간에 끊겨 반경을 다 끝낸 영역까지로 줄인 카탈로그입니다.
+    격자는 중심 기준 평면 근사 좌표(m)를 grid_meters 크기 칸으로 나눈 것입니다.
+    """
+
+    def __init__(self, places: List[dict], center: Tuple[float, float], radius_meters: float,
+                 crawled_at: Optional[str] = None, grid_meters: float = PLACE_CATALOG_GRID_METERS,
+                 partial: bool = False):
+        self.places = places
+        self.center = center
+        self.radius_meters = radius_meters
+        self.crawled_at = crawled_at
+        self.partial = partial
+        self.grid_meters = grid_meters
+        self._lats = np.array([p["latitude"] for p in places], dtype=np.float64)
+        self._lons = np.array([p["longitude"] for p in places], dtype=np.float64)
+        self._meters_per_lon = METERS_PER_DEGREE * math.cos(math.radians(center[0]))
+
+        # 음식점을 격자 칸 (y, x) 순으로 정렬 -> 한 행(y)의 연속된 칸은 배열의 연속 구간
+        cx, cy = self._cell_of(self._lats, self._lons)
+        self._order = np.lexsort((np.arange(len(places)), cx, cy))
+        self._cell_keys = (cy * CELL_KEY_STRIDE + cx)[self._order]
+
+    def __len__(self) -> int:
+        return len(self.places)
+
+    def _cell_of(self, lats, lons):
+        """좌표 -> 격자 칸 (x, y)"""
+        x = (np.asarray(lons) - self.center[1]) * self._meters_per_lon
+        y = (np.asarray(lats) - self.center[0]) * METERS_PER_DEGREE
+        return np.floor(x / self.grid_meters).astype(np.int64), np.floor(y / self.grid_meters).astype(np.int64)
+
+    def covers(self, latitude: float, longitude: float, radius_meters: float) -> bool:
+        """검색 원(좌표 + 반경)이 크롤링 영역 안에 완전히 들어가는지"""
+        distance = float(haversine_meters(self.center[0], self.center[1], latitude, longitude))
+        return distance + radius_meters <= self.radius_meters
+
+    def within(self, latitude: float, longitude: float, radius_meters: float) -> Tuple[np.ndarray, np.ndarray]:
+        """반경 안의 음식점 (인덱스, 거리) - 가까운 순"""
+        cx, cy = self._cell_of(latitude, longitude)
+        # 평면 근사 오차를 고려해 한 칸 더 넓게 후보를 모으고, 거리는 haversine으로 정확히 계산
+        span = int(math.ceil(radius_meters / self.grid_meters)) + 1
+        rows = np.arange(cy - span, cy + span + 1) * CELL_KEY_STRIDE
+        starts = np.searchsorted(self._cell_keys, rows + (cx - span))
+        ends = np.searchsorted(self._cell_keys, rows + (cx + span), side="right")
+        indices = np.concatenate([self._order[a:b] for a, b in zip(starts, ends) if a < b] or [self._order[:0]])
+        distances = haversine_meters(latitude, longitude, self._lats[indices], self._lons[indices])
+        inside = distances <= radius_meters
+        indices, distances = indices[inside], distances[inside]
+        order = np.lexsort((indices, distances))  # 거리 같으면 인덱스 순 (결과 고정)
+        return indices[order], distances[order]
+
+    def nearest(self, latitude: float, longitude: float, count: int) -> Tuple[np.ndarray, np.ndarray]:
+        """가까운 count개 음식점 (인덱스, 거리) - 반경을 두 배씩 늘려가며 검색"""
+        radius = self.grid_meters
+        max_radius = self.radius_meters * 2 + float(haversine_meters(self.center[0], self.center[1], latitude, longitude))
+        while True:
+            indices, distances = self.within(latitude, longitude, radius)
+            if len(indices) >= count or radius >= max_radius:
+                return indices[:count], distances[:count]
+            radius *= 2
+
+    def to_response(self, index: int, distance: float) -> dict:
+        """검색 결과 1건 (카카오 프록시 응답과 같은 필드)"""
+        return {**self.places[index], "distance": int(round(distance))}
+
+    # ============ 디스크 파일 ============
+    def save(self, path: str):
+        """gzip JSON 컬럼 형식으로 저장 (임시 파일에 쓰고 교체)"""
+        data = {
+            "version": CATALOG_FILE_VERSION,
+            "center": list(self.center),
+            "radiusMeters": self.radius_meters,
+            "crawledAt": self.crawled_at,
+            "partial": self.partial,
+            "latitudes": [round(p["latitude"] * COORDINATE_SCALE) for p in self.places],
+            "longitudes": [round(p["longitude"] * COORDINATE_SCALE) for p in self.places],
+            **{field: [p.get(field) for p in self.places] for field in PLACE_FIELDS},
+        }
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> Optional["PlaceCatalog"]:
+        """파일에서 카탈로그 로드 (파일이 없거나 형식이 다르면 None)"""
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != CATALOG_FILE_VERSION:
+            return None
+        places = [
+            {
+                **{field: data[field][i] for field in PLACE_FIELDS},
+                "latitude": data["latitudes"][i] / COORDINATE_SCALE,
+                "longitude": data["longitudes"][i] / COORDINATE_SCALE,
+            }
+            for i in range(len(data["latitudes"]))
+        ]
+        return cls(places, tuple(data["center"]), data["radiusMeters"], data.get("crawledAt"),
+                   partial=data.get("partial", False))
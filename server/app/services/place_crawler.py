@@ -0,0 +1,235 @@
+"""
+음식점 카탈로그 크롤러
+회사 좌표 주변의 카카오 FD6(음식점) 카테고리를 크롤링해서 로컬 카탈로그 파일을 만들고,
+FastAPI lifespan에서 시작되는 백그라운드 작업으로 주기적으로 갱신합니다.
+
+카카오 카테고리 검색은 한 영역(rect)당 최대 45건(15건 x 3페이지)까지만 주므로
+결과가 그보다 많은 영역은 4등분해서 다시 검색합니다.
+영역은 중심에서 가까운 것부터 검색하고, 요청 수 한도에 걸리면 그때까지 모은 결과는 버리지 않고
+다 못 끝낸 영역에 닿지 않는 반경으로 줄인 부분(partial) 카탈로그로 만듭니다.
+"""
+import asyncio
+import itertools
+import math
+from datetime import datetime
+from typing import Optional, Dict, List
+
+from ..core.config import (
+    KAKAO_REST_API_KEY, KAKAO_CATEGORY_SEARCH_URL, YEOUIDO_LATITUDE, YEOUIDO_LONGITUDE,
+    PLACE_CATALOG_PATH, PLACE_CATALOG_RADIUS_METERS, PLACE_CATALOG_REFRESH_HOURS,
+    PLACE_CATALOG_CRAWL_ENABLED, PLACE_CATALOG_MAX_REQUESTS,
+    PLACE_CATALOG_RETRY_SECONDS, PLACE_CATALOG_RETRY_MAX_SECONDS,
+)
+from ..core.http_client import http_client
+from .place_catalog import PlaceCatalog, haversine_meters, METERS_PER_DEGREE
+
+PAGE_SIZE = 15
+MAX_PAGES = 3
+MAX_RESULTS_PER_RECT = PAGE_SIZE * MAX_PAGES
+MIN_RECT_METERS = 25  # 이보다 작은 영역은 더 나누지 않음
+CRAWL_CONCURRENCY = 4  # 동시에 검색하는 영역 수 (작업자 수)
+
+
+def kakao_document_to_place(document: dict) -> dict:
+    """카카오 검색 결과 1건 -> 음식점 (API 응답 필드명, distance 제외)"""
+    return {
+        "id": document.get("id"),
+        "name": document.get("place_name"),
+        "category": document.get("category_name"),
+        "phone": document.get("phone"),
+        "address": document.get("address_name"),
+        "roadAddress": document.get("road_address_name"),
+        "latitude": float(document.get("y")),
+        "longitude": float(document.get("x")),
+        "placeUrl": document.get("place_url"),
+    }
+
+
+class PlaceCrawler:
+    """중심 + 반경 영역의 FD6 음식점 크롤링"""
+
+    def __init__(self, url: str = KAKAO_CATEGORY_SEARCH_URL, max_requests: int = PLACE_CATALOG_MAX_REQUESTS):
+        self.url = url
+        self.max_requests = max_requests
+        self.requests = 0
+        self.incomplete: List[tuple] = []  # 요청 수 한도 때문에 다 못 끝낸 영역
+        self._sequence = itertools.count()  # 대기열에서 거리가 같은 영역은 넣은 순서대로
+
+    async def _search(self, rect: tuple, page: int) -> Optional[dict]:
+        """rect = (min_lon, min_lat, max_lon, max_lat), 요청 수 한도에 걸리면 None"""
+        if self.requests >= self.max_requests:
+            return None
+        self.requests += 1
+        response = await http_client.client.get(
+            self.url,
+            headers={"Authorization": f"KakaoAK {KAKAO_REST_API_KEY}"},
+            params={
+                "category_group_code": "FD6",
+                "rect": ",".join(f"{v:.6f}" for v in rect),
+                "page": page,
+                "size": PAGE_SIZE,
+            },
+        )
+        response.raise_for_status()
+        return response.json()
+
+    async def _crawl_rect(self, rect: tuple, places: Dict[str, dict]) -> List[tuple]:
+        """영역 1개 검색, 결과가 45건보다 많으면 4등분한 하위 영역 반환"""
+        first = await self._search(rect, 1)
+        if first is None:
+            self.incomplete.append(rect)
+            return []
+        min_lon, min_lat, max_lon, max_lat = rect
+        width = (max_lon - min_lon) * METERS_PER_DEGREE * math.cos(math.radians((min_lat + max_lat) / 2))
+        if first.get("meta", {}).get("total_count", 0) > MAX_RESULTS_PER_RECT and width > MIN_RECT_METERS:
+            mid_lon, mid_lat = (min_lon + max_lon) / 2, (min_lat + max_lat) / 2
+            return [
+                (min_lon, min_lat, mid_lon, mid_lat), (mid_lon, min_lat, max_lon, mid_lat),
+                (min_lon, mid_lat, mid_lon, max_lat), (mid_lon, mid_lat, max_lon, max_lat),
+            ]
+        result, page = first, 1
+        while True:
+            for document in result.get("documents", []):
+                places[document["id"]] = kakao_document_to_place(document)
+            if result.get("meta", {}).get("is_end", True) or page >= MAX_PAGES:
+                return []
+            page += 1
+            result = await self._search(rect, page)
+            if result is None:
+                self.incomplete.append(rect)
+                return []
+
+    async def _worker(self, queue: asyncio.PriorityQueue, center: tuple, places: Dict[str, dict]):
+        """대기열에서 중심에 가장 가까운 영역을 꺼내 검색하고, 나눈 하위 영역은 다시 대기열에"""
+        while True:
+            _, _, rect = await queue.get()
+            try:
+                for sub in await self._crawl_rect(rect, places):
+                    queue.put_nowait((self._distance_to_rect(*center, sub), next(self._sequence), sub))
+            finally:
+                queue.task_done()
+
+    @staticmethod
+    def _distance_to_rect(latitude: float, longitude: float, rect: tuple) -> float:
+        """좌표에서 영역(rect)의 가장 가까운 점까지 거리(m), 영역 안이면 0"""
+        min_lon, min_lat, max_lon, max_lat = rect
+        nearest_lat = min(max(latitude, min_lat), max_lat)
+        nearest_lon = min(max(longitude, min_lon), max_lon)
+        return float(haversine_meters(latitude, longitude, nearest_lat, nearest_lon))
+
+    async def crawl(self, latitude: float, longitude: float, radius_meters: float) -> PlaceCatalog:
+        """
+        중심 + 반경 영역 크롤링 -> 카탈로그 (영역 밖 결과는 제외)
+        요청 수 한도에 걸리면 다 못 끝낸 영역까지의 거리로 반경을 줄이고 partial로 표시합니다.
+        """
+        d_lat = radius_meters / METERS_PER_DEGREE
+        d_lon = radius_meters / (METERS_PER_DEGREE * math.cos(math.radians(latitude)))
+        places: Dict[str, dict] = {}
+        queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        queue.put_nowait((0.0, next(self._sequence),
+                          (longitude - d_lon, latitude - d_lat, longitude + d_lon, latitude + d_lat)))
+        workers = [
+            asyncio.create_task(self._worker(queue, (latitude, longitude), places))
+            for _ in range(CRAWL_CONCURRENCY)
+        ]
+        done_task = asyncio.create_task(queue.join())
+        try:
+            # 대기열이 빌 때까지, 작업자가 예외로 끝나면 바로 중단
+            await asyncio.wait([done_task, *workers], return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in [done_task, *workers]:
+                task.cancel()
+            await asyncio.gather(done_task, *workers, return_exceptions=True)
+        for task in workers:
+            if not task.cancelled() and task.exception() is not None:
+                raise task.exception()
+        covered = min([radius_meters] + [self._distance_to_rect(latitude, longitude, r) for r in self.incomplete])
+        inside = [
+            p for p in places.values()
+            if haversine_meters(latitude, longitude, p["latitude"], p["longitude"]) <= covered
+        ]
+        inside.sort(key=lambda p: p["id"])
+        return PlaceCatalog(inside, (latitude, longitude), covered, datetime.now().isoformat(),
+                            partial=bool(self.incomplete))
+
+
+class PlaceCatalogRefresher:
+    """
+    FastAPI lifespan에서 시작/종료되는 카탈로그 관리 작업
+    시작 시 디스크 파일을 로드하고, 없거나 PLACE_CATALOG_REFRESH_HOURS보다 오래됐으면 다시 크롤링합니다.
+    """
+
+    def __init__(self, path: str = PLACE_CATALOG_PATH,
+                 center: tuple = (YEOUIDO_LATITUDE, YEOUIDO_LONGITUDE),
+                 radius_meters: float = PLACE_CATALOG_RADIUS_METERS):
+        self.path = path
+        self.center = center
+        self.radius_meters = radius_meters
+        self.catalog: Optional[PlaceCatalog] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def load(self) -> Optional[PlaceCatalog]:
+        """디스크 파일에서 카탈로그 로드"""
+        catalog = PlaceCatalog.load(self.path)
+        if catalog is not None:
+            self.catalog = catalog
+        return catalog
+
+    def _seconds_until_refresh(self) -> float:
+        if self.catalog is None or not self.catalog.crawled_at:
+            return 0
+        age = (datetime.now() - datetime.fromisoformat(self.catalog.crawled_at)).total_seconds()
+        return max(PLACE_CATALOG_REFRESH_HOURS * 3600 - age, 0)
+
+    async def refresh(self) -> PlaceCatalog:
+        """
+        크롤링해서 파일 저장 + 교체
+        부분 크롤링 결과가 지금 카탈로그보다 좁은 영역이면 교체하지 않고 실패로 처리합니다.
+        """
+        catalog = await PlaceCrawler().crawl(*self.center, self.radius_meters)
+        if catalog.partial and (
+            catalog.radius_meters <= 0
+            or (self.catalog is not None and catalog.radius_meters < self.catalog.radius_meters)
+        ):
+            raise RuntimeError(f"요청 수 한도 초과, 부분 크롤링 반경 {catalog.radius_meters:.0f}m로는 교체하지 않음")
+        await asyncio.to_thread(catalog.save, self.path)
+        self.catalog = catalog
+        return catalog
+
+    async def _loop(self):
+        retry_seconds = PLACE_CATALOG_RETRY_SECONDS
+        while True:
+            await asyncio.sleep(self._seconds_until_refresh())
+            try:
+                catalog = await self.refresh()
+            except Exception as e:
+                # 실패할 때마다 재시도 간격을 두 배로 (쿼터 소진 시 계속 두드리지 않도록)
+                print(f"⚠️ 음식점 카탈로그 크롤링 실패, {retry_seconds}초 후 재시도: {e}")
+                await asyncio.sleep(retry_seconds)
+                retry_seconds = min(retry_seconds * 2, PLACE_CATALOG_RETRY_MAX_SECONDS)
+                continue
+            retry_seconds = PLACE_CATALOG_RETRY_SECONDS
+            if catalog.partial:
+                print(f"⚠️ 음식점 카탈로그 부분 갱신 (요청 수 한도): {len(catalog)}곳, 반경 {catalog.radius_meters:.0f}m")
+            else:
+                print(f"✅ 음식점 카탈로그 갱신: {len(catalog)}곳")
+
+    def start(self):
+        """카탈로그 로드 + (설정 시) 백그라운드 크롤링 시작"""
+        self.load()
+        if PLACE_CATALOG_CRAWL_ENABLED and KAKAO_REST_API_KEY and self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        """백그라운드 크롤링 종료"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+# 싱글톤 인스턴스
+place_catalog_refresher = PlaceCatalogRefresher()
@@ -0,0 +1,68 @@
+"""
+조건 완화 타이머
+매칭 요청마다 참여 시각(time.monotonic)을 기록하고
+완화 단계가 바뀌는 시각과 타임아웃 시각을 힙에 미리 넣어둡니다.
+MatchScheduler는 시각이 된 항목만 꺼내서 해당 요청만 다시 매칭합니다.
+"""
+import heapq
+import itertools
+import threading
+import time
+from typing import Optional, List, Dict, Tuple
+
+from ..core.config import MATCHING_TIMEOUT_SECONDS, RELAXATION_INTERVAL_SECONDS, MAX_RELAXATION_LEVEL
+
+# pop_due 결과에서 타임아웃을 나타내는 level 값
+TIMEOUT = -1
+
+
+class RelaxationTimers:
+    """매칭 요청 ID -> 참여 시각 + (deadline, level) 힙"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._heap: List[Tuple[float, int, str, int]] = []
+        self._joined: Dict[str, float] = {}
+        self._seq = itertools.count()
+
+    def schedule(self, request_id: str, joined: Optional[float] = None):
+        """요청의 완화 단계별 deadline + 타임아웃 등록"""
+        joined = time.monotonic() if joined is None else joined
+        with self._lock:
+            self._joined[request_id] = joined
+            for level in range(1, MAX_RELAXATION_LEVEL + 1):
+                deadline = joined + level * RELAXATION_INTERVAL_SECONDS
+                heapq.heappush(self._heap, (deadline, next(self._seq), request_id, level))
+            heapq.heappush(self._heap, (joined + MATCHING_TIMEOUT_SECONDS, next(self._seq), request_id, TIMEOUT))
+
+    def elapsed_seconds(self, request_id: str) -> Optional[int]:
+        """참여 후 경과 시간(초), 등록되지 않은 요청이면 None"""
+        joined = self._joined.get(request_id)
+        if joined is None:
+            return None
+        return int(time.monotonic() - joined)
+
+    def next_deadline(self) -> Optional[float]:
+        """가장 가까운 deadline (time.monotonic 기준)"""
+        with self._lock:
+            return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now: Optional[float] = None) -> List[Tuple[str, int]]:
+        """
+        시각이 된 (매칭 요청 ID, 새 완화 단계 또는 TIMEOUT) 목록
+        이미 매칭/취소된 요청의 항목도 포함되므로 호출 측에서 대기 여부를 확인합니다.
+        """
+        now = time.monotonic() if now is None else now
+        due = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                _, _, request_id, level = heapq.heappop(self._heap)
+                if level == TIMEOUT:
+                    # 요청별 마지막 항목이므로 참여 시각도 정리
+                    self._joined.pop(request_id, None)
+                due.append((request_id, level))
+        return due
+
+
+# 싱글톤 인스턴스
+relaxation_timers = RelaxationTimers()
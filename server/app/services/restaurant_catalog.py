@@ -0,0 +1,152 @@
+"""
+식당 카탈로그
+설정(RESTAURANTS)의 식당 목록을 시작 시 한 번 인덱싱해서
+(종류, 가격대) 버킷 조회와 평점/거리 가중 추천을 O(1)로 처리합니다.
+
+만든 뒤에는 내부 상태를 바꾸지 않고, 식당은 항상 복사본으로 반환하므로
+여러 요청 스레드에서 동시에 호출해도 안전합니다.
+가중 샘플링은 버킷마다 미리 만든 alias 테이블(Walker's alias method)을 사용합니다.
+"""
+import heapq
+import random
+import secrets
+from itertools import product
+from typing import Dict, List, Optional, Tuple
+
+from ..core.config import RESTAURANTS, RESTAURANT_RATING_EXPONENT, RESTAURANT_DISTANCE_HALF_MINUTES
+
+REJECTION_ATTEMPTS_PER_PICK = 16  # 여러 개 추천 시 중복 뽑기 재시도 한도 (초과하면 남은 식당에서 직접 추첨)
+
+
+def restaurant_weight(restaurant: dict) -> float:
+    """추천 가중치: 평점이 높을수록, 거리(도보 분)가 가까울수록 큼"""
+    rating_weight = max(restaurant.get("rating", 0), 0) ** RESTAURANT_RATING_EXPONENT
+    distance_weight = 0.5 ** (max(restaurant.get("distance", 0), 0) / RESTAURANT_DISTANCE_HALF_MINUTES)
+    return rating_weight * distance_weight
+
+
+class _Bucket:
+    """식당 묶음 + alias 테이블 (생성 후 변경하지 않음)"""
+
+    __slots__ = ("restaurants", "weights", "_prob", "_alias")
+
+    def __init__(self, restaurants: Tuple[dict, ...]):
+        self.restaurants = restaurants
+        self.weights = tuple(restaurant_weight(r) for r in restaurants)
+        self._prob, self._alias = self._build_alias(self.weights)
+
+    @staticmethod
+    def _build_alias(weights: Tuple[float, ...]) -> Tuple[Tuple[float, ...], Tuple[int, ...]]:
+        """Vose 방식 alias 테이블 (가중치가 모두 0이면 균등)"""
+        n = len(weights)
+        total = sum(weights)
+        if n == 0:
+            return (), ()
+        scaled = [w * n / total for w in weights] if total > 0 else [1.0] * n
+        prob, alias = [1.0] * n, list(range(n))
+        small = [i for i, p in enumerate(scaled) if p < 1]
+        large = [i for i, p in enumerate(scaled) if p >= 1]
+        while small and large:
+            s, l = small.pop(), large.pop()
+            prob[s], alias[s] = scaled[s], l
+            scaled[l] -= 1 - scaled[s]
+            (small if scaled[l] < 1 else large).append(l)
+        # 남은 칸은 부동소수점 오차만큼만 1에서 벗어나므로 1로 둠
+        return tuple(prob), tuple(alias)
+
+    def __len__(self) -> int:
+        return len(self.restaurants)
+
+    def draw(self) -> int:
+        """가중치 비율로 인덱스 1개 추첨 (O(1))"""
+        i = int(random.random() * len(self.restaurants))
+        return i if random.random() < self._prob[i] else self._alias[i]
+
+    def draw_distinct(self, count: int) -> List[int]:
+        """중복 없이 count개 추첨 (앞에서 뽑힌 식당을 빼고 다시 가중 추첨하는 것과 같은 분포)"""
+        n = len(self.restaurants)
+        if count >= n:
+            return self._weighted_order(range(n), n)
+        picked: List[int] = []
+        seen = set()
+        for _ in range(count * REJECTION_ATTEMPTS_PER_PICK):
+            i = self.draw()
+            if i not in seen:
+                seen.add(i)
+                picked.append(i)
+                if len(picked) == count:
+                    return picked
+        # 가중치가 한쪽에 크게 몰린 버킷: 남은 식당에서 직접 추첨
+        rest = [i for i in range(n) if i not in seen]
+        return picked + self._weighted_order(rest, count - len(picked))
+
+    def _weighted_order(self, indices, count: int) -> List[int]:
+        """가중치 비율 비복원 추첨 (Efraimidis-Spirakis 키 정렬)"""
+        keys = [
+            (random.random() ** (1 / self.weights[i]) if self.weights[i] > 0 else -random.random(), i)
+            for i in indices
+        ]
+        return [i for _, i in heapq.nlargest(count, keys)]
+
+
+EMPTY_BUCKET = _Bucket(())
+
+
+class RestaurantCatalog:
+    """(종류, 가격대) 인덱스 식당 카탈로그 (None = 조건 없음)"""
+
+    def __init__(self, restaurants: List[dict]):
+        self._restaurants = tuple(dict(r) for r in restaurants)
+        # 식당 하나가 (종류, 가격대), (종류, None), (None, 가격대), (None, None) 네 묶음에 들어감
+        grouped: Dict[Tuple[Optional[str], Optional[str]], List[dict]] = {(None, None): []}
+        for r in self._restaurants:
+            for key in product([r["type"], None], [r["price"], None]):
+                grouped.setdefault(key, []).append(r)
+        self._buckets = {key: _Bucket(tuple(members)) for key, members in grouped.items()}
+        self.version = secrets.token_hex(4)  # 조회 응답 ETag (카탈로그를 새로 만들면 바뀜)
+
+    def __len__(self) -> int:
+        return len(self._restaurants)
+
+    def bucket(self, menu: Optional[str] = None, price_range: Optional[str] = None) -> _Bucket:
+        """종류/가격대가 정확히 일치하는 식당 묶음 (없으면 빈 묶음)"""
+        return self._buckets.get((menu or None, price_range or None), EMPTY_BUCKET)
+
+    def find(self, menu: Optional[str] = None, price_range: Optional[str] = None) -> List[dict]:
+        """조건에 맞는 식당 목록 (설정 순서)"""
+        return [dict(r) for r in self.bucket(menu, price_range).restaurants]
+
+    def _recommend_bucket(self, menu: Optional[str], price_range: Optional[str]) -> _Bucket:
+        """추천 대상: 종류 + 가격대 -> 없으면 종류만 -> 없으면 전체 (종류가 없으면 가격대와 관계없이 전체)"""
+        if menu:
+            for key in [(menu, price_range), (menu, None)]:
+                bucket = self.bucket(*key)
+                if len(bucket):
+                    return bucket
+        return self.bucket()
+
+    def recommend(self, menu: Optional[str] = None, price_range: Optional[str] = None) -> Optional[dict]:
+        """조건에 맞는 추천 식당 1개 (가중 추첨)"""
+        bucket = self._recommend_bucket(menu, price_range)
+        if not len(bucket):
+            return None
+        return dict(bucket.restaurants[bucket.draw()])
+
+    def recommend_many(self, menu: Optional[str] = None, price_range: Optional[str] = None,
+                       count: int = 3) -> List[dict]:
+        """조건에 맞는 추천 식당 여러 개 (중복 없이 가중 추첨, 가중치 높은 것이 앞에 오기 쉬움)"""
+        bucket = self._recommend_bucket(menu, price_range)
+        return [dict(bucket.restaurants[i]) for i in bucket.draw_distinct(max(count, 0))]
+
+    def pick(self, menu: Optional[str] = None, price_range: Optional[str] = None) -> Optional[dict]:
+        """종류/가격대 조건으로 1개 추첨, 맞는 식당이 없으면 전체에서 추첨"""
+        bucket = self.bucket(menu, price_range)
+        if not len(bucket):
+            bucket = self.bucket()
+        if not len(bucket):
+            return None
+        return dict(bucket.restaurants[bucket.draw()])
+
+
+# 싱글톤 인스턴스
+restaurant_catalog = RestaurantCatalog(RESTAURANTS)
@@ -2,12 +2,13 @@
 점심방 서비스
 점심방 관련 비즈니스 로직
 """
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import datetime
 from fastapi import HTTPException
 
 from ..repositories import data_store
-from ..core.utils import generate_id, get_recommended_restaurant
+from ..core.utils import generate_id
+from ..core.locks import user_locks, room_locks
 
 
 class RoomService:
@@ -18,6 +19,11 @@ class RoomService:
         """열린 점심방 + 매칭 완료된 방 목록 조회"""
         return data_store.get_all_active_rooms()
     
+    @staticmethod
+    def get_rooms_page(after: Optional[tuple], limit: int, descending: bool = False) -> Tuple[List[dict], bool]:
+        """오늘의 점심방 한 페이지 + 다음 페이지 여부"""
+        return data_store.get_active_rooms_page(after, limit, descending)
+    
     @staticmethod
     def get_user_rooms(user_id: str) -> List[dict]:
         """특정 유저가 참여 중인 방 조회"""
@@ -37,89 +43,95 @@ class RoomService:
                     creator_department: str, creator_match_count: int = 0,
                     restaurant_info: dict = None) -> dict:
         """점심방 생성"""
-        # 이미 참여 중인 점심 활동이 있는지 확인
-        active_status = data_store.is_user_in_active_lunch(creator_id)
-        if active_status["active"]:
-            type_name = {"room": "점심방", "group": "매칭 그룹", "waiting": "매칭 대기"}
-            raise HTTPException(
-                status_code=400, 
-                detail=f"이미 {type_name.get(active_status['type'], '점심 활동')}에 참여 중입니다. 먼저 나가기를 해주세요."
-            )
-        
-        # 사용자가 선택한 식당이 있으면 그것을 사용, 없으면 None
-        restaurant = restaurant_info if restaurant_info else None
-        
-        room = data_store.create_room({
-            "title": title,
-            "timeSlot": time_slot,
-            "menu": menu,
-            "priceRange": price_range,
-            "maxCount": min(max(max_count, 2), 6),
-            "members": [{
-                "id": creator_id or generate_id(),
-                "name": creator_name,
-                "department": creator_department,
-                "matchCount": creator_match_count,
-                "isCreator": True,
-            }],
-            "restaurant": restaurant,
-            "status": "open",
-        })
-        return room
+        # 같은 유저의 동시 요청이 활동 확인을 함께 통과하지 않도록 유저 단위로 직렬화
+        with user_locks.hold(creator_id):
+            # 이미 참여 중인 점심 활동이 있는지 확인
+            active_status = data_store.is_user_in_active_lunch(creator_id)
+            if active_status["active"]:
+                type_name = {"room": "점심방", "group": "매칭 그룹", "waiting": "매칭 대기"}
+                raise HTTPException(
+                    status_code=400, 
+                    detail=f"이미 {type_name.get(active_status['type'], '점심 활동')}에 참여 중입니다. 먼저 나가기를 해주세요."
+                )
+            
+            # 사용자가 선택한 식당이 있으면 그것을 사용, 없으면 None
+            restaurant = restaurant_info if restaurant_info else None
+            
+            room = data_store.create_room({
+                "title": title,
+                "timeSlot": time_slot,
+                "menu": menu,
+                "priceRange": price_range,
+                "maxCount": min(max(max_count, 2), 6),
+                "members": [{
+                    "id": creator_id or generate_id(),
+                    "name": creator_name,
+                    "department": creator_department,
+                    "matchCount": creator_match_count,
+                    "isCreator": True,
+                }],
+                "restaurant": restaurant,
+                "status": "open",
+            })
+            return room
     
     @staticmethod
     def join_room(room_id: str, user_id: str, name: str, department: str, match_count: int = 0) -> dict:
         """점심방 참여"""
-        room = data_store.get_room_by_id(room_id)
-        if not room:
-            raise HTTPException(status_code=404, detail="Room not found")
-        
-        if len(room["members"]) >= room["maxCount"]:
-            raise HTTPException(status_code=400, detail="Room is full")
-        
-        if any(m["id"] == user_id for m in room["members"]):
-            raise HTTPException(status_code=400, detail="Already joined")
-        
-        # 이미 다른 점심 활동에 참여 중인지 확인
-        active_status = data_store.is_user_in_active_lunch(user_id)
-        if active_status["active"]:
-            type_name = {"room": "점심방", "group": "매칭 그룹", "waiting": "매칭 대기"}
-            raise HTTPException(
-                status_code=400, 
-                detail=f"이미 {type_name.get(active_status['type'], '점심 활동')}에 참여 중입니다. 먼저 나가기를 해주세요."
-            )
-        
-        room["members"].append({
-            "id": user_id or generate_id(),
-            "name": name,
-            "department": department,
-            "matchCount": match_count,
-            "joinedAt": datetime.now().isoformat(),
-        })
-        
-        # 방이 가득 찼으면 모든 멤버의 매칭 횟수 증가
-        if len(room["members"]) >= room["maxCount"]:
-            room["status"] = "full"
-            # 모든 멤버의 매칭 횟수 증가
-            for member in room["members"]:
-                if member.get("id"):
-                    data_store.increment_match_count(member["id"])
-        
-        return room
+        # 정원 확인 ~ 멤버 추가는 방 단위로 직렬화 (정원 초과 방지)
+        with user_locks.hold(user_id), room_locks.hold(room_id):
+            room = data_store.get_room_by_id(room_id)
+            if not room:
+                raise HTTPException(status_code=404, detail="Room not found")
+            
+            if len(room["members"]) >= room["maxCount"]:
+                raise HTTPException(status_code=400, detail="Room is full")
+            
+            if any(m["id"] == user_id for m in room["members"]):
+                raise HTTPException(status_code=400, detail="Already joined")
+            
+            # 이미 다른 점심 활동에 참여 중인지 확인
+            active_status = data_store.is_user_in_active_lunch(user_id)
+            if active_status["active"]:
+                type_name = {"room": "점심방", "group": "매칭 그룹", "waiting": "매칭 대기"}
+                raise HTTPException(
+                    status_code=400, 
+                    detail=f"이미 {type_name.get(active_status['type'], '점심 활동')}에 참여 중입니다. 먼저 나가기를 해주세요."
+                )
+            
+            members = room["members"] + [{
+                "id": user_id or generate_id(),
+                "name": name,
+                "department": department,
+                "matchCount": match_count,
+                "joinedAt": datetime.now().isoformat(),
+            }]
+            updates = {"members": members}
+            
+            # 방이 가득 찼으면 모든 멤버의 매칭 횟수 증가
+            if len(members) >= room["maxCount"]:
+                updates["status"] = "full"
+                # 모든 멤버의 매칭 횟수 증가
+                for member in members:
+                    if member.get("id"):
+                        data_store.increment_match_count(member["id"])
+            
+            # 저장소를 통해 변경 (SQLite 저장소는 조회 결과가 복사본)
+            return data_store.update_room(room_id, updates)
     
     @staticmethod
     def leave_room(room_id: str, user_id: str) -> dict:
         """점심방 나가기"""
-        room = data_store.get_room_by_id(room_id)
-        if not room:
-            raise HTTPException(status_code=404, detail="Room not found")
-        
-        room["members"] = [m for m in room["members"] if m["id"] != user_id]
-        
-        if len(room["members"]) == 0:
-            data_store.delete_room(room_id)
-            return {"deleted": True}
-        
-        room["status"] = "open"
-        return room
+        with room_locks.hold(room_id):
+            room = data_store.get_room_by_id(room_id)
+            if not room:
+                raise HTTPException(status_code=404, detail="Room not found")
+            
+            members = [m for m in room["members"] if m["id"] != user_id]
+            
+            if len(members) == 0:
+                data_store.delete_room(room_id)
+                return {"deleted": True}
+            
+            return data_store.update_room(room_id, {"members": members, "status": "open"})
 
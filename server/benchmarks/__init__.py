@@ -0,0 +1 @@
+# Benchmarks - 성능 측정 스크립트 (server/ 에서 python -m benchmarks.<name> 으로 실행)
@@ -0,0 +1,155 @@
+"""
+배치 매칭 벤치마크
+버킷 하나의 대기 인원을 기존 greedy 경로(오래 기다린 순서로 find_matching_users 후 앞에서부터 묶기)와
+batch_matcher로 각각 나눠보고 매칭률, 그룹 크기 분포(2/3/4인 그룹 수), 소요 시간을 비교합니다.
+작은 무작위 그래프에서는 2인 매칭 크기가 전수 탐색한 최대 매칭과 같은지도 확인합니다.
+
+실행: python -m benchmarks.bench_batch_matcher
+"""
+import random
+import time
+
+import numpy as np
+
+from app.core.config import MAX_GROUP_SIZE
+from app.repositories import data_store
+from app.services import MatchService
+from app.services.batch_matcher import build_compatibility, form_groups, _maximum_matching, _augment
+from benchmarks.population import make_population
+
+BUCKET = ("11:30", "low", "korean")
+BUCKET_SIZES = [20, 50, 100, 1_000, 3_000, 5_000]
+PREF_RATE = 0.8  # 선호 조건이 많을수록 매칭이 어려워짐
+MAX_WAIT_SECONDS = 120  # 완화 단계 0~1 (조건이 대부분 남아 있는 피크 시작 구간)
+
+
+def greedy_groups(population: list) -> list:
+    """기존 경로: 대기 순서대로 find_matching_users → 앞에서부터 MAX_GROUP_SIZE - 1명"""
+    for request in population:
+        data_store.add_waiting_user(request)
+    groups = []
+    for requester in population:
+        if not data_store.get_waiting_user_by_id(requester.id):
+            continue
+        matching_users = MatchService.find_matching_users(
+            requester, requester.relaxation_level, limit=MAX_GROUP_SIZE - 1
+        )
+        if matching_users:
+            members = [requester] + matching_users
+            data_store.remove_waiting_users([m.id for m in members])
+            groups.append(members)
+    for request in population:
+        data_store.remove_waiting_user(request.id)
+    return groups
+
+
+def check_valid(groups: list):
+    """그룹마다 기준 멤버(첫 번째)가 나머지 전원과 양방향 매칭되는지 확인"""
+    for group in groups:
+        anchor = group[0]
+        assert 2 <= len(group) <= MAX_GROUP_SIZE
+        for member in group[1:]:
+            assert MatchService.check_mutual_match(
+                anchor, member, anchor.relaxation_level, member.relaxation_level
+            )
+
+
+def check_compatibility(population: list, samples: int = 2_000):
+    """행렬 계산이 check_mutual_match와 같은지 무작위 쌍으로 확인"""
+    compatible = build_compatibility(population)
+    rng = random.Random(0)
+    for _ in range(samples):
+        i, j = rng.randrange(len(population)), rng.randrange(len(population))
+        if i == j:
+            continue
+        a, b = population[i], population[j]
+        expected = MatchService.check_mutual_match(a, b, a.relaxation_level, b.relaxation_level)
+        assert bool(compatible[i, j]) == expected
+
+
+def brute_force_pairs(compatible: np.ndarray, start: int = 0, used: frozenset = frozenset()) -> int:
+    """최대 매칭 쌍 수 (전수 탐색)"""
+    n = compatible.shape[0]
+    while start < n and start in used:
+        start += 1
+    if start >= n:
+        return 0
+    best = brute_force_pairs(compatible, start + 1, used)
+    for j in range(start + 1, n):
+        if compatible[start, j] and j not in used:
+            best = max(best, 1 + brute_force_pairs(compatible, start + 1, used | {start, j}))
+    return best
+
+
+def check_maximum(graphs: int = 3_000):
+    """
+    무작위 그래프(최대 11명)에서 최대 매칭 크기 확인
+    greedy 시작점이 이미 최적인 경우가 많으므로, 무작위 극대 매칭에서 _augment로 보강한 결과도 확인
+    """
+    rng = random.Random(1)
+    for _ in range(graphs):
+        n = rng.randint(2, 11)
+        upper = np.triu(np.array([[rng.random() < 0.4 for _ in range(n)] for _ in range(n)]), 1)
+        compatible = upper | upper.T
+        expected = brute_force_pairs(compatible)
+
+        match = [-1] * n
+        order = rng.sample(range(n), n)
+        for u in order:
+            for v in order:
+                if match[u] == -1 and match[v] == -1 and u != v and compatible[u, v]:
+                    match[u], match[v] = v, u
+        for root in range(n):
+            if match[root] == -1:
+                _augment(compatible, match, root)
+
+        for result in (_maximum_matching(compatible), match):
+            assert all(v == -1 or (result[v] == u and compatible[u, v]) for u, v in enumerate(result))
+            assert sum(v != -1 for v in result) // 2 == expected, "최대 매칭이 아닙니다"
+
+
+def size_distribution(groups: list) -> str:
+    """그룹 크기별 개수 (2인부터 MAX_GROUP_SIZE인까지 '/'로 구분)"""
+    counts = [0] * (MAX_GROUP_SIZE + 1)
+    for group in groups:
+        counts[len(group)] += 1
+    return "/".join(str(c) for c in counts[2:])
+
+
+def main():
+    check_maximum()
+    sizes_header = "/".join(str(k) for k in range(2, MAX_GROUP_SIZE + 1))
+    print(
+        f"{'bucket':>7} {'greedy rate':>12} {'greedy ' + sizes_header:>16} {'greedy ms':>10}"
+        f" {'batch rate':>11} {'batch ' + sizes_header:>16} {'batch ms':>9}"
+    )
+    for size in BUCKET_SIZES:
+        population = make_population(
+            size, seed=size, bucket=BUCKET, pref_rate=PREF_RATE, max_wait_seconds=MAX_WAIT_SECONDS
+        )
+        check_compatibility(population)
+
+        start = time.perf_counter()
+        greedy = greedy_groups(population)
+        greedy_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        batch = [[population[i] for i in g] for g in form_groups(build_compatibility(population))]
+        batch_ms = (time.perf_counter() - start) * 1000
+
+        check_valid(greedy)
+        check_valid(batch)
+        for groups in (greedy, batch):
+            ids = [m.id for g in groups for m in g]
+            assert len(ids) == len(set(ids)), "한 사람이 여러 그룹에 들어갔습니다"
+
+        greedy_rate = sum(map(len, greedy)) / size
+        batch_rate = sum(map(len, batch)) / size
+        print(
+            f"{size:>7,} {greedy_rate:>11.1%} {size_distribution(greedy):>16} {greedy_ms:>10.1f}"
+            f" {batch_rate:>10.1%} {size_distribution(batch):>16} {batch_ms:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+조건부 GET 벤치마크
+주기적으로 다시 불러오는 화면(/rooms, /rooms/my, /stats, /match/active, /groups)에서
+If-None-Match 없이 받을 때(200 + 본문) vs 변경이 없어 304를 받을 때의 응답 시간/크기 (TestClient, 앱 전체 경로)
+- 쓰기 후에는 관련 ETag만 바뀌는지도 확인
+
+실행: python -m benchmarks.bench_conditional_get
+"""
+import statistics
+import time
+
+from fastapi.testclient import TestClient
+
+from main import app
+from app.repositories import data_store
+
+ROOMS = 2_000
+REPEAT = 200
+
+
+def timed_ms(fn, repeat: int = REPEAT) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    for i in range(ROOMS):
+        data_store.create_room({"title": f"방{i}", "timeSlot": "12:00", "menu": "korean", "priceRange": "mid",
+                                "maxCount": 4, "status": "open", "restaurant": None,
+                                "members": [{"id": f"user-{i}", "name": f"유저{i}", "department": "개발팀", "matchCount": 0}]})
+    user_id = data_store.get_user_by_username("test1")["id"]
+    client = TestClient(app)
+    urls = ["/rooms?limit=500", f"/rooms/my/{user_id}", "/stats", f"/match/active/{user_id}", "/groups"]
+
+    print(f"{'':<44}{'200 ms':>9}{'bytes':>9}{'304 ms':>9}")
+    etags = {}
+    for url in urls:
+        response = client.get(url)
+        etags[url] = response.headers["ETag"]
+        assert client.get(url, headers={"If-None-Match": etags[url]}).status_code == 304
+        full = timed_ms(lambda: client.get(url))
+        cached = timed_ms(lambda: client.get(url, headers={"If-None-Match": etags[url]}))
+        print(f"{url[:44]:<44}{full:>9.2f}{len(response.content):>9}{cached:>9.2f}")
+
+    data_store.create_room({"title": "새 방", "timeSlot": "12:00", "menu": "korean", "priceRange": "mid",
+                            "maxCount": 4, "status": "open", "restaurant": None,
+                            "members": [{"id": user_id, "name": "테스트", "department": "개발팀", "matchCount": 0}]})
+    changed = [url for url in urls if client.get(url, headers={"If-None-Match": etags[url]}).status_code == 200]
+    assert changed == urls[:4], changed
+    print(f"after creating a room for test1: {len(changed)} of {len(urls)} views changed (/groups still 304)")
+
+
+if __name__ == "__main__":
+    main()
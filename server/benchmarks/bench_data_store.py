@@ -0,0 +1,71 @@
+"""
+DataStore 기본 키 조회 벤치마크
+행 수를 100 → 100k로 늘려도 조회 비용이 일정한지 확인합니다.
+
+실행: python -m benchmarks.bench_data_store
+"""
+import random
+import timeit
+
+from app.repositories.data_store import DataStore
+from app.repositories.waiting_request import WaitingRequest
+
+ROW_COUNTS = [100, 1_000, 10_000, 100_000]
+LOOKUPS = 20_000
+
+
+def build_store(rows: int) -> DataStore:
+    """rows개의 유저/방/그룹/대기 요청을 가진 저장소 생성"""
+    store = DataStore()
+    for i in range(rows):
+        user = store.create_user({"username": f"bench{i}", "name": f"유저{i}", "matchCount": 0})
+        store.create_room({"title": f"방{i}", "members": [{"id": user["id"]}], "maxCount": 4, "status": "open"})
+        store.add_waiting_user(WaitingRequest.create(
+            f"req{i}", user["id"], None, None, None, None, None, "11:30", "low", "korean", None,
+        ))
+        store.create_group({"members": [{"id": f"member{i}", "userId": user["id"]}]})
+    return store
+
+
+def bench(rows: int) -> dict:
+    store = build_store(rows)
+    user_ids = list(store._users)
+    usernames = [f"bench{i}" for i in range(rows)]
+    room_ids = [r["id"] for r in store.get_all_rooms()]
+    group_ids = [g["id"] for g in store.get_all_groups()]
+    request_ids = [f"req{i}" for i in range(rows)]
+    member_ids = [f"member{i}" for i in range(rows)]
+
+    cases = {
+        "get_user_by_id": (store.get_user_by_id, user_ids),
+        "get_user_by_username": (store.get_user_by_username, usernames),
+        "user_exists": (store.user_exists, usernames),
+        "get_room_by_id": (store.get_room_by_id, room_ids),
+        "get_group_by_id": (store.get_group_by_id, group_ids),
+        "get_group_by_member_id": (store.get_group_by_member_id, member_ids),
+        "get_waiting_user_by_id": (store.get_waiting_user_by_id, request_ids),
+        "increment_match_count": (store.increment_match_count, user_ids),
+    }
+
+    results = {}
+    for name, (fn, keys) in cases.items():
+        sample = [random.choice(keys) for _ in range(LOOKUPS)]
+        elapsed = timeit.timeit(lambda: [fn(k) for k in sample], number=1)
+        results[name] = elapsed / LOOKUPS * 1e9  # ns/op
+    return results
+
+
+def main():
+    rows_results = {rows: bench(rows) for rows in ROW_COUNTS}
+    names = list(next(iter(rows_results.values())))
+
+    header = f"{'operation':<26}" + "".join(f"{rows:>12,}" for rows in ROW_COUNTS)
+    print(header)
+    print("-" * len(header))
+    for name in names:
+        row = "".join(f"{rows_results[rows][name]:>10.0f}ns" for rows in ROW_COUNTS)
+        print(f"{name:<26}{row}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+날짜별 파티션 벤치마크
+지난 N일치 점심방/그룹이 쌓여 있을 때 "오늘" 조회 비용이 날짜 수와 무관한지,
+보관 기간 적용 후 날짜별 메모리가 얼마나 남는지 확인합니다.
+
+실행: python -m benchmarks.bench_day_partitions
+"""
+import timeit
+from datetime import date, datetime, timedelta
+
+from app.core.config import PARTITION_RETENTION_DAYS
+from app.repositories.data_store import DataStore
+
+DAYS = [1, 7, 30, 90]
+ROOMS_PER_DAY = 500
+GROUPS_PER_DAY = 500
+LOOKUPS = 200
+
+
+def fill(store: DataStore, days: int):
+    """오늘부터 days일 전까지 날짜별 점심방/그룹 추가 (createdAt을 과거로 지정)"""
+    today = datetime.now()
+    for offset in range(days):
+        created_at = (today - timedelta(days=offset)).isoformat()
+        for i in range(ROOMS_PER_DAY):
+            store._rooms.add({
+                "id": f"room-{offset}-{i}", "createdAt": created_at, "status": "full", "maxCount": 4,
+                "members": [{"id": f"user-{offset}-{i}-{k}", "name": "유저"} for k in range(4)],
+            })
+        for i in range(GROUPS_PER_DAY):
+            group = {
+                "id": f"group-{offset}-{i}", "createdAt": created_at, "menu": "korean", "timeSlot": "12:00",
+                "members": [{"id": f"req-{offset}-{i}-{k}", "userId": f"user-{offset}-{i}-{k}"} for k in range(4)],
+            }
+            store._groups.add(group)
+            for member in group["members"]:
+                store._group_id_by_member_id[member["id"]] = group["id"]
+
+
+def full_scan_active_rooms(store: DataStore) -> list:
+    """파티션 전 방식: 전체 점심방을 훑고 createdAt으로 거르기"""
+    today = date.today().isoformat()
+    return [r for r in store.get_all_rooms() if r.get("createdAt", "").startswith(today)]
+
+
+def main():
+    print(f"rooms/day={ROOMS_PER_DAY} groups/day={GROUPS_PER_DAY} retention={PARTITION_RETENTION_DAYS}일 (us/op)")
+    print(f"{'days':>6}{'full scan':>12}{'active rooms':>14}{'active room':>13}{'active group':>14}")
+    for days in DAYS:
+        store = DataStore()
+        fill(store, days)
+        assert len(full_scan_active_rooms(store)) == len(store.get_all_active_rooms()) == ROOMS_PER_DAY
+        cases = [
+            lambda: full_scan_active_rooms(store),
+            store.get_all_active_rooms,
+            lambda: store.get_user_active_room("user-0-499-3"),
+            lambda: store.get_user_active_group("user-0-499-3"),
+        ]
+        timings = [timeit.timeit(fn, number=LOOKUPS) / LOOKUPS * 1e6 for fn in cases]
+        print(f"{days:>6}" + "".join(f"{t:>{w}.1f}" for t, w in zip(timings, [12, 14, 13, 14])))
+
+    # 보관 기간 적용 전/후 날짜별 메모리
+    store = DataStore()
+    fill(store, 30)
+    before = store.get_partition_stats()
+    evicted = store.evict_expired_partitions()
+    after = store.get_partition_stats()
+    assert len(after) == PARTITION_RETENTION_DAYS
+    assert store.get_group_by_member_id("req-29-0-0") is None
+    assert store.get_group_by_member_id("req-0-0-0") is not None
+
+    print()
+    print(f"보관 전: {len(before)}일 {sum(d['bytes'] for d in before) / 1e6:.1f}MB, "
+          f"삭제: 그룹 {evicted['groups']} / 점심방 {evicted['rooms']}")
+    print(f"보관 후: {len(after)}일 {sum(d['bytes'] for d in after) / 1e6:.1f}MB")
+    for entry in after:
+        print(f"  {entry['day']}  groups={entry['groups']} rooms={entry['rooms']} {entry['bytes'] / 1e6:.2f}MB")
+
+
+if __name__ == "__main__":
+    main()
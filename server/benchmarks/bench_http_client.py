@@ -0,0 +1,135 @@
+"""
+외부 API 호출 벤치마크 (요청마다 새 클라이언트 vs 공용 클라이언트)
+카카오 로컬 검색 응답 모양을 돌려주는 로컬 스텁 서버(TLS)에 요청해서 요청당 지연 시간을 비교합니다.
+- before: 요청마다 httpx.AsyncClient 생성 (매번 TCP + TLS 핸드셰이크)
+- after: SharedHttpClient.create_client()로 만든 클라이언트 하나 재사용 (keep-alive 연결 풀)
+openssl이 없으면 평문 HTTP로 측정합니다 (핸드셰이크 비용이 TCP만큼만 줄어듦).
+
+실행: python -m benchmarks.bench_http_client
+"""
+import asyncio
+import json
+import os
+import shutil
+import socket
+import ssl
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+
+import httpx
+import uvicorn
+
+from app.core.http_client import SharedHttpClient, HTTP2_AVAILABLE
+
+SEQUENTIAL = 300
+CONCURRENCY = 20
+CONCURRENT_ROUNDS = 15
+
+STUB_BODY = json.dumps({
+    "documents": [
+        {"id": str(i), "place_name": f"식당{i}", "category_name": "음식점 > 한식", "phone": "",
+         "address_name": "서울 영등포구 여의도동", "road_address_name": "", "x": "126.92", "y": "37.53",
+         "distance": str(i * 10), "place_url": ""}
+        for i in range(15)
+    ],
+    "meta": {"total_count": 15, "pageable_count": 15, "is_end": True},
+}, ensure_ascii=False).encode()
+
+
+async def stub_app(scope, receive, send):
+    """카카오 키워드 검색 응답을 흉내 내는 ASGI 앱"""
+    if scope["type"] != "http":
+        return
+    await send({"type": "http.response.start", "status": 200,
+                "headers": [(b"content-type", b"application/json; charset=utf-8")]})
+    await send({"type": "http.response.body", "body": STUB_BODY})
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def make_certificate(directory: str):
+    """스텁 서버용 self-signed 인증서 (openssl 없으면 None)"""
+    if not shutil.which("openssl"):
+        return None
+    cert, key = os.path.join(directory, "cert.pem"), os.path.join(directory, "key.pem")
+    subprocess.run(
+        ["openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes", "-days", "1",
+         "-keyout", key, "-out", cert, "-subj", "/CN=localhost",
+         "-addext", "subjectAltName=DNS:localhost,IP:127.0.0.1"],
+        check=True, capture_output=True,
+    )
+    return cert, key
+
+
+def start_stub(port: int, certificate) -> uvicorn.Server:
+    options = {"ssl_certfile": certificate[0], "ssl_keyfile": certificate[1]} if certificate else {}
+    server = uvicorn.Server(uvicorn.Config(stub_app, host="127.0.0.1", port=port, log_level="error", **options))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return server
+
+
+async def timed(get) -> float:
+    start = time.perf_counter()
+    response = await get()
+    response.raise_for_status()
+    return (time.perf_counter() - start) * 1000
+
+
+async def run(url: str, verify) -> dict:
+    params = {"query": "맛집", "x": "126.926439", "y": "37.530230", "radius": 1000, "size": 15}
+
+    async def fresh_client_get():
+        async with httpx.AsyncClient(verify=verify) as client:
+            return await client.get(url, params=params)
+
+    shared = SharedHttpClient.create_client(verify=verify)
+    results = {}
+    try:
+        for name, get in [("before", fresh_client_get), ("after", lambda: shared.get(url, params=params))]:
+            await timed(get)  # 워밍업
+            sequential = [await timed(get) for _ in range(SEQUENTIAL)]
+            concurrent = []
+            for _ in range(CONCURRENT_ROUNDS):
+                concurrent += await asyncio.gather(*[timed(get) for _ in range(CONCURRENCY)])
+            results[name] = {"sequential": sequential, "concurrent": concurrent}
+    finally:
+        await shared.aclose()
+    return results
+
+
+def summary(samples: list) -> str:
+    q = statistics.quantiles(samples, n=100)
+    return f"{statistics.mean(samples):>8.2f}{q[49]:>8.2f}{q[94]:>8.2f}"
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        certificate = make_certificate(directory)
+        port = free_port()
+        server = start_stub(port, certificate)
+        scheme = "https" if certificate else "http"
+        verify = ssl.create_default_context(cafile=certificate[0]) if certificate else True
+        try:
+            results = asyncio.run(run(f"{scheme}://127.0.0.1:{port}/v2/local/search/keyword.json", verify))
+        finally:
+            server.should_exit = True
+
+    print(f"stub={scheme} (uvicorn, HTTP/1.1) http2_available={HTTP2_AVAILABLE} "
+          f"sequential={SEQUENTIAL} concurrent={CONCURRENCY}x{CONCURRENT_ROUNDS} (ms)")
+    print(f"{'':<22}{'mean':>8}{'p50':>8}{'p95':>8}")
+    for mode in ["sequential", "concurrent"]:
+        for name in ["before", "after"]:
+            print(f"{mode + ' ' + name:<22}{summary(results[name][mode])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+목록 API 페이지네이션 벤치마크 (유저/그룹/점심방 각 10,000개)
+- 커서로 끝까지 넘기면 모든 레코드가 (createdAt, id) 순으로 한 번씩 나오는지 (메모리/SQLite, 정방향/역방향)
+- 응답 크기 / 처리 시간: 전체 목록(기존) vs 한 페이지(limit 100) vs 한 페이지 + fields
+  (저장소 조회 + 필드 선택 + JSON 직렬화, HTTP 오버헤드 제외)
+
+실행: python -m benchmarks.bench_list_pagination
+"""
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import datetime
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+
+from app.core.pagination import decode_cursor, page_response, NEXT_CURSOR_HEADER
+from app.repositories import DataStore, SqliteDataStore
+from app.repositories.sorted_keys import record_key
+
+ROWS = 10_000
+PAGE = 100
+
+
+def populate(store: DataStore, rows: int = ROWS):
+    rng = random.Random(0)
+    for i in range(rows):
+        store.create_user({
+            "username": f"bench{i}", "password": "x" * 64, "name": f"유저{i}", "department": "개발팀",
+            "level": "staff", "gender": "male", "age": 30, "matchCount": 0,
+        })
+        members = [
+            {"id": f"req-{i}-{m}", "userId": f"user-{m}", "name": f"멤버{m}", "department": "개발팀",
+             "level": "staff", "gender": "male", "age": 30, "timeSlot": "12:00", "priceRange": "mid",
+             "menu": "korean", "joinedAt": datetime.now().isoformat(), "relaxationLevel": 0}
+            for m in range(rng.randint(2, 4))
+        ]
+        store.create_group({"members": members, "timeSlot": "12:00", "priceRange": "mid", "menu": "korean",
+                            "restaurant": {"id": "r1", "name": "김밥천국"}, "relaxationApplied": False})
+        store.create_room({"title": f"방{i}", "timeSlot": "12:00", "menu": "korean", "priceRange": "mid",
+                           "maxCount": 4, "status": "open", "restaurant": None,
+                           "members": [{"id": f"user-{i}", "name": f"유저{i}", "department": "개발팀", "matchCount": 0}]})
+
+
+def walk(page_fn, descending: bool) -> list:
+    """커서로 끝까지 조회한 ID 목록"""
+    ids, after = [], None
+    while True:
+        records, has_more = page_fn(after, PAGE, descending)
+        ids += [r["id"] for r in records]
+        if not has_more:
+            return ids
+        after = record_key(records[-1])
+
+
+def check_walks(store: DataStore, name: str):
+    for label, page_fn, all_fn in [
+        ("users", store.get_users_page, store.get_all_users),
+        ("groups", store.get_groups_page, store.get_all_groups),
+        ("rooms", store.get_active_rooms_page, store.get_all_active_rooms),
+    ]:
+        expected = [r["id"] for r in sorted(all_fn(), key=record_key)]
+        assert walk(page_fn, False) == expected, (name, label)
+        assert walk(page_fn, True) == expected[::-1], (name, label)
+    print(f"{name}: cursor walks (asc/desc) return every user/group/room once in key order")
+
+
+def timed(fn, repeat: int = 20):
+    samples, result = [], None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), result
+
+
+def bench(store: DataStore, name: str):
+    print(f"\n[{name}] {'':<26}{'bytes':>10}{'ms':>9}")
+    cases = [
+        ("users", store.get_all_users, store.get_users_page, "id,name,department"),
+        ("groups", store.get_all_groups, store.get_groups_page, "id,menu,timeSlot,members.name"),
+        ("rooms", store.get_all_active_rooms, store.get_active_rooms_page, "id,title,timeSlot,members.id,maxCount"),
+    ]
+    for label, all_fn, page_fn, fields in cases:
+        def page(fields_param=None, after=None):
+            response = Response()
+            records, has_more = page_fn(after, PAGE, False)
+            body = JSONResponse(page_response(response, records, has_more, record_key, fields_param)).body
+            return body, response.headers.get(NEXT_CURSOR_HEADER)
+
+        full_ms, full = timed(lambda: JSONResponse(all_fn()).body, 5)
+        first_ms, (first, cursor) = timed(page)
+        deep_ms, _ = timed(lambda: page(after=decode_cursor(cursor)))
+        fields_ms, (projected, _) = timed(lambda: page(fields))
+        print(f"{label + ' full (before)':<34}{len(full):>10}{full_ms:>9.2f}")
+        print(f"{label + f' page {PAGE}':<34}{len(first):>10}{first_ms:>9.2f}")
+        print(f"{label + f' page {PAGE} (cursor)':<34}{'':>10}{deep_ms:>9.2f}")
+        print(f"{label + f' page {PAGE} + fields':<34}{len(projected):>10}{fields_ms:>9.2f}")
+
+
+def main():
+    memory = DataStore()
+    populate(memory)
+    check_walks(memory, "memory")
+    bench(memory, "memory")
+
+    with tempfile.TemporaryDirectory() as directory:
+        sqlite = SqliteDataStore(os.path.join(directory, "pages.db"))
+        populate(sqlite)
+        check_walks(sqlite, "sqlite")
+        bench(sqlite, "sqlite")
+        sqlite.close()
+
+
+if __name__ == "__main__":
+    main()
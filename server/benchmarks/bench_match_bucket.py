@@ -0,0 +1,78 @@
+"""
+버킷 보조 인덱스 벤치마크
+인기 버킷(korean/low/11:30) 하나에 대기 인원을 채우고
+find_matching_users의 인덱스 경로를 기존 전체 스캔과 비교합니다.
+(limit 열: 실제 매칭 경로처럼 MAX_GROUP_SIZE - 1명에서 탐색 중단)
+
+실행: python -m benchmarks.bench_match_bucket
+"""
+import random
+import time
+
+from app.core.config import MAX_GROUP_SIZE
+from app.repositories import data_store, WaitingRequest
+from app.services import MatchService
+from benchmarks.population import make_population
+
+BUCKET = ("11:30", "low", "korean")
+BUCKET_SIZES = [100, 1_000, 5_000, 20_000]
+QUERIES = 200
+
+
+def scan_matching_users(requester: WaitingRequest, relaxation_level: int) -> list:
+    """기존 방식: 버킷 전체를 돌며 참여 시각으로 완화 단계를 계산해 양방향 체크"""
+    result = []
+    for candidate in data_store.get_waiting_users_by_conditions(*BUCKET):
+        if candidate.id == requester.id:
+            continue
+        candidate_elapsed = MatchService.get_elapsed_seconds(candidate.joined_at)
+        candidate_relaxation = MatchService.get_relaxation_level_from_elapsed(candidate_elapsed)
+        if MatchService.check_mutual_match(requester, candidate, relaxation_level, candidate_relaxation):
+            result.append(candidate)
+    return result
+
+
+def reset_waiting():
+    for request in data_store.get_all_waiting_users():
+        data_store.remove_waiting_user(request.id)
+
+
+def main():
+    print(f"{'bucket':>8} {'scan ms':>10} {'indexed ms':>11} {'speedup':>8} {'limit ms':>9} {'speedup':>8}")
+    for size in BUCKET_SIZES:
+        reset_waiting()
+        population = make_population(size, bucket=BUCKET, pref_rate=0.7)
+        for request in population:
+            data_store.add_waiting_user(request)
+
+        rng = random.Random(size)
+        queries = [(rng.choice(population), rng.randint(0, 3)) for _ in range(QUERIES)]
+
+        # 결과 동일성 확인
+        for requester, level in queries[:20]:
+            expected = [c.id for c in scan_matching_users(requester, level)]
+            actual = [c.id for c in MatchService.find_matching_users(requester, level)]
+            assert expected == actual, "인덱스 결과가 전체 스캔과 다릅니다"
+
+        start = time.perf_counter()
+        for requester, level in queries:
+            scan_matching_users(requester, level)
+        scan_ms = (time.perf_counter() - start) * 1000 / QUERIES
+
+        start = time.perf_counter()
+        for requester, level in queries:
+            MatchService.find_matching_users(requester, level)
+        indexed_ms = (time.perf_counter() - start) * 1000 / QUERIES
+
+        start = time.perf_counter()
+        for requester, level in queries:
+            MatchService.find_matching_users(requester, level, limit=MAX_GROUP_SIZE - 1)
+        limit_ms = (time.perf_counter() - start) * 1000 / QUERIES
+
+        print(f"{size:>8,} {scan_ms:>10.3f} {indexed_ms:>11.3f} {scan_ms / indexed_ms:>7.1f}x"
+              f" {limit_ms:>9.3f} {scan_ms / limit_ms:>7.0f}x")
+    reset_waiting()
+
+
+if __name__ == "__main__":
+    main()
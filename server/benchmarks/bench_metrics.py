@@ -0,0 +1,95 @@
+"""
+운영 지표 수집 오버헤드 벤치마크
+- 요청당: 라우트 하나짜리 FastAPI 앱을 ASGI로 직접 호출 (HTTP 클라이언트 없음)해서
+  MetricsMiddleware 유무에 따른 요청당 처리 시간 차이를 잽니다.
+- 관측당: Histogram.observe / Counter.inc 호출 비용
+- 조회: 라우트 30개 x 상태 코드 3개 시계열이 있을 때 /metrics 본문 생성 시간
+
+실행: python -m benchmarks.bench_metrics
+"""
+import asyncio
+import time
+
+from fastapi import FastAPI
+
+from app.core.metrics import MetricsMiddleware, Histogram, Counter, MetricsRegistry
+
+REQUESTS = 20_000
+OBSERVATIONS = 200_000
+REPEAT = 5
+
+
+def make_app(with_metrics: bool) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/rooms/{room_id}")
+    async def get_room(room_id: str):
+        return {"id": room_id}
+
+    if with_metrics:
+        app.add_middleware(MetricsMiddleware)
+    return app
+
+
+async def call(app, path: str):
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "root_path": "", "query_string": b"",
+        "headers": [(b"host", b"bench")], "client": ("127.0.0.1", 1), "server": ("bench", 80),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    await app(scope, receive, send)
+
+
+async def per_request_us(app) -> float:
+    """REPEAT회 중 가장 빠른 회차의 요청당 µs"""
+    await call(app, "/rooms/warmup")
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        for i in range(REQUESTS):
+            await call(app, f"/rooms/{i}")
+        best = min(best, (time.perf_counter() - start) / REQUESTS * 1e6)
+    return best
+
+
+def per_call_ns(fn) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        for i in range(OBSERVATIONS):
+            fn(i)
+        best = min(best, (time.perf_counter() - start) / OBSERVATIONS * 1e9)
+    return best
+
+
+def main():
+    plain, metered = make_app(False), make_app(True)
+    without = asyncio.run(per_request_us(plain))
+    with_metrics = asyncio.run(per_request_us(metered))
+    print(f"request (ASGI, 1 route): without {without:.1f} µs, with metrics {with_metrics:.1f} µs, "
+          f"overhead {with_metrics - without:+.1f} µs ({with_metrics / without - 1:+.1%})")
+
+    histogram = Histogram("bench_seconds", "bench", ("method", "route", "status"))
+    counter = Counter("bench_total", "bench", ("outcome",))
+    print(f"Histogram.observe: {per_call_ns(lambda i: histogram.observe(i * 1e-6, 'GET', '/rooms', '200')):.0f} ns")
+    print(f"Counter.inc: {per_call_ns(lambda i: counter.inc('waiting')):.0f} ns")
+
+    registry = MetricsRegistry()
+    scraped = registry.register(Histogram("bench_route_seconds", "bench", ("method", "route", "status")))
+    for route in range(30):
+        for status in ("200", "304", "404"):
+            scraped.observe(0.003, "GET", f"/route{route}", status)
+    start = time.perf_counter()
+    body = registry.render()
+    print(f"render 90 series: {(time.perf_counter() - start) * 1e3:.2f} ms, {len(body):,} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+주변 맛집 검색 캐시 벤치마크
+카카오 응답을 흉내 내는 로컬 스텁 서버(응답 지연 50ms)에 대해
+- 같은 조건 200개 동시 요청 -> 원본 호출 1회 (single-flight)
+- 같은 geohash 격자 안의 다른 좌표 -> 캐시 재사용
+- miss / hit 지연 시간, stale-while-revalidate, LRU eviction
+을 확인합니다.
+
+실행: python -m benchmarks.bench_nearby_cache
+"""
+import asyncio
+import os
+import random
+import socket
+import statistics
+import threading
+import time
+
+import uvicorn
+
+CONCURRENT = 200
+STUB_DELAY_SECONDS = 0.05
+
+upstream_calls = 0
+
+
+async def stub_app(scope, receive, send):
+    """요청 수를 세고 지연 후 빈 검색 결과 반환"""
+    global upstream_calls
+    if scope["type"] != "http":
+        return
+    upstream_calls += 1
+    await asyncio.sleep(STUB_DELAY_SECONDS)
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+    await send({"type": "http.response.body", "body": b'{"documents": [], "meta": {"total_count": 0}}'})
+
+
+def start_stub() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(stub_app, host="127.0.0.1", port=port, log_level="error"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return port
+
+
+async def timed(coro) -> float:
+    start = time.perf_counter()
+    await coro
+    return (time.perf_counter() - start) * 1000
+
+
+async def run():
+    from app.core.async_cache import AsyncTTLCache
+    from app.core.config import YEOUIDO_LATITUDE, YEOUIDO_LONGITUDE, NEARBY_CACHE_GEOHASH_PRECISION
+    from app.core.utils import geohash_encode
+    from app.core.http_client import http_client
+    from app.routers.restaurants import get_nearby_restaurants, nearby_cache
+
+    # 1) 동시 동일 요청
+    latencies = await asyncio.gather(*[timed(get_nearby_restaurants()) for _ in range(CONCURRENT)])
+    print(f"{CONCURRENT} concurrent identical requests: upstream calls={upstream_calls}, "
+          f"mean={statistics.mean(latencies):.1f}ms")
+    assert upstream_calls == 1
+
+    # 2) 여의도 기본 좌표 주변 (±0.0003도 ≈ 30m), 격자 경계를 넘으면 격자마다 원본 1회
+    rng = random.Random(0)
+    coordinates = [
+        (YEOUIDO_LATITUDE + rng.uniform(-0.0003, 0.0003), YEOUIDO_LONGITUDE + rng.uniform(-0.0003, 0.0003))
+        for _ in range(1000)
+    ]
+    cells = {geohash_encode(lat, lon, NEARBY_CACHE_GEOHASH_PRECISION) for lat, lon in coordinates}
+    calls_before = upstream_calls
+    hits = [await timed(get_nearby_restaurants(latitude=lat, longitude=lon)) for lat, lon in coordinates]
+    print(f"1000 requests within ±30m ({len(cells)} cells): new upstream calls={upstream_calls - calls_before}, "
+          f"mean={statistics.mean(hits) * 1000:.1f}us")
+    assert upstream_calls - calls_before <= len(cells)
+
+    # 3) miss 지연 (다른 키워드)
+    misses = [await timed(get_nearby_restaurants(keyword=f"키워드{i}")) for i in range(20)]
+    print(f"miss mean={statistics.mean(misses):.1f}ms (stub delay {STUB_DELAY_SECONDS * 1000:.0f}ms)")
+
+    # 4) stale-while-revalidate: TTL이 지난 항목은 바로 반환하고 백그라운드에서 1회 갱신
+    calls_before = upstream_calls
+    real_clock = nearby_cache._clock
+    nearby_cache._clock = lambda: real_clock() + nearby_cache.ttl_seconds + 1
+    stale = await asyncio.gather(*[timed(get_nearby_restaurants()) for _ in range(50)])
+    await asyncio.sleep(STUB_DELAY_SECONDS * 3)
+    nearby_cache._clock = real_clock
+    print(f"50 stale requests: max={max(stale):.2f}ms, background refreshes={upstream_calls - calls_before}")
+    assert upstream_calls - calls_before == 1
+
+    print("cache stats:", nearby_cache.stats())
+
+    # 5) LRU eviction
+    small = AsyncTTLCache(max_entries=10, ttl_seconds=60)
+
+    async def value():
+        return 1
+
+    for i in range(25):
+        await small.get_or_fetch(i, value)
+    await small.get_or_fetch(24, value)
+    print("small cache (10 entries, 25 keys):", small.stats())
+    assert small.counters["evictions"] == 15
+
+    await http_client.close()
+
+
+def main():
+    port = start_stub()
+    os.environ["KAKAO_LOCAL_SEARCH_URL"] = f"http://127.0.0.1:{port}/v2/local/search/keyword.json"
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
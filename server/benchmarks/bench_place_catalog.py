@@ -0,0 +1,182 @@
+"""
+로컬 음식점 카탈로그 벤치마크
+- 여의도 주변 가상 음식점 20,000곳 (중심부 밀집) 카탈로그의 파일 크기 / 로드 시간
+- 격자 인덱스 반경 검색 / 가까운 N개 검색 vs 전체 거리 계산 (결과 일치 확인)
+- 카카오 카테고리 검색 스텁(영역당 45건 제한 + 15건 페이지)에 대한 크롤러 누락 여부
+- 요청 수 한도에 걸린 크롤링: 줄어든 반경 안은 빠짐없이 남는지
+
+실행: python -m benchmarks.bench_place_catalog
+"""
+import asyncio
+import json
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+from urllib.parse import parse_qs
+
+import numpy as np
+import uvicorn
+
+from benchmarks.bench_http_client import free_port
+from app.core.config import YEOUIDO_LATITUDE, YEOUIDO_LONGITUDE
+from app.services.place_catalog import PlaceCatalog, haversine_meters
+
+PLACES = 20_000
+CATALOG_RADIUS = 3000
+QUERIES = 500
+STUB_PLACES = 3000
+LIMITED_REQUESTS = 200
+
+
+def synthetic_places(count: int, radius: float, seed: int = 0) -> list:
+    """중심에서 반경 안 가상 음식점 (거리 분포를 중심 쪽에 몰리게)"""
+    rng = random.Random(seed)
+    places = []
+    for i in range(count):
+        distance = radius * rng.random() ** 1.5
+        angle = rng.uniform(0, 2 * np.pi)
+        lat = YEOUIDO_LATITUDE + distance * np.sin(angle) / 111_195
+        lon = YEOUIDO_LONGITUDE + distance * np.cos(angle) / (111_195 * np.cos(np.radians(YEOUIDO_LATITUDE)))
+        places.append({
+            "id": str(100000 + i), "name": f"식당{i}", "category": "음식점 > 한식", "phone": "02-000-0000",
+            "address": "서울 영등포구 여의도동", "roadAddress": "서울 영등포구 여의대로",
+            "latitude": round(lat, 6), "longitude": round(lon, 6), "placeUrl": f"http://place.map.kakao.com/{100000 + i}",
+        })
+    return places
+
+
+def brute_force(catalog: PlaceCatalog, lat: float, lon: float, radius: float):
+    distances = haversine_meters(lat, lon, catalog._lats, catalog._lons)
+    indices = np.nonzero(distances <= radius)[0]
+    order = np.lexsort((indices, distances[indices]))
+    return indices[order], distances[indices][order]
+
+
+def timed_us(fn, *args) -> float:
+    start = time.perf_counter()
+    fn(*args)
+    return (time.perf_counter() - start) * 1_000_000
+
+
+def bench_index():
+    places = synthetic_places(PLACES, CATALOG_RADIUS)
+    catalog = PlaceCatalog(places, (YEOUIDO_LATITUDE, YEOUIDO_LONGITUDE), CATALOG_RADIUS, "2026-01-01T00:00:00")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "catalog.json.gz")
+        catalog.save(path)
+        size = os.path.getsize(path)
+        start = time.perf_counter()
+        loaded = PlaceCatalog.load(path)
+        load_ms = (time.perf_counter() - start) * 1000
+    assert loaded is not None and loaded.places == catalog.places
+    print(f"catalog: {PLACES} places, file={size / 1024:.0f}KB ({size / PLACES:.0f}B/place), load={load_ms:.0f}ms")
+
+    rng = random.Random(1)
+    queries = [
+        (YEOUIDO_LATITUDE + rng.uniform(-0.01, 0.01), YEOUIDO_LONGITUDE + rng.uniform(-0.01, 0.01),
+         rng.choice([300, 500, 1000, 2000]))
+        for _ in range(QUERIES)
+    ]
+    for lat, lon, radius in queries:
+        got, expected = catalog.within(lat, lon, radius), brute_force(catalog, lat, lon, radius)
+        assert np.array_equal(got[0], expected[0]) and np.allclose(got[1], expected[1])
+        nearest = catalog.nearest(lat, lon, 15)
+        full = brute_force(catalog, lat, lon, CATALOG_RADIUS * 3)
+        assert np.array_equal(nearest[0], full[0][:15])
+
+    print(f"{QUERIES} queries, results equal to brute force (mean us)")
+    print(f"{'radius':<10}{'results':>10}{'grid':>10}{'brute':>10}")
+    for radius in sorted({q[2] for q in queries}):
+        subset = [q for q in queries if q[2] == radius]
+        results = statistics.mean(len(catalog.within(*q)[0]) for q in subset)
+        grid = statistics.mean(timed_us(catalog.within, *q) for q in subset)
+        brute = statistics.mean(timed_us(brute_force, catalog, *q) for q in subset)
+        print(f"{radius:<10}{results:>10.0f}{grid:>10.0f}{brute:>10.0f}")
+    nearest = [timed_us(catalog.nearest, q[0], q[1], 15) for q in queries]
+    print(f"nearest 15 (grid): mean={statistics.mean(nearest):.0f}us")
+
+
+# ============ 크롤러 ============
+STUB = synthetic_places(STUB_PLACES, CATALOG_RADIUS * 1.2, seed=2)
+
+
+async def stub_category_search(scope, receive, send):
+    """카카오 카테고리 검색 흉내: rect 안 결과를 id 순으로 최대 45건, 15건씩 페이지"""
+    if scope["type"] != "http":
+        return
+    query = {k: v[0] for k, v in parse_qs(scope["query_string"].decode()).items()}
+    min_lon, min_lat, max_lon, max_lat = map(float, query["rect"].split(","))
+    page, size = int(query["page"]), int(query["size"])
+    matched = [p for p in STUB if min_lat <= p["latitude"] <= max_lat and min_lon <= p["longitude"] <= max_lon]
+    pageable = matched[:45]
+    body = {
+        "documents": [
+            {"id": p["id"], "place_name": p["name"], "category_name": p["category"], "phone": p["phone"],
+             "address_name": p["address"], "road_address_name": p["roadAddress"],
+             "x": str(p["longitude"]), "y": str(p["latitude"]), "place_url": p["placeUrl"]}
+            for p in pageable[(page - 1) * size:page * size]
+        ],
+        "meta": {"total_count": len(matched), "pageable_count": len(pageable), "is_end": page * size >= len(pageable)},
+    }
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"application/json")]})
+    await send({"type": "http.response.body", "body": json.dumps(body, ensure_ascii=False).encode()})
+
+
+def bench_crawler():
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(stub_category_search, host="127.0.0.1", port=port, log_level="error"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+
+    from app.core.http_client import http_client
+    from app.services.place_crawler import PlaceCrawler
+
+    url = f"http://127.0.0.1:{port}/v2/local/search/category.json"
+
+    async def crawl():
+        http_client.start()
+        try:
+            crawler = PlaceCrawler(url=url)
+            start = time.perf_counter()
+            catalog = await crawler.crawl(YEOUIDO_LATITUDE, YEOUIDO_LONGITUDE, CATALOG_RADIUS)
+            limited = await PlaceCrawler(url=url, max_requests=LIMITED_REQUESTS).crawl(
+                YEOUIDO_LATITUDE, YEOUIDO_LONGITUDE, CATALOG_RADIUS
+            )
+            return catalog, limited, crawler.requests, time.perf_counter() - start
+        finally:
+            await http_client.close()
+
+    def expected_within(radius: float) -> set:
+        return {
+            p["id"] for p in STUB
+            if haversine_meters(YEOUIDO_LATITUDE, YEOUIDO_LONGITUDE, p["latitude"], p["longitude"]) <= radius
+        }
+
+    try:
+        catalog, limited, requests, seconds = asyncio.run(crawl())
+    finally:
+        server.should_exit = True
+    expected = expected_within(CATALOG_RADIUS)
+    print(f"crawler: {len(catalog)}/{len(expected)} places in radius, requests={requests}, {seconds:.1f}s")
+    assert not catalog.partial and catalog.radius_meters == CATALOG_RADIUS
+    assert {p["id"] for p in catalog.places} == expected
+
+    # 요청 수 한도: 모은 결과는 남기고, 줄어든 반경 안은 빠짐없이
+    print(f"crawler (max {LIMITED_REQUESTS} requests): {len(limited)} places, "
+          f"partial={limited.partial}, radius={limited.radius_meters:.0f}m")
+    assert limited.partial and 0 < limited.radius_meters < CATALOG_RADIUS
+    assert {p["id"] for p in limited.places} == expected_within(limited.radius_meters)
+
+
+def main():
+    bench_index()
+    bench_crawler()
+
+
+if __name__ == "__main__":
+    main()
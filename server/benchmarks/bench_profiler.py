@@ -0,0 +1,97 @@
+"""
+느린 요청 프로파일러 오버헤드 벤치마크
+- 요청당: 라우트 하나짜리 FastAPI 앱을 ASGI로 직접 호출해서 ProfilerMiddleware 유무 비교
+  - 임계값 모드: 모든 요청이 세션 등록/해제, 요청이 계속 들어오므로 샘플러도 계속 실행 (파일은 쓰지 않음)
+  - 샘플링만: 1% 요청만 세션 등록
+- 샘플 1회: 처리 중인 세션 수 / 워커 스레드 수별 sample() 호출 비용
+  (샘플러는 PROFILER_INTERVAL_MS마다 1회 실행, 그동안 GIL을 잡고 있는 시간)
+
+실행: python -m benchmarks.bench_profiler
+"""
+import asyncio
+import tempfile
+import threading
+import time
+
+from fastapi import FastAPI
+
+from app.core.profiler import ProfilerMiddleware, RequestProfiler
+from benchmarks.bench_metrics import call
+
+REQUESTS = 10_000
+REPEAT = 10
+SAMPLES = 2_000
+
+
+def make_app(profiler=None) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/rooms/{room_id}")
+    async def get_room(room_id: str):
+        return {"id": room_id}
+
+    if profiler is not None:
+        app.add_middleware(ProfilerMiddleware, profiler=profiler)
+    return app
+
+
+async def per_request_us(*apps) -> list:
+    """앱별 요청당 µs (회차마다 앱을 번갈아 실행해서 머신 상태 변화를 양쪽에 고르게, 가장 빠른 회차 사용)"""
+    best = [float("inf")] * len(apps)
+    for app in apps:
+        await call(app, "/rooms/warmup")
+    for _ in range(REPEAT):
+        for index, app in enumerate(apps):
+            start = time.perf_counter()
+            for i in range(REQUESTS):
+                await call(app, f"/rooms/{i}")
+            best[index] = min(best[index], (time.perf_counter() - start) / REQUESTS * 1e6)
+    return best
+
+
+async def sample_cost_us(profiler: RequestProfiler, sessions: int) -> float:
+    """세션 sessions개를 등록해 둔 상태에서 sample() 1회 비용"""
+    active = [profiler.begin("GET", "/bench") for _ in range(sessions)]
+    start = time.perf_counter()
+    for _ in range(SAMPLES):
+        profiler.sample()
+    elapsed = (time.perf_counter() - start) / SAMPLES * 1e6
+    for session in active:
+        profiler.end(session, "/bench")
+    return elapsed
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        # 파일은 쓰지 않도록 임계값을 크게 (등록/해제 + 샘플링 비용만)
+        profiler = RequestProfiler(directory=directory, sample_rate=0, slow_ms=60_000, interval_ms=5)
+        # 임계값 없이 1%만 샘플링 (뽑힌 요청만 세션 등록)
+        sampled_only = RequestProfiler(directory=directory, sample_rate=0.01, slow_ms=0, interval_ms=5)
+        profiler.start()
+        sampled_only.start()
+        without, threshold, sampled = asyncio.run(
+            per_request_us(make_app(), make_app(profiler), make_app(sampled_only))
+        )
+        print(f"request (ASGI, 1 route): without {without:.1f} µs")
+        for name, value in (("slow threshold (all requests)", threshold), ("1% sampled only", sampled)):
+            print(f"  {name:<30} {value:6.1f} µs, overhead {value - without:+.1f} µs ({value / without - 1:+.1%})")
+        profiler.stop()
+        sampled_only.stop()
+
+        # 대기 중인 스레드 (스레드풀 워커처럼) 수를 늘려 가며 샘플 1회 비용
+        idle = threading.Event()
+        threads = []
+        for thread_count in (0, 40):
+            while len(threads) < thread_count:
+                thread = threading.Thread(target=idle.wait, daemon=True)
+                thread.start()
+                threads.append(thread)
+            for sessions in (1, 10, 100):
+                cost = asyncio.run(sample_cost_us(profiler, sessions))
+                print(f"sample(): {sessions:>3} active requests, {thread_count:>2} idle threads: {cost:7.1f} µs "
+                      f"({cost / (profiler.interval * 1e6):.1%} of one {profiler.interval * 1000:.0f} ms interval)")
+        idle.set()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+직렬화해 둔 읽기 응답(read view) 벤치마크 - 점심방 2,000개
+같은 앱(미들웨어 포함)에 이전 방식 라우트(조회 + FastAPI 기본 JSON 인코딩)를 임시로 붙여서
+/rooms, /stats, /restaurants 처리량을 비교합니다 (TestClient, 순차 요청).
+- before: 매 요청마다 레코드 조회 + jsonable_encoder + json.dumps
+- after (hit): 버전이 같아서 보관 중인 bytes 그대로 응답
+- after (rebuild): 매 요청 전에 보관 응답을 비워서 매번 다시 만드는 경우 (쓰기가 잦을 때의 상한)
+
+실행: python -m benchmarks.bench_read_views
+"""
+import time
+
+from fastapi import Response
+from fastapi.testclient import TestClient
+
+from main import app
+from app.core.pagination import decode_cursor, clamp_limit, parse_order, page_response
+from app.core.read_views import read_views, ORJSON_AVAILABLE
+from app.repositories import data_store
+from app.repositories.sorted_keys import record_key
+from app.services import RoomService
+from app.services.restaurant_catalog import restaurant_catalog
+
+ROOMS = 2_000
+SECONDS = 2.0
+
+
+def add_before_routes():
+    """read view 적용 전 핸들러와 같은 코드"""
+    def get_rooms(response: Response, cursor: str = None, limit: int = None, order: str = "asc", fields: str = None):
+        rooms, has_more = RoomService.get_rooms_page(decode_cursor(cursor), clamp_limit(limit), parse_order(order))
+        return page_response(response, rooms, has_more, record_key, fields)
+
+    app.add_api_route("/before/rooms", get_rooms)
+    app.add_api_route("/before/stats", lambda: data_store.get_stats())
+    app.add_api_route("/before/restaurants", lambda menu=None, priceRange=None: restaurant_catalog.find(menu, priceRange))
+
+
+def throughput(client: TestClient, url: str, before_each=None) -> float:
+    count, deadline = 0, time.perf_counter() + SECONDS
+    while time.perf_counter() < deadline:
+        if before_each:
+            before_each()
+        assert client.get(url).status_code == 200
+        count += 1
+    return count / SECONDS
+
+
+def main():
+    for i in range(ROOMS):
+        data_store.create_room({
+            "title": f"방{i}", "timeSlot": "12:00", "menu": "korean", "priceRange": "mid",
+            "maxCount": 4, "status": "open", "restaurant": {"id": f"r{i}", "name": "김밥천국", "rating": 4.2},
+            "members": [{"id": f"user-{i}", "name": f"유저{i}", "department": "개발팀", "matchCount": 0}],
+        })
+    add_before_routes()
+    client = TestClient(app)
+    print(f"serializer: {'orjson' if ORJSON_AVAILABLE else 'json'}, {ROOMS} rooms today")
+    print(f"{'':<46}{'before':>10}{'hit':>10}{'rebuild':>10}  (req/s)")
+    for path in ["/rooms?limit=500", "/rooms?limit=100&fields=id,title,members.id",
+                 "/stats", "/restaurants?menu=korean"]:
+        before_url = "/before" + path
+        assert client.get(before_url).json() == client.get(path).json(), path
+        before = throughput(client, before_url)
+        hit = throughput(client, path)
+        rebuild = throughput(client, path, read_views.clear)
+        print(f"{path:<46}{before:>10.0f}{hit:>10.0f}{rebuild:>10.0f}")
+    print(f"read views: {read_views.hits} hits / {read_views.builds} builds")
+
+
+if __name__ == "__main__":
+    main()
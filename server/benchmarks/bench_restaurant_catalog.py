@@ -0,0 +1,174 @@
+"""
+식당 카탈로그 검증 + 벤치마크
+- 조회/추천 대상 식당이 기존 리스트 필터 방식과 같은지 (모든 종류 x 가격대 조합)
+- 추첨 빈도가 평점/거리 가중치 비율과 맞는지 (1개 추천, 중복 없는 여러 개 추천)
+- 기존 get_recommended_restaurants가 공용 RESTAURANTS 리스트를 섞어버리는 문제 재현 + 카탈로그는 변경 없음
+- 호출당 시간: 기존 리스트 필터 vs 카탈로그 (설정 12개, 가상 10,000개)
+
+실행: python -m benchmarks.bench_restaurant_catalog
+"""
+import copy
+import random
+import statistics
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from app.core.config import RESTAURANTS
+from app.services.restaurant_catalog import RestaurantCatalog, restaurant_weight
+
+DRAWS = 200_000
+TOLERANCE = 0.01  # 추첨 비율 허용 오차 (절댓값)
+TIMING_CALLS = 20_000
+
+
+# ============ 기존 구현 (app/core/utils.py, routers/restaurants.py에서 옮겨옴) ============
+def old_recommended(restaurants, menu, price_range=None, count=3):
+    filtered = [r for r in restaurants if r["type"] == menu]
+    if price_range:
+        price_filtered = [r for r in filtered if r["price"] == price_range]
+        if price_filtered:
+            filtered = price_filtered
+    if not filtered:
+        filtered = restaurants
+    random.shuffle(filtered)
+    return filtered[:count]
+
+
+def old_filter(restaurants, menu=None, price_range=None):
+    filtered = restaurants
+    if menu:
+        filtered = [r for r in filtered if r["type"] == menu]
+    if price_range:
+        filtered = [r for r in filtered if r["price"] == price_range]
+    return filtered
+
+
+def old_recommend_candidates(restaurants, menu, price_range):
+    filtered = [r for r in restaurants if r["type"] == menu]
+    if price_range:
+        price_filtered = [r for r in filtered if r["price"] == price_range]
+        if price_filtered:
+            filtered = price_filtered
+    return filtered or restaurants
+
+
+def ids(restaurants) -> list:
+    return [r["id"] for r in restaurants]
+
+
+def check_equivalence(catalog: RestaurantCatalog):
+    menus = [None, "", "unknown", *sorted({r["type"] for r in RESTAURANTS})]
+    prices = [None, "", "unknown", *sorted({r["price"] for r in RESTAURANTS})]
+    for menu in menus:
+        for price in prices:
+            assert ids(catalog.find(menu, price)) == ids(old_filter(RESTAURANTS, menu, price)), (menu, price)
+            expected = set(ids(old_recommend_candidates(RESTAURANTS, menu, price)))
+            assert catalog.recommend(menu, price)["id"] in expected
+            assert set(ids(catalog.recommend_many(menu, price, 100))) == expected
+            picked = catalog.pick(menu, price)["id"]
+            assert picked in set(ids(old_filter(RESTAURANTS, menu, price) or RESTAURANTS))
+    print(f"equivalence: {len(menus) * len(prices)} (menu, price) combinations OK")
+
+
+def check_distribution(catalog: RestaurantCatalog):
+    random.seed(0)
+    for menu, price in [(None, None), ("korean", None), ("korean", "low"), ("chinese", None)]:
+        candidates = catalog.bucket(menu, price).restaurants
+        total = sum(restaurant_weight(r) for r in candidates)
+        expected = {r["id"]: restaurant_weight(r) / total for r in candidates}
+        counts = Counter(catalog.recommend(menu, price)["id"] for _ in range(DRAWS))
+        error = max(abs(counts[i] / DRAWS - p) for i, p in expected.items())
+        print(f"recommend({menu}, {price}): {len(candidates)} candidates, max |freq - weight| = {error:.4f}")
+        assert error < TOLERANCE
+
+    # 중복 없이 3개: 첫 번째는 가중치 비율, 두 번째는 첫 번째를 뺀 나머지의 가중치 비율
+    candidates = catalog.bucket().restaurants
+    weights = {r["id"]: restaurant_weight(r) for r in candidates}
+    total = sum(weights.values())
+    second_expected = Counter()
+    for first, w in weights.items():
+        for second, w2 in weights.items():
+            if second != first:
+                second_expected[second] += w / total * w2 / (total - w)
+    samples = [ids(catalog.recommend_many(count=3)) for _ in range(DRAWS // 4)]
+    assert all(len(set(s)) == 3 for s in samples)
+    first_error = max(abs(Counter(s[0] for s in samples)[i] / len(samples) - w / total) for i, w in weights.items())
+    second_error = max(abs(Counter(s[1] for s in samples)[i] / len(samples) - p) for i, p in second_expected.items())
+    print(f"recommend_many(count=3): max |freq - expected| first={first_error:.4f} second={second_error:.4f}")
+    assert first_error < TOLERANCE and second_error < TOLERANCE
+
+
+def check_no_shared_mutation(catalog: RestaurantCatalog):
+    shared = copy.deepcopy(RESTAURANTS)
+    before = ids(shared)
+    old_recommended(shared, "unknown")  # 종류가 없으면 공용 리스트 자체를 섞음
+    print(f"old get_recommended_restaurants('unknown') reordered shared list: {ids(shared) != before}")
+
+    snapshot = copy.deepcopy(RESTAURANTS)
+
+    def worker(seed: int):
+        rng = random.Random(seed)
+        for _ in range(2000):
+            menu = rng.choice([None, "unknown", "korean", "western"])
+            result = catalog.recommend_many(menu, None, 3)
+            result[0]["name"] = "변경"  # 반환값을 바꿔도 카탈로그에는 영향 없음
+            assert ids(catalog.find()) == ids(RESTAURANTS)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(worker, range(8)))
+    assert RESTAURANTS == snapshot and catalog.find() == snapshot
+    print("catalog: 8 threads x 2000 calls, config list and catalog unchanged")
+
+
+def per_call_us(fn, calls: int) -> float:
+    """3회 측정 중앙값 (호출당 us)"""
+    samples = []
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(calls):
+            fn()
+        samples.append((time.perf_counter() - start) / calls * 1_000_000)
+    return statistics.median(samples)
+
+
+def synthetic_restaurants(count: int) -> list:
+    rng = random.Random(1)
+    return [
+        {"id": f"s{i}", "name": f"식당{i}", "type": rng.choice(["korean", "japanese", "chinese", "salad", "snack", "western"]),
+         "price": rng.choice(["low", "mid", "high"]), "distance": rng.randint(1, 15), "rating": round(rng.uniform(3, 5), 1)}
+        for i in range(count)
+    ]
+
+
+def bench():
+    print(f"{'':<40}{'old (us)':>10}{'catalog (us)':>14}")
+    for name, restaurants in [("config (12)", RESTAURANTS), ("synthetic (10,000)", synthetic_restaurants(10_000))]:
+        restaurants = copy.deepcopy(restaurants)
+        start = time.perf_counter()
+        catalog = RestaurantCatalog(restaurants)
+        build_ms = (time.perf_counter() - start) * 1000
+        for label, old, new in [
+            ("recommend 1", lambda: old_recommended(restaurants, "korean", "mid", 1),
+             lambda: catalog.recommend("korean", "mid")),
+            ("recommend 3", lambda: old_recommended(restaurants, "korean", "mid", 3),
+             lambda: catalog.recommend_many("korean", "mid", 3)),
+            ("filter (menu, price)", lambda: old_filter(restaurants, "korean", "mid"),
+             lambda: catalog.bucket("korean", "mid")),
+        ]:
+            old_us = per_call_us(old, TIMING_CALLS * 12 // len(restaurants) or 200)
+            new_us = per_call_us(new, TIMING_CALLS)
+            print(f"{name + ' ' + label:<40}{old_us:>10.2f}{new_us:>14.2f}")
+        print(f"{name + ' build':<40}{'':>10}{build_ms * 1000:>14.0f}")
+
+
+def main():
+    catalog = RestaurantCatalog(RESTAURANTS)
+    check_equivalence(catalog)
+    check_distribution(catalog)
+    check_no_shared_mutation(catalog)
+    bench()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+세션 저장소 검증 + 벤치마크
+- 유저별 세션 삭제(로그인 시): 전체 세션 스캔(기존) vs user_id 역인덱스
+- TTL: 만료된 세션은 조회 시 없음 + 주기적 정리로 삭제 (메모리/SQLite)
+- 이전 스키마(만료 시각 없는 sessions 테이블) SQLite DB 마이그레이션
+- 서명 토큰 모드: 로그인/재로그인/로그아웃 흐름, 위조/만료 토큰 거부, 현재 유저 조회 시간
+
+실행: python -m benchmarks.bench_sessions
+"""
+import os
+
+os.environ["SESSION_TOKEN_MODE"] = "signed"  # app 모듈 import 전에 설정
+os.environ.setdefault("SESSION_SIGNING_SECRET", "bench-secret")
+
+import sqlite3
+import statistics
+import tempfile
+import time
+
+from app.core.signed_tokens import issue_signed_token, verify_signed_token
+from app.core.utils import generate_token
+from app.repositories import DataStore, SqliteDataStore, data_store
+from app.services import AuthService
+
+USERS = 10_000
+SESSIONS_PER_USER = 10
+
+
+def timed_us(fn, repeat: int = 200) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(samples)
+
+
+def bench_reverse_index():
+    store = DataStore()
+    for u in range(USERS):
+        for _ in range(SESSIONS_PER_USER):
+            store.create_session(generate_token(), f"user-{u}")
+    sessions = dict(store._sessions)
+
+    def scan_delete():
+        # 기존 구현: 전체 세션을 훑어서 해당 유저 토큰 찾기
+        return [t for t, (uid, _) in sessions.items() if uid == "user-1"]
+
+    user_ids = iter(f"user-{u}" for u in range(USERS))
+    indexed = timed_us(lambda: store.delete_user_sessions(next(user_ids)))
+    print(f"delete_user_sessions with {USERS * SESSIONS_PER_USER} sessions: "
+          f"scan={timed_us(scan_delete, 20):.0f}us reverse index={indexed:.1f}us")
+    assert store.count_sessions() == (USERS - 200) * SESSIONS_PER_USER
+    assert not any(f"user-{u}" in store._tokens_by_user_id for u in range(200))
+
+
+def check_ttl(store: DataStore, name: str):
+    store.create_session("short", "user-a", ttl_seconds=0.05)
+    store.create_session("long", "user-a", ttl_seconds=60)
+    assert store.get_session("short") == "user-a"
+    time.sleep(0.1)
+    assert store.get_session("short") is None and store.get_session("long") == "user-a"
+    store.create_session("stale", "user-b", ttl_seconds=0.01)
+    time.sleep(0.05)
+    before = store.count_sessions()
+    swept = store.sweep_expired_sessions()
+    print(f"{name}: expired sessions hidden on lookup, sweep removed {swept} ({before} -> {store.count_sessions()})")
+    assert store.count_sessions() == 1
+
+    store.revoke_token("jti-1", time.time() + 60)
+    store.revoke_user_tokens("user-c", issued_before=100.0, expires_at=time.time() + 0.01)
+    assert store.is_token_revoked("jti-1", "user-x", 0) and store.is_token_revoked("jti-2", "user-c", 99.0)
+    assert not store.is_token_revoked("jti-2", "user-c", 100.0)
+    time.sleep(0.05)
+    store.sweep_expired_sessions()
+    assert store.is_token_revoked("jti-1", "user-x", 0) and not store.is_token_revoked("jti-2", "user-c", 99.0)
+
+
+def check_sqlite_migration(directory: str):
+    path = os.path.join(directory, "old.db")
+    conn = sqlite3.connect(path)
+    conn.executescript("CREATE TABLE sessions (token TEXT PRIMARY KEY, user_id TEXT NOT NULL);"
+                       "INSERT INTO sessions VALUES ('old-token', 'user-old');")
+    conn.commit()
+    conn.close()
+    store = SqliteDataStore(path)
+    assert store.get_session("old-token") == "user-old"
+    store.close()
+    print("sqlite: old sessions table migrated, existing session kept")
+
+
+def check_signed_mode():
+    username = password = "test1"  # 기본 테스트 계정
+    first = AuthService.login(username, password)
+    token = first["token"]
+    assert AuthService.get_current_user(token)["id"] == first["user"]["id"]
+    assert data_store.count_sessions() == 0  # 저장소 세션 없이 검증
+
+    second = AuthService.login(username, password)["token"]
+    assert AuthService.get_current_user(token) is None, "재로그인하면 이전 토큰 무효"
+    assert AuthService.get_current_user(second) is not None
+    AuthService.logout(second)
+    assert AuthService.get_current_user(second) is None, "로그아웃한 토큰 무효"
+
+    payload, _, signature = issue_signed_token("user-x").partition(".")
+    forged = issue_signed_token("admin").split(".")[0] + "." + signature
+    assert verify_signed_token(forged) is None and verify_signed_token(payload + ".") is None
+    assert verify_signed_token(issue_signed_token("user-x", ttl_seconds=-1)) is None
+    print("signed tokens: re-login/logout revoke, forged/expired tokens rejected, no session rows")
+
+    third = AuthService.login(username, password)["token"]
+    signed_us = timed_us(lambda: AuthService.get_current_user(third), 2000)
+    data_store.create_session("opaque", first["user"]["id"])  # 같은 유저의 저장소 세션 조회와 비교
+    opaque_us = timed_us(lambda: data_store.get_user_with_level(data_store.get_session("opaque")), 2000)
+    print(f"get_current_user: signed={signed_us:.1f}us opaque(memory)={opaque_us:.1f}us")
+
+
+def main():
+    bench_reverse_index()
+    check_ttl(DataStore(), "memory")
+    with tempfile.TemporaryDirectory() as directory:
+        store = SqliteDataStore(os.path.join(directory, "sessions.db"))
+        check_ttl(store, "sqlite")
+        store.close()
+        check_sqlite_migration(directory)
+    check_signed_mode()
+
+
+if __name__ == "__main__":
+    main()
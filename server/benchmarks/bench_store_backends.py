@@ -0,0 +1,85 @@
+"""
+저장소 백엔드 처리량 비교 (memory vs sqlite)
+서비스 계층(MatchService / RoomService) 그대로 매칭 참여, 상태 조회, 점심방 목록의 초당 처리량을 잽니다.
+저장소는 import 시점에 DATA_STORE_BACKEND로 정해지므로 백엔드마다 하위 프로세스에서 실행합니다.
+
+실행: python -m benchmarks.bench_store_backends
+"""
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+JOINS = 3_000
+STATUS_READS = 10_000
+ROOMS = 200
+ROOM_LISTS = 300
+BACKENDS = ["memory", "sqlite"]
+
+
+def throughput(fn, args: list) -> float:
+    """args 각각으로 fn 호출, 초당 처리량"""
+    start = time.perf_counter()
+    for a in args:
+        fn(*a)
+    return len(args) / (time.perf_counter() - start)
+
+
+def worker() -> dict:
+    """현재 환경 변수의 백엔드로 측정 (하위 프로세스에서 실행)"""
+    from app.services import MatchService, RoomService
+    from benchmarks.population import make_population
+
+    rng = random.Random(0)
+    population = make_population(JOINS, seed=0)
+    join_args = [
+        (f"bench-{i}", r["name"], r["department"], r["gender"], r["age"], r["level"],
+         r["timeSlot"], r["priceRange"], r["menu"], r["preferences"])
+        for i, r in enumerate(request.to_dict() for request in population)
+    ]
+    results = {}
+    outcomes = []
+    results["join"] = throughput(lambda *a: outcomes.append(MatchService.join_match(*a)), join_args)
+
+    request_ids = [o.get("matchRequestId") or o["matchRequest"]["id"] for o in outcomes]
+    status_args = [(rng.choice(request_ids),) for _ in range(STATUS_READS)]
+    results["status"] = throughput(MatchService.get_match_status, status_args)
+
+    for i in range(ROOMS):
+        RoomService.create_room(f"방{i}", "12:00", "korean", "mid", 4, f"creator-{i}", "방장", "테스트")
+    results["room_list"] = throughput(RoomService.get_all_rooms, [()] * ROOM_LISTS)
+    results["rooms_listed"] = len(RoomService.get_all_rooms())
+    return results
+
+
+def run_backend(backend: str, db_dir: str) -> dict:
+    env = {**os.environ, "DATA_STORE_BACKEND": backend, "SQLITE_PATH": os.path.join(db_dir, f"{backend}.db")}
+    out = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_store_backends", "--worker"],
+        env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+def main():
+    if "--worker" in sys.argv:
+        print(json.dumps(worker()))
+        return
+
+    with tempfile.TemporaryDirectory() as db_dir:
+        results = {backend: run_backend(backend, db_dir) for backend in BACKENDS}
+
+    print(f"joins={JOINS} status={STATUS_READS} rooms={ROOMS}x{ROOM_LISTS} lists (ops/s, 높을수록 좋음)")
+    print(f"{'op':>10} " + " ".join(f"{b:>12}" for b in BACKENDS) + f" {'mem/sql':>8}")
+    for op in ["join", "status", "room_list"]:
+        values = [results[b][op] for b in BACKENDS]
+        print(f"{op:>10} " + " ".join(f"{v:>12,.0f}" for v in values) + f" {values[0] / values[1]:>7.1f}x")
+    for backend in BACKENDS:
+        assert results[backend]["rooms_listed"] >= ROOMS, backend
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+"""
+대기 요청 레코드 벤치마크 - dict(이전) vs WaitingRequest(__slots__ + 코드)
+- 요청당 메모리: JSON 요청 본문을 파싱해서 대기 요청 1건을 만들고 남는 바이트 (tracemalloc, 10만 건)
+  (이전: join_match가 만들던 14키 dict / 이후: WaitingRequest, 공통 문자열 id/userId/name/department 포함)
+- 후보 체크 처리량: 같은 인원의 무작위 쌍으로 check_mutual_match 초당 호출 수
+  (이전: 레코드 적용 전 dict 조건 체크와 같은 코드)
+
+실행: python -m benchmarks.bench_waiting_record
+"""
+import gc
+import json
+import random
+import time
+import tracemalloc
+from datetime import datetime
+from typing import List
+
+from app.core.config import LEVEL_GROUPS, SIMILAR_AGE_RANGE
+from app.core.utils import generate_id
+from app.repositories import WaitingRequest
+from app.services import MatchService
+from benchmarks.population import make_population
+
+RECORDS = 100_000
+PAIRS = 200_000
+REPEAT = 5
+
+
+# ----- 레코드 적용 전 조건 체크 (dict) -----
+
+def before_similar_levels(level: str) -> list:
+    """해당 직급과 비슷한 직급들 반환"""
+    for group in LEVEL_GROUPS:
+        if level in group:
+            return group
+    return [level]
+
+
+def before_is_similar_age(age1: int, age2: int, threshold: int = SIMILAR_AGE_RANGE) -> bool:
+    """나이가 ±threshold 이내인지 확인"""
+    return abs(age1 - age2) <= threshold
+
+
+def before_is_similar_level(level1: str, level2: str) -> bool:
+    """직급이 비슷한지 확인"""
+    return level2 in before_similar_levels(level1)
+
+
+def before_active_conditions(preferences: dict) -> List[str]:
+    active_conditions = []
+    if preferences.get("sameGender"):
+        active_conditions.append("gender")
+    if preferences.get("similarAge"):
+        active_conditions.append("age")
+    if preferences.get("sameLevel"):
+        active_conditions.append("level")
+    return active_conditions
+
+
+def before_remaining_conditions(preferences: dict, relaxation_level: int) -> List[str]:
+    if not preferences:
+        return []
+    active_conditions = before_active_conditions(preferences)
+    return active_conditions[relaxation_level:] if relaxation_level < len(active_conditions) else []
+
+
+def before_one_way(checker: dict, target: dict, checker_relaxation: int) -> bool:
+    for cond in before_remaining_conditions(checker.get("preferences", {}), checker_relaxation):
+        if cond == "gender":
+            if checker.get("gender") and target.get("gender"):
+                if checker["gender"] != target["gender"]:
+                    return False
+        elif cond == "age":
+            if checker.get("age") and target.get("age"):
+                if not before_is_similar_age(checker["age"], target["age"]):
+                    return False
+        elif cond == "level":
+            if checker.get("level") and target.get("level"):
+                if not before_is_similar_level(checker["level"], target["level"]):
+                    return False
+    return True
+
+
+def before_mutual(user_a: dict, user_b: dict, a_relaxation: int, b_relaxation: int) -> bool:
+    return before_one_way(user_a, user_b, a_relaxation) and before_one_way(user_b, user_a, b_relaxation)
+
+
+# ----- 요청당 메모리 -----
+
+def request_bodies(population: List[WaitingRequest]) -> List[bytes]:
+    """POST /match/join 본문 (유저 ID 포함)"""
+    bodies = []
+    for request in population:
+        data = request.to_dict()
+        bodies.append(json.dumps({
+            "userId": generate_id(), "name": data["name"], "department": data["department"],
+            "gender": data["gender"], "age": data["age"], "level": data["level"],
+            "timeSlot": data["timeSlot"], "priceRange": data["priceRange"], "menu": data["menu"],
+            "preferences": data["preferences"],
+        }).encode())
+    return bodies
+
+
+def build_before(body: dict) -> dict:
+    return {
+        "id": generate_id(),
+        "userId": body["userId"],
+        "name": body["name"],
+        "department": body["department"],
+        "gender": body["gender"],
+        "age": body["age"],
+        "level": body["level"],
+        "timeSlot": body["timeSlot"],
+        "priceRange": body["priceRange"],
+        "menu": body["menu"],
+        "preferences": body["preferences"] or {},
+        "joinedAt": datetime.now().isoformat(),
+        "relaxationLevel": 0,
+    }
+
+
+def build_after(body: dict) -> WaitingRequest:
+    return WaitingRequest.create(
+        generate_id(), body["userId"], body["name"], body["department"],
+        body["gender"], body["age"], body["level"],
+        body["timeSlot"], body["priceRange"], body["menu"], body["preferences"],
+    )
+
+
+def bytes_per_request(build, bodies: List[bytes]) -> float:
+    """본문 파싱 → 레코드 생성 후 레코드가 붙잡고 있는 바이트 (레코드를 담는 리스트 제외)"""
+    records = [None] * len(bodies)
+    gc.collect()
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    for i, body in enumerate(bodies):
+        records[i] = build(json.loads(body))
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    return used / len(bodies)
+
+
+# ----- 후보 체크 처리량 -----
+
+def checks_per_second(check, pairs: list) -> float:
+    best = 0.0
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        for a, b, a_level, b_level in pairs:
+            check(a, b, a_level, b_level)
+        best = max(best, len(pairs) / (time.perf_counter() - start))
+    return best
+
+
+def main():
+    population = make_population(RECORDS, seed=0, pref_rate=0.5)
+    bodies = request_bodies(population)
+    before_bytes = bytes_per_request(build_before, bodies)
+    after_bytes = bytes_per_request(build_after, bodies)
+    print(f"bytes per waiting request ({RECORDS:,} records)")
+    print(f"  before (dict)          {before_bytes:8.0f} B")
+    print(f"  after (WaitingRequest) {after_bytes:8.0f} B  ({after_bytes / before_bytes - 1:+.0%})")
+
+    rng = random.Random(0)
+    indexes = [(rng.randrange(RECORDS), rng.randrange(RECORDS)) for _ in range(PAIRS)]
+    dicts = [request.to_dict() for request in population]
+    before_pairs = [(dicts[i], dicts[j], dicts[i]["relaxationLevel"], dicts[j]["relaxationLevel"]) for i, j in indexes]
+    after_pairs = [(population[i], population[j], population[i].relaxation_level, population[j].relaxation_level)
+                   for i, j in indexes]
+
+    # 같은 쌍에 대해 결과가 같아야 함
+    for before, after in zip(before_pairs, after_pairs):
+        assert before_mutual(*before) == MatchService.check_mutual_match(*after)
+
+    before_ops = checks_per_second(before_mutual, before_pairs)
+    after_ops = checks_per_second(MatchService.check_mutual_match, after_pairs)
+    print(f"check_mutual_match ({PAIRS:,} random pairs, best of {REPEAT})")
+    print(f"  before (dict)          {before_ops:10,.0f} ops/s")
+    print(f"  after (WaitingRequest) {after_ops:10,.0f} ops/s  ({after_ops / before_ops:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
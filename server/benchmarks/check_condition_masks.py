@@ -0,0 +1,97 @@
+"""
+조건 마스크 / 직급 호환 테이블 검증
+참여 시 계산하는 완화 단계별 조건 마스크와 LEVEL_GROUPS에서 만든 직급 호환 테이블이
+이전 dict 조건 체크(bench_waiting_record의 before_* 함수)와 같은 결과를 내는지 전수 확인합니다.
+- 직급 호환: (값 없음 + LEVEL_GROUPS 직급 + 목록에 없는 직급) 모든 쌍, 인덱스 조회용 직급 목록
+- 단방향: checker(성별 x 나이 x 직급 x 선호 조건 8가지 x 완화 단계) x target(성별 x 나이 x 직급) 전체
+  나이 조건은 두 나이의 차이로만 정해지므로 checker 나이는 (없음, 30)으로 두고
+  target 나이로 차이 -(SIMILAR_AGE_RANGE + 2) ~ +(SIMILAR_AGE_RANGE + 2)를 모두 확인
+- 양방향: 경계 안/밖 나이로 줄인 프로필 x 완화 단계의 모든 쌍
+
+실행: python -m benchmarks.check_condition_masks
+"""
+import itertools
+
+from app.core.config import LEVEL_GROUPS, MAX_RELAXATION_LEVEL, SIMILAR_AGE_RANGE
+from app.repositories import WaitingRequest
+from app.repositories.waiting_request import LEVELS, PREFERENCE_BITS, level_accepts, similar_level_codes
+from app.services import MatchService
+from benchmarks.bench_waiting_record import (
+    before_one_way, before_mutual, before_is_similar_level, before_similar_levels,
+)
+
+GENDERS = [None, "male", "female"]
+KNOWN_LEVELS = list(dict.fromkeys(level for row in LEVEL_GROUPS for level in row))
+LEVEL_VALUES = [None] + KNOWN_LEVELS + ["ceo", "contractor"]  # 목록에 없는 직급 포함
+PREFERENCES = [
+    {name: bool(mask & bit) for name, bit in PREFERENCE_BITS.items()}
+    for mask in range(1 << len(PREFERENCE_BITS))
+]
+RELAXATION_LEVELS = range(MAX_RELAXATION_LEVEL + 2)  # 최대 단계를 넘는 값 포함
+CHECKER_AGES = [None, 30]
+TARGET_AGES = [None] + list(range(30 - SIMILAR_AGE_RANGE - 2, 30 + SIMILAR_AGE_RANGE + 3))
+MUTUAL_AGES = [None, 30, 30 + SIMILAR_AGE_RANGE, 30 + SIMILAR_AGE_RANGE + 1]
+
+
+def make_pair(gender, age, level, preferences=None, relaxation_level=0) -> tuple:
+    """같은 요청의 (이전 dict, WaitingRequest)"""
+    data = {
+        "id": "check", "userId": "check", "gender": gender, "age": age, "level": level,
+        "timeSlot": "12:00", "priceRange": "mid", "menu": "korean",
+        "preferences": preferences or {}, "relaxationLevel": relaxation_level,
+    }
+    return data, WaitingRequest.from_dict(data)
+
+
+def check_level_table() -> int:
+    checked = 0
+    for a, b in itertools.product(LEVEL_VALUES[1:], repeat=2):
+        expected = before_is_similar_level(a, b)
+        assert bool(level_accepts(LEVELS.code(a)) >> LEVELS.code(b) & 1) == expected, (a, b)
+        checked += 1
+    for level in LEVEL_VALUES[1:]:
+        expected = sorted(LEVELS.code(name) for name in before_similar_levels(level))
+        assert similar_level_codes(LEVELS.code(level)) == expected, level
+    return checked
+
+
+def check_one_way() -> int:
+    targets = [make_pair(g, a, l) for g, a, l in itertools.product(GENDERS, TARGET_AGES, LEVEL_VALUES)]
+    checked = 0
+    for gender, age, level, preferences in itertools.product(GENDERS, CHECKER_AGES, LEVEL_VALUES, PREFERENCES):
+        checker_dict, checker = make_pair(gender, age, level, preferences)
+        for relaxation in RELAXATION_LEVELS:
+            for target_dict, target in targets:
+                expected = before_one_way(checker_dict, target_dict, relaxation)
+                assert MatchService.check_one_way_match(checker, target, relaxation) == expected, (
+                    checker_dict, target_dict, relaxation
+                )
+            checked += len(targets)
+    return checked
+
+
+def check_mutual() -> int:
+    profiles = [
+        make_pair(g, a, l, p)
+        for g, a, l, p in itertools.product(GENDERS, MUTUAL_AGES, LEVEL_VALUES, PREFERENCES)
+    ]
+    states = [(data, record, relaxation) for data, record in profiles for relaxation in RELAXATION_LEVELS]
+    checked = 0
+    for a_dict, a, a_relaxation in states:
+        for b_dict, b, b_relaxation in states:
+            expected = before_mutual(a_dict, b_dict, a_relaxation, b_relaxation)
+            assert MatchService.check_mutual_match(a, b, a_relaxation, b_relaxation) == expected, (
+                a_dict, b_dict, a_relaxation, b_relaxation
+            )
+        checked += len(states)
+    return checked
+
+
+def main():
+    print(f"level pairs: {check_level_table():,} OK")
+    print(f"one-way checks: {check_one_way():,} OK")
+    print(f"mutual checks: {check_mutual():,} OK")
+
+
+if __name__ == "__main__":
+    main()
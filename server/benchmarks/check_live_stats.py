@@ -0,0 +1,117 @@
+"""
+실시간 통계 카운터 검증
+메모리/SQLite 저장소 각각에 무작위 작업(대기열 추가/취소/타임아웃, 그룹 생성(claim 실패 포함),
+점심방 생성/삭제, 보관 기간 삭제)을 수행하면서 주기적으로
+get_stats()(카운터)와 recount_stats()(전체 재계산)가 같은지 확인하고,
+마지막에 레코드 수에 따른 /stats 조회 시간(재계산 vs 카운터)을 비교합니다.
+
+실행: python -m benchmarks.check_live_stats
+"""
+import os
+import random
+import statistics
+import tempfile
+import time
+from datetime import date, timedelta
+
+from app.core.utils import generate_id
+from app.repositories import DataStore, SqliteDataStore, WaitingRequest
+
+OPERATIONS = 5000
+CHECK_EVERY = 50
+SEEDS = 5
+TIME_SLOTS = ["11:30", "12:00", "12:30"]
+PRICE_RANGES = ["low", "mid", "high"]
+MENUS = ["korean", "japanese", "chinese", "salad", "snack", "western"]
+
+
+def random_request(rng: random.Random) -> WaitingRequest:
+    return WaitingRequest.from_dict({
+        "id": generate_id(),
+        "userId": f"user-{rng.randrange(200)}",
+        "timeSlot": rng.choice(TIME_SLOTS),
+        "priceRange": rng.choice(PRICE_RANGES),
+        "menu": rng.choice(MENUS),
+        "gender": rng.choice(["male", "female"]),
+        "level": "사원",
+        "age": rng.randint(23, 45),
+    })
+
+
+def run_operations(store: DataStore, rng: random.Random, operations: int = OPERATIONS) -> int:
+    """무작위 작업 수행, 카운터 == 재계산 확인 횟수 반환"""
+    room_ids = []
+    checks = 0
+    for step in range(operations):
+        waiting = store.get_all_waiting_users()
+        op = rng.random()
+        if op < 0.40 or not waiting:
+            request = random_request(rng)
+            store.remove_waiting_user_by_user_id(request.user_id)
+            store.add_waiting_user(request)
+        elif op < 0.50:
+            store.remove_waiting_user(rng.choice(waiting).id)
+        elif op < 0.55:
+            store.expire_waiting_user(rng.choice(waiting).id)
+        elif op < 0.75:
+            members = [m.to_dict() for m in rng.sample(waiting, min(len(waiting), rng.randint(2, 4)))]
+            # 가끔 이미 대기열에 없는 요청을 섞어서 claim 실패도 확인
+            claim = [m["id"] for m in members] + ([generate_id()] if rng.random() < 0.1 else [])
+            store.create_group({"members": members, "menu": members[0]["menu"]}, claim_request_ids=claim)
+        elif op < 0.88:
+            room_ids.append(store.create_room({"title": "점심", "members": [], "maxCount": 4, "status": "open"})["id"])
+        elif op < 0.98 and room_ids:
+            store.delete_room(room_ids.pop(rng.randrange(len(room_ids))))
+        elif op >= 0.995:
+            store.evict_expired_partitions(date.today() + timedelta(days=rng.randint(1, 30)))
+            room_ids.clear()
+
+        if step % CHECK_EVERY == 0 or step == operations - 1:
+            counted, recounted = store.get_stats(), store.recount_stats()
+            assert counted == recounted, (step, counted, recounted)
+            checks += 1
+    return checks
+
+
+def timed_us(fn, repeat: int = 20) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1_000_000)
+    return statistics.median(samples)
+
+
+def main():
+    for seed in range(SEEDS):
+        checks = run_operations(DataStore(), random.Random(seed))
+        print(f"memory seed={seed}: {checks} checks OK")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for seed in range(SEEDS):
+            path = os.path.join(directory, f"stats-{seed}.db")
+            store = SqliteDataStore(path)
+            checks = run_operations(store, random.Random(seed), OPERATIONS // 5)
+            stats = store.get_stats()
+            store.close()
+            reopened = SqliteDataStore(path)  # 재시작 후 DB에서 다시 센 카운터도 같아야 함
+            assert reopened.get_stats() == stats, (reopened.get_stats(), stats)
+            reopened.close()
+            print(f"sqlite seed={seed}: {checks} checks OK, restart OK")
+
+    print(f"{'waiting':>8}{'groups':>8}{'recount (us)':>14}{'counter (us)':>14}")
+    rng = random.Random(0)
+    store = DataStore()
+    for waiting, groups in [(100, 100), (1000, 1000), (5000, 10000)]:
+        for _ in range(waiting):
+            store.add_waiting_user(random_request(rng))
+        for _ in range(groups):
+            members = [random_request(rng).to_dict() for _ in range(4)]
+            store.create_group({"members": members, "menu": members[0]["menu"]})
+        stats = store.get_stats()
+        print(f"{stats['waitingUsers']:>8}{stats['totalGroups']:>8}"
+              f"{timed_us(store.recount_stats):>14.0f}{timed_us(store.get_stats):>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+"""
+점심 러시 부하 테스트
+실제 앱(main.app)을 같은 프로세스에서 httpx ASGI transport로 (lifespan 직접 실행), 또는 --base-url로 로컬 uvicorn에 대고
+동시에 몰리는 점심 사용자를 흉내 냅니다.
+
+- 매칭 사용자(--users): 회원가입 -> 로그인 -> 활성 상태 확인(Join.jsx) -> 매칭 참여 (메뉴/가격대/시간대/선호 옵션 분포)
+  -> Matching.jsx처럼 --poll-interval마다 /match/status 폴링 -> 매칭되면 그룹 조회(Result.jsx),
+  --max-wait까지 매칭이 안 되면 취소
+- 구경하는 사용자(--browsers): Rooms.jsx처럼 3초마다 /rooms + /match/active + /stats (이전 ETag로 조건부 GET)
+- 사용자 도착은 --ramp 초 동안 고르게 퍼짐
+
+결과: 라우트별 p50/p95/p99/최대 지연(ms), 요청 수, 오류율, 초당 매칭 그룹/인원 -> JSON 저장 (--out)
+--compare 이전결과.json 으로 라우트별 p95와 매칭 처리량 변화를 출력합니다.
+같은 프로세스 모드에서는 부하 생성기와 서버가 이벤트 루프를 같이 쓰므로 절대값보다 실행 간 비교용입니다.
+
+실행: python -m benchmarks.load_lunch_rush --users 300 --browsers 50
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+
+import httpx
+
+# Join.jsx 선택지 + 점심시간 쏠림을 반영한 가중치
+TIME_SLOTS = {"11:30": 0.2, "12:00": 0.45, "12:30": 0.25, "13:00": 0.1}
+PRICE_RANGES = {"low": 0.25, "mid": 0.55, "high": 0.2}
+MENUS = {"korean": 0.35, "japanese": 0.12, "chinese": 0.13, "western": 0.12, "salad": 0.1, "snack": 0.18}
+LEVELS = {"intern": 0.05, "staff": 0.3, "assistant": 0.25, "manager": 0.2, "deputy": 0.1, "general": 0.07, "director": 0.03}
+PREFERENCE_RATES = {"sameGender": 0.2, "similarAge": 0.15, "sameLevel": 0.15}
+DEPARTMENTS = ["개발팀", "디자인팀", "기획팀", "마케팅팀", "영업팀", "인사팀"]
+BROWSE_INTERVAL_SECONDS = 3.0  # Rooms.jsx 새로고침 주기
+
+DEFAULT_OUT_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+def choose(rng: random.Random, weights: Dict[str, float]) -> str:
+    return rng.choices(list(weights), weights=list(weights.values()))[0]
+
+
+class Recorder:
+    """라우트별 지연/오류 기록"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.not_modified: Dict[str, int] = defaultdict(int)
+
+    async def call(self, client: httpx.AsyncClient, route: str, method: str, url: str, **kwargs) -> Optional[httpx.Response]:
+        start = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            response = None
+        self.latencies[route].append((time.perf_counter() - start) * 1000)
+        if response is None or response.status_code >= 400:
+            self.errors[route] += 1
+            return None
+        if response.status_code == 304:
+            self.not_modified[route] += 1
+        return response
+
+    def summary(self) -> Dict[str, dict]:
+        routes = {}
+        for route, samples in sorted(self.latencies.items()):
+            ordered = sorted(samples)
+            routes[route] = {
+                "count": len(ordered),
+                "errors": self.errors[route],
+                "notModified": self.not_modified[route],
+                "p50": percentile(ordered, 50),
+                "p95": percentile(ordered, 95),
+                "p99": percentile(ordered, 99),
+                "max": round(ordered[-1], 2),
+                "mean": round(statistics.fmean(ordered), 2),
+            }
+        return routes
+
+
+def percentile(ordered: List[float], p: float) -> float:
+    """정렬된 표본의 p 백분위 (nearest-rank)"""
+    index = max(0, min(len(ordered) - 1, int(round(p / 100 * len(ordered) + 0.5)) - 1))
+    return round(ordered[index], 2)
+
+
+class LunchRush:
+    def __init__(self, args):
+        self.args = args
+        self.rng = random.Random(args.seed)
+        self.recorder = Recorder()
+        self.run_id = f"{int(time.time())}{self.rng.randrange(1000):03d}"
+        self.outcomes: Dict[str, int] = defaultdict(int)
+        self.groups: set = set()
+        self.join_to_match: List[float] = []
+        self.finished = asyncio.Event()
+
+    def profile(self, i: int) -> dict:
+        rng = self.rng
+        return {
+            "username": f"rush{self.run_id}-{i}",
+            "password": "lunch-rush",
+            "name": f"부하{i}",
+            "department": rng.choice(DEPARTMENTS),
+            "level": choose(rng, LEVELS),
+            "gender": rng.choice(["male", "female"]),
+            "age": rng.randint(23, 55),
+        }
+
+    def match_request(self, user: dict) -> dict:
+        rng = self.rng
+        return {
+            "userId": user["id"], "name": user["name"], "department": user["department"],
+            "gender": user["gender"], "age": user["age"], "level": user["level"],
+            "timeSlot": choose(rng, TIME_SLOTS),
+            "priceRange": choose(rng, PRICE_RANGES),
+            "menu": choose(rng, MENUS),
+            "preferences": {name: rng.random() < rate for name, rate in PREFERENCE_RATES.items()},
+        }
+
+    async def sign_up(self, client: httpx.AsyncClient, i: int) -> Optional[dict]:
+        profile = self.profile(i)
+        call = self.recorder.call
+        if await call(client, "POST /auth/register", "POST", "/auth/register", json=profile) is None:
+            return None
+        response = await call(client, "POST /auth/login", "POST", "/auth/login",
+                              json={"username": profile["username"], "password": profile["password"]})
+        return response.json()["user"] if response is not None else None
+
+    async def luncher(self, client: httpx.AsyncClient, i: int, delay: float):
+        await asyncio.sleep(delay)
+        call = self.recorder.call
+        user = await self.sign_up(client, i)
+        if user is None:
+            self.outcomes["error"] += 1
+            return
+        await call(client, "GET /match/active/{userId}", "GET", f"/match/active/{user['id']}")
+        joined = await call(client, "POST /match/join", "POST", "/match/join", json=self.match_request(user))
+        if joined is None:
+            self.outcomes["error"] += 1
+            return
+        joined_at = time.perf_counter()
+        result = joined.json()
+        request_id = result.get("matchRequestId")
+        status = result.get("status")
+        while status == "waiting" and time.perf_counter() - joined_at < self.args.max_wait:
+            await asyncio.sleep(self.args.poll_interval)
+            response = await call(client, "GET /match/status", "GET", "/match/status",
+                                  params={"matchRequestId": request_id})
+            if response is not None:
+                result = response.json()
+                status = result.get("status")
+        if status == "matched":
+            self.join_to_match.append(time.perf_counter() - joined_at)
+            self.groups.add(result["groupId"])
+            await call(client, "GET /groups/{groupId}", "GET", f"/groups/{result['groupId']}")
+        elif status == "waiting":
+            await call(client, "DELETE /match/cancel", "DELETE", "/match/cancel", json={"matchRequestId": request_id})
+            status = "unmatched"
+        self.outcomes[status or "error"] += 1
+
+    async def browser(self, client: httpx.AsyncClient, i: int, delay: float):
+        await asyncio.sleep(delay)
+        user = await self.sign_up(client, self.args.users + i)
+        if user is None:
+            return
+        etags: Dict[str, str] = {}
+        pages = [("GET /rooms", "/rooms"), ("GET /match/active/{userId}", f"/match/active/{user['id']}"),
+                 ("GET /stats", "/stats")]
+        while not self.finished.is_set():
+            for route, url in pages:
+                headers = {"If-None-Match": etags[url]} if url in etags else {}
+                response = await self.recorder.call(client, route, "GET", url, headers=headers)
+                if response is not None and response.headers.get("ETag"):
+                    etags[url] = response.headers["ETag"]
+            try:
+                await asyncio.wait_for(self.finished.wait(), BROWSE_INTERVAL_SECONDS)
+            except asyncio.TimeoutError:
+                pass
+
+    async def run(self, client: httpx.AsyncClient) -> dict:
+        args = self.args
+        started = time.perf_counter()
+        browsers = [asyncio.create_task(self.browser(client, i, self.rng.uniform(0, args.ramp)))
+                    for i in range(args.browsers)]
+        await asyncio.gather(*[self.luncher(client, i, self.rng.uniform(0, args.ramp)) for i in range(args.users)])
+        self.finished.set()
+        await asyncio.gather(*browsers)
+        elapsed = time.perf_counter() - started
+
+        routes = self.recorder.summary()
+        requests = sum(route["count"] for route in routes.values())
+        errors = sum(route["errors"] for route in routes.values())
+        matched = self.outcomes["matched"]
+        return {
+            "startedAt": datetime.now().isoformat(),
+            "config": {key: value for key, value in vars(args).items() if key not in ("out", "compare")},
+            "durationSeconds": round(elapsed, 2),
+            "requests": requests,
+            "requestsPerSecond": round(requests / elapsed, 1),
+            "errorRate": round(errors / requests, 5) if requests else 0.0,
+            "outcomes": dict(self.outcomes),
+            "matches": {
+                "groups": len(self.groups),
+                "matchedUsers": matched,
+                "groupsPerSecond": round(len(self.groups) / elapsed, 3),
+                "matchedUsersPerSecond": round(matched / elapsed, 3),
+                "joinToMatchP50Seconds": round(statistics.median(self.join_to_match), 2) if self.join_to_match else None,
+            },
+            "routes": routes,
+        }
+
+
+@asynccontextmanager
+async def open_client(base_url: Optional[str]):
+    """--base-url가 있으면 실제 HTTP, 없으면 main.app을 lifespan과 함께 같은 프로세스에서 실행"""
+    timeout = httpx.Timeout(30.0)
+    if base_url:
+        limits = httpx.Limits(max_connections=200, max_keepalive_connections=200)
+        async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+            yield client
+        return
+    os.environ.setdefault("PLACE_CATALOG_CRAWL_ENABLED", "false")  # 부하 테스트 중 외부 API 크롤링 안 함
+    from main import app  # 같은 프로세스 모드에서만 앱(저장소/스케줄러) 로드
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://lunchmate", timeout=timeout) as client:
+            yield client
+
+
+def print_report(result: dict, previous: Optional[dict]):
+    print(f"\n{result['requests']} requests in {result['durationSeconds']}s "
+          f"({result['requestsPerSecond']} req/s), error rate {result['errorRate']:.2%}")
+    print(f"outcomes: {result['outcomes']}")
+    matches = result["matches"]
+    print(f"matches: {matches['groups']} groups / {matches['matchedUsers']} users "
+          f"({matches['groupsPerSecond']} groups/s, {matches['matchedUsersPerSecond']} users/s), "
+          f"join->match p50 {matches['joinToMatchP50Seconds']}s")
+    header = f"{'route':<30}{'count':>7}{'err':>5}{'304':>6}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}"
+    print("\n" + header + ("   p95 vs prev" if previous else ""))
+    for route, stats in result["routes"].items():
+        line = (f"{route:<30}{stats['count']:>7}{stats['errors']:>5}{stats['notModified']:>6}"
+                f"{stats['p50']:>9.1f}{stats['p95']:>9.1f}{stats['p99']:>9.1f}{stats['max']:>9.1f}")
+        before = previous and previous["routes"].get(route)
+        if before and before["p95"]:
+            line += f"   {(stats['p95'] - before['p95']) / before['p95']:+.0%}"
+        print(line)
+    if previous:
+        before = previous["matches"]["matchedUsersPerSecond"]
+        print(f"\nmatched users/s: {before} -> {matches['matchedUsersPerSecond']}, "
+              f"error rate: {previous['errorRate']:.2%} -> {result['errorRate']:.2%}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="LunchMate lunch-rush load test")
+    parser.add_argument("--users", type=int, default=200, help="매칭에 참여하는 사용자 수")
+    parser.add_argument("--browsers", type=int, default=50, help="점심방 목록을 구경하는 사용자 수")
+    parser.add_argument("--ramp", type=float, default=10.0, help="사용자 도착을 퍼뜨리는 시간 (초)")
+    parser.add_argument("--poll-interval", type=float, default=2.0, help="/match/status 폴링 주기 (Matching.jsx: 2초)")
+    parser.add_argument("--max-wait", type=float, default=30.0, help="매칭을 기다리는 최대 시간, 지나면 취소 (초)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--base-url", default=None, help="예: http://127.0.0.1:3001 (없으면 같은 프로세스에서 실행)")
+    parser.add_argument("--out", default=None, help="결과 JSON 경로 (기본: benchmarks/results/lunch_rush-<시각>.json)")
+    parser.add_argument("--compare", default=None, help="비교할 이전 결과 JSON")
+    return parser.parse_args()
+
+
+async def main():
+    args = parse_args()
+    previous = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            previous = json.load(f)
+    async with open_client(args.base_url) as client:
+        result = await LunchRush(args).run(client)
+    out = args.out or os.path.join(DEFAULT_OUT_DIR, f"lunch_rush-{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+    print_report(result, previous)
+    print(f"\nsaved {out}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,217 @@
+"""
+매칭 엔진 마이크로 벤치마크 모음 (회귀 감시용)
+합성 대기 인원(--sizes, 기본 100 ~ 100,000명)을 인메모리 저장소에 채우고 아래 호출의 초당 처리량과 호출당 지연을 잽니다.
+- check_mutual_match: 대기 인원에서 뽑은 두 요청 + 각자의 완화 단계
+- find_matching_users: 대기 요청 하나 기준, 실제 매칭 경로처럼 MAX_GROUP_SIZE - 1명에서 탐색 중단
+- get_match_status: 대기 중인 요청의 상태 조회
+- join_match: 새 요청 참여 (매칭되면 그룹/점심방 생성, 아니면 대기열 추가)
+
+분포: --skew (0 = 균등, 1 = 점심 피크 메뉴/가격대/시간대 쏠림), --prefs 선호 조건별 확률
+기준값: benchmarks/baselines/matching_suite.json
+- 처리량(ops/sec)을 같은 회차 앞뒤에 잰 보정 루프(순수 Python) 처리량으로 나눈 점수(score)로 비교해서
+  머신/CPU 속도 차이를 줄입니다.
+- 기준보다 점수가 --threshold(기본 40%, 공유 머신의 회차 간 편차보다 크게) 넘게 떨어진 항목이 있으면 종료 코드 1
+- --update-baseline 으로 현재 측정값을 기준으로 저장 (설정이 같을 때만 비교)
+
+실행: python -m benchmarks.matching_suite [--sizes 100,1000] [--skew 1.0] [--prefs sameGender=0.3,sameLevel=0.1]
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Callable, Dict, List
+
+from app.core.config import MAX_GROUP_SIZE
+from app.repositories import data_store, WaitingRequest
+from app.services import MatchService
+from benchmarks.population import PREFERENCES, make_population, make_request
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baselines", "matching_suite.json")
+DEFAULT_SIZES = [100, 1_000, 10_000, 100_000]
+DEFAULT_PREFS = {"sameGender": 0.3, "similarAge": 0.3, "sameLevel": 0.3}
+CALLS = {"check_mutual_match": 20_000, "find_matching_users": 1_000, "get_match_status": 5_000, "join_match": 300}
+
+
+def calibration_ops(seconds: float = 0.05) -> float:
+    """머신 속도 기준: dict 조회/비교/리스트 추가로 된 고정 루프의 초당 반복 수"""
+    record = {"gender": "male", "age": 30, "level": "staff", "preferences": {"sameGender": True}}
+    count, out = 0, []
+    start = time.perf_counter()
+    deadline = start + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(1000):
+            if record.get("preferences", {}).get("sameGender") and record["gender"] == "male":
+                out.append(record["age"] + 1)
+        out.clear()
+        count += 1000
+    return count / (time.perf_counter() - start)
+
+
+def measure(calls: List[Callable[[], object]], repeat: int, setup: Callable[[], None] = None) -> dict:
+    """
+    호출 목록을 repeat번 실행해서 처리량 + 호출당 지연(µs)
+    회차마다 바로 앞뒤에 보정 루프를 돌려서 그 회차의 머신 속도로 나눈 점수(score)를 구하고,
+    점수가 가장 높은 회차를 사용합니다 (실행 중 CPU 속도가 바뀌어도 비교 가능하도록).
+    """
+    best = None
+    for _ in range(repeat):
+        if setup:
+            setup()
+        calibration = calibration_ops()
+        samples = []
+        for call in calls:
+            start = time.perf_counter()
+            call()
+            samples.append(time.perf_counter() - start)
+        calibration = (calibration + calibration_ops()) / 2
+        score = len(samples) / sum(samples) / calibration * 1000
+        if best is None or score > best[0]:
+            best = (score, samples)
+    score, samples = best
+    ordered = sorted(samples)
+    return {
+        "opsPerSec": round(len(samples) / sum(samples), 1),
+        "score": round(score, 2),
+        "p50us": round(statistics.median(ordered) * 1e6, 2),
+        "p99us": round(ordered[int(len(ordered) * 0.99) - 1] * 1e6, 2),
+    }
+
+
+def reset_waiting():
+    for request in data_store.get_all_waiting_users():
+        data_store.remove_waiting_user(request.id)
+
+
+def populate(size: int, args) -> List[WaitingRequest]:
+    reset_waiting()
+    population = make_population(size, seed=args.seed, skew=args.skew, pref_rates=args.prefs)
+    for request in population:
+        data_store.add_waiting_user(request)
+    return population
+
+
+def join_call(record: WaitingRequest) -> Callable[[], dict]:
+    request = record.to_dict()
+    return lambda: MatchService.join_match(
+        user_id=request["userId"], name=request["name"], department=request["department"],
+        gender=request["gender"], age=request["age"], level=request["level"],
+        time_slot=request["timeSlot"], price_range=request["priceRange"], menu=request["menu"],
+        preferences=request["preferences"],
+    )
+
+
+def run_suite(args) -> Dict[str, dict]:
+    results = {}
+    rng = random.Random(args.seed)
+    scale = args.scale
+
+    population = populate(max(args.sizes[0], 2), args)
+    pairs = [(rng.choice(population), rng.choice(population)) for _ in range(int(CALLS["check_mutual_match"] * scale))]
+    results["check_mutual_match"] = measure(
+        [lambda a=a, b=b: MatchService.check_mutual_match(a, b, a.relaxation_level, b.relaxation_level)
+         for a, b in pairs],
+        args.repeat,
+    )
+
+    for size in args.sizes:
+        population = populate(size, args)
+        requesters = [rng.choice(population) for _ in range(int(CALLS["find_matching_users"] * scale))]
+        results[f"find_matching_users/n={size}"] = measure(
+            [lambda r=r: MatchService.find_matching_users(r, r.relaxation_level, limit=MAX_GROUP_SIZE - 1)
+             for r in requesters],
+            args.repeat,
+        )
+        status_ids = [rng.choice(population).id for _ in range(int(CALLS["get_match_status"] * scale))]
+        results[f"get_match_status/n={size}"] = measure(
+            [lambda i=i: MatchService.get_match_status(i) for i in status_ids], args.repeat,
+        )
+        join_rng = random.Random(args.seed + size)
+        joins = [
+            make_request(join_rng, skew=args.skew, pref_rates=args.prefs)
+            for _ in range(int(CALLS["join_match"] * scale))
+        ]
+        # 참여할 때마다 대기열이 바뀌므로 회차마다 같은 대기 인원으로 다시 채움
+        results[f"join_match/n={size}"] = measure(
+            [join_call(request) for request in joins], args.repeat,
+            setup=lambda: populate(size, args),
+        )
+    reset_waiting()
+    return results
+
+
+def compare(results: Dict[str, dict], baseline: dict, threshold: float) -> List[str]:
+    """기준 대비 변화 출력 + 회귀 항목 목록"""
+    regressions = []
+    print(f"\n{'benchmark':<34}{'ops/s':>12}{'p50 µs':>10}{'p99 µs':>10}{'score':>10}{'baseline':>10}{'change':>9}")
+    for name, result in results.items():
+        line = (f"{name:<34}{result['opsPerSec']:>12,.0f}{result['p50us']:>10.2f}{result['p99us']:>10.2f}"
+                f"{result['score']:>10.2f}")
+        before = baseline["results"].get(name) if baseline else None
+        if before:
+            change = result["score"] / before["score"] - 1
+            line += f"{before['score']:>10.2f}{change:>+9.0%}"
+            if change < -threshold:
+                regressions.append(name)
+                line += "  REGRESSION"
+        print(line)
+    return regressions
+
+
+def parse_prefs(text: str) -> Dict[str, float]:
+    prefs = dict(DEFAULT_PREFS)
+    for item in filter(None, text.split(",")):
+        name, _, rate = item.partition("=")
+        if name not in PREFERENCES:
+            raise argparse.ArgumentTypeError(f"unknown preference: {name} ({', '.join(PREFERENCES)})")
+        prefs[name] = float(rate)
+    return prefs
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="matching engine micro-benchmarks")
+    parser.add_argument("--sizes", type=lambda s: [int(x) for x in s.split(",")], default=DEFAULT_SIZES,
+                        help="대기 인원 크기 목록 (쉼표 구분)")
+    parser.add_argument("--skew", type=float, default=1.0, help="0 = 균등, 1 = 점심 피크 쏠림")
+    parser.add_argument("--prefs", type=parse_prefs, default=dict(DEFAULT_PREFS),
+                        help="선호 조건별 확률, 예: sameGender=0.3,similarAge=0.3,sameLevel=0.3")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--repeat", type=int, default=5, help="항목별 반복 횟수 (점수가 가장 높은 회차 사용)")
+    parser.add_argument("--scale", type=float, default=1.0, help="항목별 호출 수 배율 (빠르게 보려면 0.2)")
+    parser.add_argument("--threshold", type=float, default=0.4, help="점수가 이 비율보다 떨어지면 실패")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true", help="현재 측정값을 기준으로 저장")
+    parser.add_argument("--out", default=None, help="측정 결과 JSON 저장 경로")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    config = {"sizes": args.sizes, "skew": args.skew, "prefs": args.prefs, "seed": args.seed, "scale": args.scale}
+    results = run_suite(args)
+    report = {"config": config, "results": results}
+
+    baseline = None
+    if os.path.exists(args.baseline) and not args.update_baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if baseline.get("config") != config:
+            print(f"baseline config differs ({baseline.get('config')}), not comparing")
+            baseline = None
+    regressions = compare(results, baseline, args.threshold)
+
+    for path in filter(None, [args.out, args.baseline if args.update_baseline else None]):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"saved {path}")
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
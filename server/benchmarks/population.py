@@ -0,0 +1,68 @@
+"""
+벤치마크용 합성 대기 인원 생성기
+"""
+import random
+import itertools
+import time
+from typing import Optional, List, Dict
+
+from app.core.config import RELAXATION_INTERVAL_SECONDS, MAX_RELAXATION_LEVEL
+from app.repositories import WaitingRequest
+
+MENUS = ["korean", "japanese", "chinese", "western", "salad", "snack"]
+PRICE_RANGES = ["low", "mid", "high"]
+TIME_SLOTS = ["11:30", "12:00", "12:30", "13:00"]
+LEVELS = ["intern", "staff", "assistant", "manager", "deputy", "general", "director"]
+GENDERS = ["male", "female"]
+PREFERENCES = ["sameGender", "similarAge", "sameLevel"]
+
+# 점심 피크 분포 (한식/저가/11:30 쏠림)
+PEAK_WEIGHTS = {
+    "menu": [0.4, 0.15, 0.15, 0.1, 0.1, 0.1],
+    "priceRange": [0.5, 0.35, 0.15],
+    "timeSlot": [0.45, 0.35, 0.15, 0.05],
+}
+
+_ids = itertools.count()
+
+
+def make_request(rng: random.Random, *, skew: float = 1.0, pref_rate: float = 0.5,
+                 pref_rates: Optional[Dict[str, float]] = None,
+                 bucket: Optional[tuple] = None, max_wait_seconds: int = 300) -> WaitingRequest:
+    """
+    대기 요청 1건 생성 (API 형식 dict가 필요하면 to_dict())
+    - skew: 0이면 균등 분포, 1이면 PEAK_WEIGHTS 분포
+    - pref_rate: 각 선호 조건(sameGender/similarAge/sameLevel)을 켤 확률
+    - pref_rates: 조건별 확률 (예: {"sameGender": 0.2}, 없는 조건은 pref_rate)
+    - bucket: (timeSlot, priceRange, menu) 고정
+    """
+    rates = {name: pref_rate for name in PREFERENCES}
+    rates.update(pref_rates or {})
+
+    def pick(values, key):
+        weights = [(1 - skew) / len(values) + skew * w for w in PEAK_WEIGHTS[key]]
+        return rng.choices(values, weights)[0]
+
+    if bucket:
+        time_slot, price_range, menu = bucket
+    else:
+        time_slot, price_range, menu = pick(TIME_SLOTS, "timeSlot"), pick(PRICE_RANGES, "priceRange"), pick(MENUS, "menu")
+
+    # 완화 단계 경계에서 멀리 떨어진 대기 시간 (측정 중 단계가 바뀌지 않도록)
+    waited = rng.randrange(0, max_wait_seconds, RELAXATION_INTERVAL_SECONDS) + RELAXATION_INTERVAL_SECONDS // 2
+
+    request_id = f"req-{next(_ids)}"
+    gender, age, level = rng.choice(GENDERS), rng.randint(23, 55), rng.choice(LEVELS)
+    preferences = {name: rng.random() < rates[name] for name in PREFERENCES}
+    return WaitingRequest.create(
+        request_id, f"user-{request_id}", "벤치", "벤치마크", gender, age, level,
+        time_slot, price_range, menu, preferences,
+        joined_at=time.time() - waited,
+        relaxation_level=min(waited // RELAXATION_INTERVAL_SECONDS, MAX_RELAXATION_LEVEL),
+    )
+
+
+def make_population(size: int, seed: int = 42, **kwargs) -> List[WaitingRequest]:
+    """대기 요청 size건 생성"""
+    rng = random.Random(seed)
+    return [make_request(rng, **kwargs) for _ in range(size)]
@@ -0,0 +1,116 @@
+"""
+동시성 스트레스 체크
+64개 클라이언트가 동시에 매칭 참여/상태 조회/취소와 점심방 참여를 반복하는 동안
+스케줄러도 함께 돌려서 아래를 확인합니다.
+- 한 매칭 요청이 두 그룹에 들어가지 않음 (이중 매칭 없음)
+- 그룹에 들어간 요청은 대기열에 남아 있지 않음
+- 점심방 인원이 maxCount를 넘지 않음
+- 매칭 대기 중인 사용자가 점심방에 들어가려 할 때, 스케줄러가 그 사이에 그룹을 만들어도
+  점심방과 매칭 그룹에 동시에 들어가지 않음
+
+실행: python -m benchmarks.stress_match_concurrency
+"""
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import HTTPException
+
+from app.repositories import data_store
+from app.services import MatchService, RoomService, MatchScheduler
+
+CLIENTS = 64
+ROUNDS = 30
+BUCKETS = [("11:30", "low", "korean"), ("12:00", "mid", "japanese")]
+ROOMS = 20
+room_and_group = []  # 점심방 참여에 성공했는데 매칭 그룹에도 들어가 있던 사용자
+
+
+def client(index: int, rooms: list):
+    rng = random.Random(index)
+    for round_no in range(ROUNDS):
+        time_slot, price_range, menu = rng.choice(BUCKETS)
+        # 매 라운드 새 익명 사용자로 참여 (같은 사람이 이미 매칭된 그룹에 막히지 않도록)
+        user_id = f"stress-{index}-{round_no}"
+        result = MatchService.join_match(
+            user_id=user_id, name="스트레스", department="테스트",
+            gender=rng.choice(["male", "female"]), age=rng.randint(25, 45), level="staff",
+            time_slot=time_slot, price_range=price_range, menu=menu,
+            preferences={"sameGender": rng.random() < 0.5},
+        )
+        if result["status"] == "waiting":
+            for _ in range(rng.randint(0, 3)):
+                MatchService.get_match_status(result["matchRequestId"])
+            if rng.random() < 0.2:
+                MatchService.cancel_match(result["matchRequestId"])
+
+        # 같은 사용자로 점심방 참여 (대기/매칭 중이면 거절되어야 함, 들어갔으면 자리를 비워둠)
+        room = rng.choice(rooms)
+        try:
+            RoomService.join_room(room["id"], user_id, "참여자", "테스트")
+        except HTTPException:
+            continue
+        if data_store.get_user_active_group(user_id):
+            room_and_group.append(user_id)
+        RoomService.leave_room(room["id"], user_id)
+
+
+def main():
+    # 스레드 전환을 자주 일으켜 경합 확률을 높임
+    sys.setswitchinterval(1e-4)
+
+    rooms = [
+        RoomService.create_room(
+            title=f"스트레스 방 {i}", time_slot="12:00", menu="korean", price_range="mid",
+            max_count=4, creator_id=f"creator-{i}", creator_name="방장", creator_department="테스트",
+        )
+        for i in range(ROOMS)
+    ]
+
+    scheduler = MatchScheduler(batch=True)
+    stop = threading.Event()
+
+    def run_scheduler():
+        while not stop.is_set():
+            # 모든 대기 요청을 다시 매칭 대상으로 올림
+            for request in data_store.get_all_waiting_users():
+                scheduler._pending[request.id] = None
+            scheduler.run_pass()
+            time.sleep(0.001)
+
+    scheduler_thread = threading.Thread(target=run_scheduler)
+    scheduler_thread.start()
+
+    start = time.perf_counter()
+    try:
+        with ThreadPoolExecutor(max_workers=CLIENTS) as pool:
+            for future in [pool.submit(client, i, rooms) for i in range(CLIENTS)]:
+                future.result()
+    finally:
+        stop.set()
+        scheduler_thread.join()
+    elapsed = time.perf_counter() - start
+
+    groups = data_store.get_all_groups()
+    member_counts = Counter(m["id"] for g in groups for m in g["members"])
+    double_matched = [rid for rid, count in member_counts.items() if count > 1]
+    still_waiting = [rid for rid in member_counts if data_store.get_waiting_user_by_id(rid)]
+    overfilled = [
+        r["id"] for r in data_store.get_all_rooms()
+        if len(r["members"]) > r["maxCount"]
+    ]
+
+    print(f"clients={CLIENTS} rounds={ROUNDS} elapsed={elapsed:.2f}s "
+          f"groups={len(groups)} matched={len(member_counts)}")
+    print(f"double-matched={len(double_matched)} grouped-but-waiting={len(still_waiting)} "
+          f"overfilled-rooms={len(overfilled)} room-and-group={len(room_and_group)}")
+    if double_matched or still_waiting or overfilled or room_and_group:
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,16 +7,32 @@
 ├── app/
 │   ├── core/              # 설정 및 유틸리티
 │   │   ├── config.py      # 앱 설정
+│   │   ├── conditional.py # ETag / If-None-Match 조건부 GET
+│   │   ├── http_client.py # 외부 API 공용 HTTP 클라이언트 (연결 풀)
+│   │   ├── locks.py       # 버킷/점심방/유저 단위 잠금
+│   │   ├── metrics.py     # 운영 지표 (Prometheus 텍스트 형식) + 요청 지연 미들웨어
+│   │   ├── pagination.py  # 목록 API 커서 페이지네이션 + 필드 선택
+│   │   ├── profiler.py    # 느린 요청 샘플링 프로파일러 (PROFILER_ENABLED)
+│   │   ├── read_views.py  # 직렬화해 둔 GET 응답 (버전이 같으면 bytes 그대로)
+│   │   ├── signed_tokens.py # HMAC 서명 세션 토큰 (SESSION_TOKEN_MODE=signed)
 │   │   └── utils.py       # 공통 유틸리티 함수
 │   ├── schemas/           # Pydantic 모델 (Request/Response)
 │   │   ├── auth.py        # 인증 스키마
 │   │   ├── match.py       # 매칭 스키마
 │   │   └── room.py        # 점심방 스키마
 │   ├── repositories/      # 데이터 접근 계층
-│   │   └── data_store.py  # 인메모리 데이터 저장소
+│   │   ├── data_store.py  # 인메모리 데이터 저장소
+│   │   ├── waiting_request.py # 매칭 대기 요청 레코드 (__slots__ + 코드/비트마스크)
+│   │   ├── versions.py    # 컬렉션/유저별 버전 카운터 (ETag)
+│   │   └── sqlite_store.py  # SQLite(WAL) 저장소 (DATA_STORE_BACKEND=sqlite)
 │   ├── services/          # 비즈니스 로직
-│   │   ├── auth_service.py
+│   │   ├── auth_service.py     # 인증 + 세션 정리 작업
 │   │   ├── match_service.py
+│   │   ├── match_scheduler.py  # 백그라운드 매칭 루프
+│   │   ├── batch_matcher.py    # 버킷 단위 배치 매칭 (NumPy)
+│   │   ├── place_catalog.py    # 로컬 음식점 카탈로그 + 격자 공간 인덱스
+│   │   ├── place_crawler.py    # 카카오 FD6 크롤링 + 주기적 갱신
+│   │   ├── restaurant_catalog.py # 식당 카탈로그 ((종류, 가격대) 인덱스 + 가중 추천)
 │   │   └── room_service.py
 │   └── routers/           # API 엔드포인트 (Controllers)
 │       ├── auth.py        # 인증 API
@@ -24,8 +40,10 @@
 │       ├── rooms.py       # 점심방 API
 │       ├── users.py       # 유저 API
 │       ├── restaurants.py # 식당 API
-│       └── stats.py       # 통계 API
+│       ├── stats.py       # 통계 API
+│       └── metrics.py     # 운영 지표 API (/metrics)
 """
+from contextlib import asynccontextmanager
 from datetime import datetime
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -38,7 +56,38 @@ from app.routers import (
     users_router,
     restaurants_router,
     stats_router,
+    metrics_router,
 )
+from app.services import MatchService, match_scheduler, session_sweeper
+from app.core.config import METRICS_ENABLED, PROFILER_ENABLED, WEB_CONCURRENCY
+from app.core.http_client import http_client
+from app.core.metrics import MetricsMiddleware
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.profiler import ProfilerMiddleware, request_profiler
+from app.services.place_crawler import place_catalog_refresher
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 시작/종료 시 백그라운드 작업 관리"""
+    # 매칭 대기열/타이머가 프로세스 메모리에 있으므로 워커는 1개만 (다른 워커로 간 상태 조회는 not_found)
+    if WEB_CONCURRENCY > 1:
+        raise RuntimeError(f"WEB_CONCURRENCY={WEB_CONCURRENCY}: 매칭 상태가 프로세스 메모리에 있어 워커 1개로만 실행할 수 있습니다")
+    # 영속 저장소(sqlite)에서 복원된 대기 요청의 완화 타이머 재등록
+    MatchService.restore_waiting_timers()
+    match_scheduler.start()
+    http_client.start()
+    place_catalog_refresher.start()
+    session_sweeper.start()
+    if PROFILER_ENABLED:
+        request_profiler.start()
+    yield
+    request_profiler.stop()
+    await session_sweeper.stop()
+    await place_catalog_refresher.stop()
+    await match_scheduler.stop()
+    await http_client.close()
+
 
 # FastAPI 앱 생성
 app = FastAPI(
@@ -47,6 +96,7 @@ app = FastAPI(
     version="2.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # CORS 설정
@@ -56,8 +106,17 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag"],  # 목록 API 다음 페이지 커서, 조건부 GET
 )
 
+# 느린 요청/샘플 요청 스택 프로파일 (기본 꺼짐)
+if PROFILER_ENABLED:
+    app.add_middleware(ProfilerMiddleware)
+
+# 요청 지연/진행 중 요청 수 기록 (CORS 바깥에서 전체 처리 시간 측정)
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 # 라우터 등록
 app.include_router(auth_router)
 app.include_router(match_router)
@@ -65,6 +124,8 @@ app.include_router(rooms_router)
 app.include_router(users_router)
 app.include_router(restaurants_router)
 app.include_router(stats_router)
+if METRICS_ENABLED:
+    app.include_router(metrics_router)
 
 
 # 헬스체크 엔드포인트